@@ -0,0 +1,315 @@
+# benchmarks/bench_scaffold.py
+"""Times the scaffolder's hot paths and compares a run against a baseline.
+
+    python benchmarks/bench_scaffold.py --output results.json
+    python benchmarks/bench_scaffold.py --baseline results.json
+
+Venv creation, pip, git and pre-commit are stubbed out, so every number here
+is the scaffolder's own work and the suite runs offline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import pathlib
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import cli_startup
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+ARTIFACTS_DIR = os.path.join(SRC_DIR, "artifacts")
+RESULTS_VERSION = 1
+FILES_PER_DIR = 100
+TEMPLATE_EVERY = 20  # One synthetic .j2 per this many files
+SIZES = {"small": 0, "1k": 1000, "5k": 5000}
+CONTEXT = {
+    "SECRET_KEY": "bench-secret",
+    "DATABASE_URI": "sqlite:///bench.db",
+    "FLASK_APP": "run.py",
+    "SMTP_SERVER": "smtp.example.com",
+    "SMTP_PORT": 587,
+    "SMTP_EMAIL": "bench@example.com",
+    "SMTP_PASSWORD": "",
+    "FLASK_CONFIG": "dev",
+    "API_TITLE": "Bench API",
+    "API_VERSION": 1.0,
+    "API_DESCRIPTION": "",
+}
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)  # Run from a checkout without installing
+
+
+def quiet_logger() -> logging.Logger:
+    logger = logging.getLogger("flask_scaffolder.bench")
+    logger.handlers[:] = [logging.NullHandler()]
+    logger.propagate = False
+    return logger
+
+
+def build_tree(root: str, size: str) -> str:
+    """Copies the real artifacts into `root` and pads app/ with synthetic files."""
+    tree = os.path.join(root, f"artifacts-{size}")
+    shutil.copytree(ARTIFACTS_DIR, tree, ignore=shutil.ignore_patterns("__pycache__"))
+    for i in range(SIZES[size]):
+        package = os.path.join(tree, "app", "generated", f"pkg_{i // FILES_PER_DIR}")
+        os.makedirs(package, exist_ok=True)
+        if i % TEMPLATE_EVERY == 0:
+            name, body = f"settings_{i}.py.j2", SYNTHETIC_TEMPLATE
+        else:
+            name, body = f"module_{i}.py", SYNTHETIC_MODULE.format(i=i)
+        with open(os.path.join(package, name), "w") as f:
+            f.write(body)
+    return tree
+
+
+SYNTHETIC_MODULE = """# app/generated/module_{i}.py
+from flask import Blueprint
+
+bp = Blueprint("module_{i}", __name__)
+
+
+@bp.route("/module-{i}")
+def index():
+    return {{"module": {i}, "items": list(range(10))}}
+"""
+
+SYNTHETIC_TEMPLATE = """# Generated settings
+SECRET_KEY = "{{ SECRET_KEY }}"
+DATABASE_URI = "{{ DATABASE_URI }}"
+{% for i in range(20) %}OPTION_{{ i }} = {{ i * SMTP_PORT }}
+{% endfor %}API_TITLE = "{{ API_TITLE | default('API', true) }}"
+"""
+
+
+def templates_in(tree: str) -> list[str]:
+    found = []
+    for root, _, names in os.walk(tree):
+        rel_root = os.path.relpath(root, tree)
+        for name in names:
+            if name.endswith(".j2"):
+                found.append(os.path.normpath(os.path.join(rel_root, name)))
+    return sorted(found)
+
+
+def plain_files_in(tree: str) -> list[str]:
+    found = []
+    for root, _, names in os.walk(tree):
+        rel_root = os.path.relpath(root, tree)
+        for name in names:
+            if not name.endswith(".j2"):
+                found.append(os.path.normpath(os.path.join(rel_root, name)))
+    return sorted(found)
+
+
+def stub_setup_steps(core):
+    core._create_virtualenv = lambda *args, **kwargs: True
+    core._install_requirements = lambda *args, **kwargs: None
+    core._git_init = lambda *args, **kwargs: None
+    core._install_pre_commit = lambda *args, **kwargs: None
+
+
+def time_samples(setup, func, repeat: int) -> list[float]:
+    """Runs `setup()` untimed, then times `func(state)`, `repeat` times."""
+    samples = []
+    for _ in range(repeat):
+        state = setup()
+        started = time.perf_counter()
+        func(state)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: list[float], unit: str = "s", **extra) -> dict:
+    return {
+        "unit": unit,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+        **extra,
+    }
+
+
+def bench_tree(core, bundle_mod, tree: str, scratch: str, repeat: int) -> dict:
+    logger = quiet_logger()
+    templates = templates_in(tree)
+    plain_files = plain_files_in(tree)
+    counter = iter(range(10**9))
+
+    def fresh_dir() -> str:
+        path = os.path.join(scratch, f"run-{next(counter)}")
+        os.makedirs(path)
+        return path
+
+    def fresh_dir_with_subdirs() -> str:
+        path = fresh_dir()
+        for rel_dir in {os.path.dirname(p) for p in plain_files}:
+            os.makedirs(os.path.join(path, rel_dir), exist_ok=True)
+        return path
+
+    def render_all(out: str):
+        for template in templates:
+            output_path = os.path.join(out, template[: -len(".j2")])
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            core.render_jinja_template(tree, template, output_path, CONTEXT, logger)
+
+    def copy_all(out: str):
+        for rel_path in plain_files:
+            core.copy_file(tree, rel_path, out, logger)
+
+    def scaffold(out: str, **kwargs):
+        with contextlib.redirect_stderr(io.StringIO()):
+            core.scaffold_project(os.path.join(out, "project"), CONTEXT, **kwargs)
+
+    bundle_path = os.path.join(scratch, "artifacts.bundle")
+    bundle_mod.pack_artifacts(tree, bundle_path)
+    bundle = bundle_mod.ArtifactBundle(pathlib.Path(bundle_path))
+
+    results = {
+        "render_jinja_template": time_samples(fresh_dir, render_all, repeat),
+        "copy_file": time_samples(fresh_dir_with_subdirs, copy_all, repeat),
+        "copy_directory": time_samples(
+            fresh_dir,
+            lambda out: core.copy_directory(os.path.join(tree, "app"), out, logger),
+            repeat,
+        ),
+        "scaffold_project": time_samples(
+            fresh_dir, lambda out: scaffold(out, artifacts_dir=tree), repeat
+        ),
+        "scaffold_project_bundle": time_samples(
+            fresh_dir, lambda out: scaffold(out, bundle=bundle), repeat
+        ),
+    }
+    files = len(plain_files) + len(templates)
+    return {name: summarize(samples, files=files) for name, samples in results.items()}
+
+
+def bench_startup(repeat: int, budget_ms: float) -> tuple[dict, list[str]]:
+    """Times the imports behind `flask-scaffolder --help`, minus interpreter start."""
+    samples, problems = [], []
+    for _ in range(repeat):
+        extra_ms, loaded = cli_startup.help_imports()
+        samples.append(extra_ms)
+        if loaded:
+            problems.append(f"--help imported {', '.join(loaded)}")
+    result = summarize(samples, unit="ms", budget=budget_ms)
+    if result["median"] > budget_ms:
+        problems.append(
+            f"--help imports took {result['median']:.1f}ms (budget {budget_ms:.1f}ms)"
+        )
+    return result, sorted(set(problems))
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Prints median deltas and returns the benchmarks that regressed."""
+    regressions = []
+    print(f"\n{'benchmark':<42} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<42} {'-':>12} {result['median']:>12.6f} {'new':>8}")
+            continue
+        change = result["median"] / base["median"] - 1 if base["median"] else 0.0
+        flag = " ⚠️" if change > threshold else ""
+        print(
+            f"{name:<42} {base['median']:>12.6f} {result['median']:>12.6f} "
+            f"{change:>+7.1%}{flag}"
+        )
+        if change > threshold:
+            regressions.append(f"{name} is {change:+.1%} slower than baseline")
+    return regressions
+
+
+def run(args: argparse.Namespace) -> int:
+    scratch = tempfile.mkdtemp(prefix="scaffold-bench-")
+    os.environ["FLASK_SCAFFOLDER_CACHE_DIR"] = os.path.join(scratch, "cache")
+    try:
+        startup, problems = bench_startup(args.repeat, args.import_budget_ms)
+        results = {"startup_help_imports": startup}
+
+        from flask_scaffolder import bundle as bundle_mod
+        from flask_scaffolder import core
+
+        stub_setup_steps(core)
+        for size in args.sizes:
+            tree = build_tree(scratch, size)
+            work = tempfile.mkdtemp(prefix=f"{size}-", dir=scratch)
+            for name, result in bench_tree(
+                core, bundle_mod, tree, work, args.repeat
+            ).items():
+                results[f"{name}[{size}]"] = result
+                print(
+                    f"⏱️ {name}[{size}]: median {result['median']:.6f}s "
+                    f"over {result['files']} files"
+                )
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print(f"⏱️ startup_help_imports: median {startup['median']:.2f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"✅ Wrote results: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems += compare(report, json.load(f), args.threshold)
+
+    for problem in problems:
+        print(f"❌ {problem}")
+    return 1 if problems else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Flask scaffolder")
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare against a previous results file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Median slowdown vs. baseline that counts as a regression (0.10=10%%).",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: value.split(","),
+        default=list(SIZES),
+        help=f"Comma-separated artifact tree sizes (default: {','.join(SIZES)}).",
+    )
+    parser.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=50.0,
+        help="Maximum median import time for `flask-scaffolder --help`.",
+    )
+    args = parser.parse_args()
+    unknown = [size for size in args.sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes {unknown}; choose from {list(SIZES)}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/cli_startup.py
+"""Measures what `flask-scaffolder --help` imports.
+
+Shared by bench_scaffold.py and tests/test_cli_startup.py, so the budget
+check and the list of modules that must stay lazy cannot drift apart.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+# Modules the CLI must not load before it knows it has work to do
+LAZY_MODULES = ("jinja2", "flask_scaffolder.core")
+
+
+def import_times(*args: str) -> tuple[dict[str, int], set[str]]:
+    """Returns each top-level import's cumulative -X importtime (µs), plus the
+    names of every module imported at any depth.
+    """
+    pythonpath = [SRC_DIR, os.environ.get("PYTHONPATH", "")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, pythonpath)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times, names = {}, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        names.add(name.strip())
+        if not name.startswith("  "):  # Nested imports are already included
+            times[name.strip()] = int(cumulative)
+    return times, names
+
+
+def help_imports() -> tuple[float, list[str]]:
+    """Import time (ms) `--help` adds over a bare interpreter, and any
+    LAZY_MODULES it loaded.
+    """
+    interpreter, _ = import_times("-c", "pass")
+    cli, names = import_times("-m", "flask_scaffolder.cli", "--help")
+    extra_ms = sum(us for name, us in cli.items() if name not in interpreter) / 1000
+    return extra_ms, sorted(name for name in names if name.startswith(LAZY_MODULES))
@@ -1,5 +1,31 @@
 # my_project/setup.py
+import importlib.util
+import os
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class BuildPyWithBundle(build_py):
+    """Packs src/artifacts into flask_scaffolder/artifacts.bundle on build."""
+
+    def run(self):
+        super().run()
+        # editable_mode only exists on setuptools>=64 (PEP 660 builds)
+        if getattr(self, "editable_mode", False):
+            return  # Editable installs keep reading the loose artifacts folder
+        spec = importlib.util.spec_from_file_location(
+            "_scaffolder_bundle", os.path.join(HERE, "src/flask_scaffolder/bundle.py")
+        )
+        bundle = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(bundle)
+        bundle.pack_artifacts(
+            os.path.join(HERE, "src", "artifacts"),
+            os.path.join(self.build_lib, "flask_scaffolder", bundle.BUNDLE_NAME),
+        )
+
 
 setup(
     name="flask-scaffolder",
@@ -10,9 +36,14 @@ setup(
     package_dir={"": "src"},  # Look for packages in src/
     packages=["flask_scaffolder"],  # Explicitly specify the package
     include_package_data=True,
+    python_requires=">=3.10",
+    cmdclass={"build_py": BuildPyWithBundle},
     install_requires=[
         "Jinja2",
     ],
+    extras_require={
+        "batch": ["PyYAML"],
+    },
     entry_points={
         "console_scripts": [
             "flask-scaffolder = flask_scaffolder.cli:main",
@@ -2,9 +2,17 @@
 
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from app.schemas import init_api
+from app.api import init_api
+from app.commands import register_commands
 from app.models import bind_app
 from app.config import config_by_name
+from app.utils.aio import init_async
+from app.utils.auth_utils import init_jwt
+from app.utils.credential_cache import init_credential_cache
+from app.utils.identity_cache import init_identity_cache
+from app.utils.metrics import init_metrics
+from app.utils.profiler import init_profiler
+from app.utils.response_cache import init_response_cache
 
 db = SQLAlchemy()
 
@@ -14,6 +22,14 @@ def create_app(config_name="dev"):
     app.config.from_object(config_by_name[config_name])
 
     bind_app(app)
-    init_api(app)
+    init_async(app)
+    init_credential_cache(app)
+    init_identity_cache(app)
+    init_response_cache(app)
+    init_jwt(app)
+    api = init_api(app)
+    init_metrics(app, api)
+    init_profiler(app)
+    register_commands(app)
 
     return app
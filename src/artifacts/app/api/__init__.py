@@ -16,6 +16,11 @@ def init_api(app: Flask) -> Api:
         ],  # auth schemes (JWT, basic, etc.)
     )
 
-    register_routes(api)  #  Auto-register routes from app/api/routes
+    #  Auto-register routes from app/routes (lazily, from the route manifest)
+    app.extensions["route_report"] = register_routes(
+        api,
+        lazy=app.config.get("ROUTES_LAZY", True),
+        strict=app.config.get("ROUTES_STRICT", False),
+    )
 
     return api
@@ -1,9 +1,135 @@
 # app/api/base_schema.py
 
-from flask_restx import fields, Model, Namespace, Api, reqparse
+import functools
+import inspect
+import json
+import weakref
+from flask import Response, current_app, request
+from flask_restx import fields, marshal, marshal_with, Model, Namespace, Api, reqparse
+from flask_restx.inputs import boolean
+from flask_restx.utils import unpack
 from werkzeug.datastructures import FileStorage
+from app.utils.aio import handler_wrapper
+from app.utils.response_cache import cached
 from http import HTTPStatus
 
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder is used instead
+    orjson = None
+
+# RESTX field types -> native Python types (for query parsers); first match wins
+_TYPE_MAP = (
+    (fields.String, str),
+    (fields.Integer, int),
+    (fields.Boolean, bool),
+    (fields.Float, float),
+    (fields.DateTime, str),
+    (fields.Raw, str),
+    (fields.Url, str),
+)
+
+
+@functools.cache
+def _python_type(field_cls: type) -> type:
+    for field_type, py_type in _TYPE_MAP:
+        if issubclass(field_cls, field_type):
+            return py_type
+    return str  # Default fallback type
+
+
+# Field types the compiled serializer formats inline (exact types only; anything
+# else, e.g. Nested or DateTime, goes through the field's own output())
+_INLINE_FORMATS = {
+    fields.Raw: "{v}",
+    fields.String: "str({v})",
+    fields.Integer: "int({v})",
+    fields.Float: "float({v})",
+    fields.Boolean: "({v} if {v}.__class__ is bool else _boolean({v}))",
+}
+
+
+def _inline_default(field):
+    """The value restx outputs for a missing key, or raises ValueError when the
+    field can't be inlined."""
+    fmt = _INLINE_FORMATS.get(type(field))
+    if (
+        fmt is None
+        or field.attribute is not None
+        or field.mask
+        or callable(field.default)
+        or getattr(field, "discriminator", None)
+    ):
+        raise ValueError("not inlinable")
+    try:
+        return field.format(field.default) if field.default else field.default
+    except Exception as e:
+        raise ValueError("not inlinable") from e
+
+
+def _compile_serializer(name: str, declared: dict):
+    """Generates `serialize(data)`, a specialized equivalent of restx
+    `marshal(data, declared)`, or returns None if the fields need restx."""
+    if any(isinstance(field, fields.Wildcard) for field in declared.values()):
+        return None
+
+    namespace = {"_boolean": boolean}
+    dict_items, obj_items = [], []
+    for i, (key, field) in enumerate(declared.items()):
+        namespace[f"_f{i}"] = field
+        try:
+            namespace[f"_d{i}"] = _inline_default(field)
+        except ValueError:
+            generic = f"{key!r}: _f{i}.output({key!r}, o)"
+            dict_items.append(generic)
+            obj_items.append(generic)
+            continue
+        value = _INLINE_FORMATS[type(field)].format(v="v")
+        inline = f"{key!r}: (_d{i} if (v := {{}}) is None else {value})"
+        if hasattr(dict, key):
+            # restx falls back to getattr() for missing keys, so dict
+            # attribute names (items, keys, ...) stay on the generic path
+            dict_items.append(f"{key!r}: _f{i}.output({key!r}, o)")
+        else:
+            dict_items.append(inline.format(f"o.get({key!r})"))
+        obj_items.append(inline.format(f"getattr(o, {key!r}, None)"))
+
+    source = "\n".join(
+        [
+            "def _from_dict(o):",
+            f"    return {{{', '.join(dict_items)}}}",
+            "def _from_object(o):",
+            f"    return {{{', '.join(obj_items)}}}",
+        ]
+    )
+    exec(compile(source, f"<serializer {name}>", "exec"), namespace)
+    from_dict, from_object = namespace["_from_dict"], namespace["_from_object"]
+
+    def serialize_one(obj):
+        cls = obj.__class__
+        try:
+            if cls is dict:
+                return from_dict(obj)
+            if not hasattr(cls, "__iter__") and not hasattr(cls, "strip"):
+                return from_object(obj)
+        except Exception:
+            pass  # Let restx raise its own MarshallingError
+        return marshal(obj, declared)
+
+    def serialize(data):
+        if isinstance(data, (list, tuple)):
+            return [serialize_one(obj) for obj in data]
+        return serialize_one(data)
+
+    return serialize
+
+
+def dump_json(data) -> bytes:
+    """JSON bytes through orjson when installed, else the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data) + "\n").encode("utf-8")
+
 
 # Wrapper to mark file upload fields (used in query/form data)
 class FileField:
@@ -14,28 +140,50 @@ class FileField:
 
 
 class BaseSchemaAPIModel:
-    def __init__(self, api_or_namespace: Namespace | Api, **kwargs):
-        # Use __modelname__ if defined, else fallback to class name
-        self.__modelname__ = getattr(
-            self.__class__, "__modelname__", self.__class__.__name__
-        )
-        self._api_or_namespace = (
-            api_or_namespace  # Used for .model(), .expect(), .response(), etc.
-        )
+    """Declarative RESTX schema.
+
+    Fields are collected once per class (at class creation), the RESTX model
+    is registered once per class and namespace, and the query parser is built
+    once per class; every instance and decorator shortcut reuses them.
+    """
 
-        self.__fields__ = {}  # Normal RESTX model fields
-        self.__file_fields__ = {}  # Special handling for file uploads
+    _declared_fields: dict = {}
+    _declared_file_fields: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        declared, file_fields = {}, {}
 
         # Collect declared fields and check for tuple mistake
-        for name, value in self.__class__.__dict__.items():
+        for name, value in cls.__dict__.items():
             if isinstance(value, tuple):
                 raise TypeError(
                     f"Field '{name}' is a tuple. Did you accidentally add a comma?"
                 )
             if isinstance(value, fields.Raw):
-                self.__fields__[name] = value
+                declared[name] = value
             elif isinstance(value, FileField):
-                self.__file_fields__[name] = value
+                file_fields[name] = value
+
+        cls._declared_fields = declared
+        cls._declared_file_fields = file_fields
+        cls._models = weakref.WeakKeyDictionary()  # namespace -> registered Model
+        cls._queryparser = None
+        cls._serializer = None
+
+    def __init__(self, api_or_namespace: Namespace | Api, **kwargs):
+        # Use __modelname__ if defined, else fallback to class name
+        self.__modelname__ = getattr(
+            self.__class__, "__modelname__", self.__class__.__name__
+        )
+        self._api_or_namespace = (
+            api_or_namespace  # Used for .model(), .expect(), .response(), etc.
+        )
+
+        # Shared per class; treat as read-only
+        self.__fields__ = self._declared_fields  # Normal RESTX model fields
+        self.__file_fields__ = self._declared_file_fields  # File uploads
+        self._marshallers = {}
 
         if not self.__fields__ and not self.__file_fields__:
             raise ValueError(f"No fields defined in {self.__modelname__}.")
@@ -45,11 +193,25 @@ class BaseSchemaAPIModel:
             setattr(self, field_name, kwargs.get(field_name))
 
     def as_model(self) -> Model:
-        """Registers and returns the RESTX model using the collected fields."""
-        return self._api_or_namespace.model(self.__modelname__, self.__fields__)
+        """Registers the RESTX model on first use per namespace, then reuses it."""
+        models = self.__class__._models
+        model = models.get(self._api_or_namespace)
+        if model is None:
+            model = self._api_or_namespace.model(self.__modelname__, self.__fields__)
+            models[self._api_or_namespace] = model
+        return model
 
     def as_queryparser(self) -> reqparse.RequestParser:
-        """Creates a query/form parser based on the declared fields and file inputs."""
+        """Query/form parser for the declared fields, built once per class.
+
+        The parser is shared: copy() it before adding arguments.
+        """
+        cls = self.__class__
+        if cls._queryparser is None:
+            cls._queryparser = self._build_queryparser()
+        return cls._queryparser
+
+    def _build_queryparser(self) -> reqparse.RequestParser:
         parser = reqparse.RequestParser()
 
         # Add normal fields
@@ -79,12 +241,12 @@ class BaseSchemaAPIModel:
 
     # --- Decorator shortcuts for route methods ---
 
-    @property
+    @functools.cached_property
     def expect(self):
         """@namespace.expect(...) for body model"""
         return self._api_or_namespace.expect(self.as_model())
 
-    @property
+    @functools.cached_property
     def expect_query(self):
         """@namespace.expect(...) for query or file parser"""
         return self._api_or_namespace.expect(self.as_queryparser())
@@ -93,11 +255,80 @@ class BaseSchemaAPIModel:
         """@namespace.response(...) shortcut"""
         return self._api_or_namespace.response(code, message)
 
-    def marshal(self, code=HTTPStatus.OK, many=False):
-        """@namespace.marshal_with(...) shortcut using this model"""
-        return self._api_or_namespace.marshal_with(
-            self.as_model(), code=code, as_list=many
+    @classmethod
+    def serializer(cls):
+        """Compiled `marshal(data, fields)` for this schema, built once per class.
+
+        Plain String/Integer/Float/Boolean/Raw fields are read and formatted
+        inline, separately for dicts and ORM objects; other fields, other row
+        types and rows that fail to format go through restx unchanged.
+        """
+        if cls._serializer is None:
+            cls._serializer = _compile_serializer(
+                cls.__name__, cls._declared_fields
+            ) or functools.partial(marshal, fields=cls._declared_fields)
+        return cls._serializer
+
+    @classmethod
+    def dumps(cls, data) -> bytes:
+        """Serializes `data` (a row or a list of rows) straight to JSON bytes."""
+        return dump_json(cls.serializer()(data))
+
+    def marshal(self, code=HTTPStatus.OK, many=False, fast=False):
+        """@namespace.marshal_with(...) shortcut using this model.
+
+        With `fast` the response is rendered by the compiled serializer
+        instead of restx; Swagger docs are identical either way. Works on
+        sync and async handlers.
+        """
+        key = (code, many, fast)
+        if key not in self._marshallers:
+            self._marshallers[key] = self._marshaller(code, many, fast)
+        return self._marshallers[key]
+
+    def _marshaller(self, code, many, fast):
+        model = self.as_model()
+        restx_marshal = self._api_or_namespace.marshal_with(
+            model, code=code, as_list=many
+        )
+        # The same restx marshalling, applied to an already returned value
+        marshal_result = marshal_with(
+            model, ordered=getattr(self._api_or_namespace, "ordered", False)
+        )(lambda result: result)
+        serialize = self.serializer() if fast else None
+
+        def decorator(func):
+            marshalled = restx_marshal(func)  # Also records func.__apidoc__
+            if not fast and not inspect.iscoroutinefunction(func):
+                return marshalled
+
+            def flow(*args, **kwargs):
+                result = yield
+                # Field masks (X-Fields) are a restx feature; let it handle them
+                if not fast or request.headers.get(
+                    current_app.config["RESTX_MASK_HEADER"]
+                ):
+                    return marshal_result(result)
+                data, code, headers = unpack(result)
+                return Response(
+                    dump_json(serialize(data)),
+                    status=code,
+                    headers=headers,
+                    mimetype="application/json",
+                )
+
+            return handler_wrapper(func, flow)
+
+        return decorator
+
+    def cached(self, resource: str, ttl=None, per_user=False):
+        """ETag/304 and response-cache decorator (see response_cache.cached),
+        with the 304 documented. Apply it below auth_required."""
+        not_modified = self._api_or_namespace.response(
+            HTTPStatus.NOT_MODIFIED, "Not Modified"
         )
+        cache = cached(resource, ttl=ttl, per_user=per_user)
+        return lambda func: not_modified(cache(func))
 
     def doc(self, **kwargs):
         """@namespace.doc(...) shortcut for adding Swagger metadata"""
@@ -105,16 +336,4 @@ class BaseSchemaAPIModel:
 
     def _resolve_type(self, field_obj):
         """Maps RESTX field types to native Python types (for query parser)"""
-        type_map = {
-            fields.String: str,
-            fields.Integer: int,
-            fields.Boolean: bool,
-            fields.Float: float,
-            fields.DateTime: str,
-            fields.Raw: str,
-            fields.Url: str,
-        }
-        for field_type, py_type in type_map.items():
-            if isinstance(field_obj, field_type):
-                return py_type
-        return str  # Default fallback type
+        return _python_type(type(field_obj))
@@ -1,6 +1,6 @@
 # app/api/hello_schema.py
 from flask_restx import fields
-from app.api.schemas.base_schema import BaseSchemaAPIModel  # assuming base is here
+from app.api.base_schema import BaseSchemaAPIModel
 
 
 class HelloSchema(BaseSchemaAPIModel):
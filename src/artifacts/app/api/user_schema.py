@@ -1,6 +1,6 @@
 # app/api/user_schema.py
 from flask_restx import fields
-from app.schemas.base_schema import BaseSchemaAPIModel
+from app.api.base_schema import BaseSchemaAPIModel, FileField
 
 # -------------------- User Models --------------------
 
@@ -58,6 +58,8 @@ class UserResponseModel(BaseSchemaAPIModel):
     pages = fields.Integer(required=False)
     current_page = fields.Integer(required=False)
     per_page = fields.Integer(required=False)
+    next_cursor = fields.String(required=False, description="Cursor for next page")
+    total_estimated = fields.Boolean(required=False, description="Total is estimate")
 
 
 # -------------------- Book Borrow Model --------------------
@@ -78,7 +80,34 @@ class UserQueryParams(BaseSchemaAPIModel):
 
     page = fields.Integer(required=False, description="Page number for pagination")
     per_page = fields.Integer(required=False, description="Number of items per page")
+    cursor = fields.String(
+        required=False, description="next_cursor from the previous page (keyset)"
+    )
+    full_name = fields.String(required=False, description="Filter by full name")
+    username = fields.String(required=False, description="Filter by username")
+    email = fields.String(required=False, description="Filter by email")
+    role = fields.String(required=False, description="Filter by user role")
+
+
+# -------------------- Bulk Transfer --------------------
+
+
+class UserExportParams(BaseSchemaAPIModel):
+    __modelname__ = "UserExportQuery"
+
+    format = fields.String(required=False, description="ndjson (default) or csv")
     full_name = fields.String(required=False, description="Filter by full name")
     username = fields.String(required=False, description="Filter by username")
     email = fields.String(required=False, description="Filter by email")
     role = fields.String(required=False, description="Filter by user role")
+
+
+class UserImportParams(BaseSchemaAPIModel):
+    __modelname__ = "UserImportQuery"
+
+    format = fields.String(
+        required=False, description="ndjson or csv (default: from Content-Type)"
+    )
+    mode = fields.String(required=False, description="insert (default) or upsert")
+    batch_size = fields.Integer(required=False, description="Rows per transaction")
+    file = FileField(help="NDJSON/CSV upload; the raw request body also works")
@@ -0,0 +1,13 @@
+# app/commands/__init__.py
+from flask import Flask
+
+from app.commands.profile import profile_token_command
+from app.commands.routes import routes_manifest_command
+from app.commands.seed import seed_command
+
+
+def register_commands(app: Flask) -> None:
+    """Register the app's `flask <command>` CLI commands."""
+    app.cli.add_command(seed_command)
+    app.cli.add_command(routes_manifest_command)
+    app.cli.add_command(profile_token_command)
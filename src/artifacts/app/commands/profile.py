@@ -0,0 +1,25 @@
+# app/commands/profile.py
+import click
+from flask import current_app
+
+from app.utils.profiler import sign_trigger
+
+
+@click.command("profile-token")
+@click.argument("path")
+@click.option(
+    "--ttl",
+    type=int,
+    default=300,
+    show_default=True,
+    help="Seconds the token stays valid.",
+)
+def profile_token_command(path, ttl):
+    """Print a PROFILE_HEADER value that profiles requests to PATH.
+
+    Example: curl -H "X-Profile: $(flask profile-token /api/users/)" ...
+    """
+    secret = current_app.config.get("PROFILE_TRIGGER_SECRET")
+    if not secret:
+        raise click.ClickException("PROFILE_TRIGGER_SECRET is not set")
+    click.echo(sign_trigger(secret, path, ttl))
@@ -0,0 +1,47 @@
+# app/commands/routes.py
+import json
+
+import click
+
+from app.routes import (
+    MANIFEST_FILE,
+    RouteImportError,
+    build_manifest,
+    load_manifest,
+    stale_modules,
+)
+
+
+@click.command("routes-manifest")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    default=MANIFEST_FILE,
+    show_default=True,
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Exit non-zero if the manifest is missing or stale; write nothing.",
+)
+def routes_manifest_command(output, check):
+    """Write the route manifest the app factory registers namespaces from.
+
+    Run it at build time (and whenever a route module changes) so startup
+    does not have to import every route module.
+    """
+    if check:
+        stale = stale_modules(load_manifest(output))
+        if stale:
+            raise click.ClickException(f"Route manifest is stale for {stale}")
+        click.echo("Route manifest is up to date")
+        return
+
+    try:
+        manifest = build_manifest()
+    except RouteImportError as e:
+        raise click.ClickException(str(e)) from e
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    click.echo(f"Wrote {len(manifest['modules'])} route modules to {output}")
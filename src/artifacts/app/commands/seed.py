@@ -0,0 +1,215 @@
+# app/commands/seed.py
+import csv
+import functools
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import insert, select
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.config import CPU_COUNT
+from app.models import db
+from app.models.users import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEED_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "seeds", "users.json"
+)
+SEED_FIELDS = ("full_name", "username", "email", "role", "password")
+# Below this many passwords a process pool costs more than it saves
+MIN_PARALLEL_HASHES = 4
+
+
+class SeedResult(NamedTuple):
+    inserted: int
+    skipped: int
+    seconds: float
+
+
+def read_seed_file(path: str) -> Iterator[dict]:
+    """Yields user records from a .json (list), .ndjson/.jsonl or .csv file."""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8") as f:
+        if extension == ".csv":
+            yield from csv.DictReader(f)
+        elif extension in (".ndjson", ".jsonl"):
+            yield from (json.loads(line) for line in f if line.strip())
+        elif extension == ".json":
+            yield from json.load(f)
+        else:
+            raise ValueError(f"Unsupported seed file type: {path}")
+
+
+def generate_records(count: int, password: str, role: str = "user") -> Iterator[dict]:
+    """Synthetic users for load tests: user1 .. user<count>."""
+    for i in range(1, count + 1):
+        yield {
+            "full_name": f"Load Test User {i}",
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "role": role,
+            "password": password,
+        }
+
+
+def _new_records(records: Iterable[dict]) -> tuple[list[dict], int]:
+    """Drops records whose email or username already exists, in the database
+    (fetched with a single query) or earlier in `records`."""
+    emails, usernames = set(), set()
+    for email, username in db.session.execute(select(User.email, User.username)):
+        emails.add(email)
+        usernames.add(username)
+
+    fresh, skipped = [], 0
+    for record in records:
+        missing = [field for field in SEED_FIELDS if not record.get(field)]
+        if missing:
+            who = record.get("username") or record.get("email") or "?"
+            raise ValueError(f"Seed record for {who!r} is missing {missing}")
+        if record["email"] in emails or record["username"] in usernames:
+            skipped += 1
+            continue
+        emails.add(record["email"])
+        usernames.add(record["username"])
+        fresh.append(record)
+    return fresh, skipped
+
+
+def _hash_unless_current(hasher, password: str, current_hash: Optional[str]) -> str:
+    if current_hash and check_password_hash(current_hash, password):
+        return current_hash
+    return hasher(password)
+
+
+def hash_passwords(
+    passwords: list[str],
+    workers: Optional[int],
+    method: Optional[str],
+    reuse_hashes: bool,
+    current_hashes: Optional[list[Optional[str]]] = None,
+) -> list[str]:
+    """Hashes `passwords` in order, across `workers` processes when worthwhile.
+
+    With `current_hashes` (one stored hash or None per password), a password
+    that matches its stored hash keeps it instead of getting a new one.
+    """
+    hasher = (
+        functools.partial(generate_password_hash, method=method)
+        if method
+        else generate_password_hash
+    )
+    if current_hashes is not None:
+        hasher = functools.partial(_hash_unless_current, hasher)
+        arguments = (passwords, current_hashes)
+    else:
+        # With reuse_hashes, identical passwords share one hash (and salt)
+        unique = list(dict.fromkeys(passwords)) if reuse_hashes else passwords
+        arguments = (unique,)
+    if workers == 1 or len(arguments[0]) < MIN_PARALLEL_HASHES:
+        hashes = list(map(hasher, *arguments))
+    else:
+        workers = workers or CPU_COUNT
+        chunksize = max(len(arguments[0]) // (workers * 4), 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hashes = list(pool.map(hasher, *arguments, chunksize=chunksize))
+    if reuse_hashes and current_hashes is None:
+        by_password = dict(zip(unique, hashes))
+        return [by_password[password] for password in passwords]
+    return hashes
+
+
+def seed_users(
+    records: Iterable[dict],
+    batch_size: int = 1000,
+    workers: Optional[int] = None,
+    hash_method: Optional[str] = None,
+    reuse_hashes: bool = False,
+) -> SeedResult:
+    """Inserts every new user in `records` inside one transaction.
+
+    Existing emails/usernames are skipped, passwords are hashed in a process
+    pool and rows go in as multi-row INSERTs of `batch_size`.
+    """
+    started = time.perf_counter()
+    fresh, skipped = _new_records(records)
+    hashes = hash_passwords(
+        [record["password"] for record in fresh], workers, hash_method, reuse_hashes
+    )
+
+    try:
+        for offset in range(0, len(fresh), batch_size):
+            rows = [
+                {
+                    "full_name": record["full_name"],
+                    "username": record["username"],
+                    "email": record["email"],
+                    "role": UserRole(record["role"]),
+                    "password": password_hash,
+                }
+                for record, password_hash in zip(
+                    fresh[offset : offset + batch_size],
+                    hashes[offset : offset + batch_size],
+                )
+            ]
+            db.session.execute(insert(User), rows)
+            logger.info(f"Seeded {offset + len(rows)}/{len(fresh)} users")
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return SeedResult(len(fresh), skipped, time.perf_counter() - started)
+
+
+@click.command("seed")
+@click.argument("files", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option("--generate", type=int, default=0, help="Add N synthetic users.")
+@click.option("--password", default="password", help="Password for --generate.")
+@click.option("--batch-size", type=int, default=1000, show_default=True)
+@click.option("--workers", type=int, default=None, help="Hashing processes.")
+@click.option(
+    "--hash-method",
+    default=None,
+    help="werkzeug hash method, e.g. pbkdf2:sha256:1000 for fast load-test data.",
+)
+@click.option(
+    "--reuse-hashes",
+    is_flag=True,
+    help="Hash each distinct password once (load tests only).",
+)
+@with_appcontext
+def seed_command(
+    files, generate, password, batch_size, workers, hash_method, reuse_hashes
+):
+    """Seed users from JSON/NDJSON/CSV FILES (default: app/seeds/users.json)."""
+    db.create_all()
+
+    sources = [read_seed_file(path) for path in files]
+    if generate:
+        sources.append(generate_records(generate, password))
+    if not sources:
+        sources.append(read_seed_file(DEFAULT_SEED_FILE))
+
+    try:
+        result = seed_users(
+            (record for source in sources for record in source),
+            batch_size=batch_size,
+            workers=workers,
+            hash_method=hash_method,
+            reuse_hashes=reuse_hashes,
+        )
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(
+        f"Seeded {result.inserted} users ({result.skipped} already existed) "
+        f"in {result.seconds:.2f}s"
+    )
@@ -1,9 +1,77 @@
+import math
 import os
 from dotenv import load_dotenv
 
 # Load environment variables from .env
 load_dotenv()
 
+# Container CPU quota: cgroup v2 ("<quota> <period>" in one file), then v1
+_CPU_QUOTA_FILES = (
+    ("/sys/fs/cgroup/cpu.max", None),
+    ("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us"),
+)
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use: its affinity mask, capped by the
+    container's CPU quota (rounded up). os.cpu_count() reports the host's."""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        count = os.cpu_count() or 1
+    for quota_file, period_file in _CPU_QUOTA_FILES:
+        try:
+            with open(quota_file) as f:
+                quota, _, period = f.read().strip().partition(" ")
+            if period_file:
+                with open(period_file) as f:
+                    period = f.read().strip()
+        except OSError:
+            continue
+        if quota.isdigit() and period.isdigit() and int(period) > 0:
+            count = min(count, math.ceil(int(quota) / int(period)))
+        break  # The first readable file decides; "max" or -1 is no quota
+    return max(count, 1)
+
+
+CPU_COUNT = available_cpus()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+def engine_options(
+    database_uri: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    pool_recycle: int,
+    statement_timeout_ms: int,
+) -> dict:
+    """SQLALCHEMY_ENGINE_OPTIONS for `database_uri`; every value can be
+    overridden with the matching DB_* environment variable."""
+    if database_uri.startswith("sqlite"):
+        return {}  # SQLite pools are per-file/per-thread; nothing to size
+
+    options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", pool_size)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", max_overflow)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", pool_timeout)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", pool_recycle)),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+        "pool_use_lifo": True,  # Idle extras age out instead of being rotated
+    }
+    timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", statement_timeout_ms))
+    if timeout > 0:
+        if database_uri.startswith("postgresql"):
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+        elif database_uri.startswith(("mysql://", "mysql+mysqldb", "mysql+pymysql")):
+            options["connect_args"] = {
+                "init_command": f"SET SESSION max_execution_time={timeout}"
+            }
+    return options
+
 
 class Config:
     # Core App Settings
@@ -37,22 +105,132 @@ class Config:
         },
     }
 
+    # Basic-auth verification cache (0 entries disables it)
+    BASIC_AUTH_CACHE_SIZE = int(os.getenv("BASIC_AUTH_CACHE_SIZE", 1024))
+    BASIC_AUTH_CACHE_TTL = float(os.getenv("BASIC_AUTH_CACHE_TTL", 300))
+
+    # JWT identity cache: user rows loaded lazily behind token claims. The TTL
+    # also bounds how long other workers accept tokens revoked by a password
+    # or role change
+    IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", 1024))
+    IDENTITY_CACHE_TTL = float(os.getenv("IDENTITY_CACHE_TTL", 60))
+
+    # Seconds a paginated listing's total count is reused
+    COUNT_CACHE_TTL = float(os.getenv("COUNT_CACHE_TTL", 30))
+
+    # Cached GET responses: "memory" (per process, so a write only invalidates
+    # the worker that made it), a redis:// URL shared by all workers, or ""
+    # for ETags/304s only. Production defaults to "".
+    RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "memory")
+    RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", 1024))
+    RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", 60))
+
+    # Async projects (app/models/async_session.py, /health): the async engine
+    # defaults to the database above through its asyncio driver
+    ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URL", "")
+    HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", 2.0))
+
+    # Route modules: register from app/routes/manifest.json and import on
+    # first use; strict makes a route module that fails to import fatal
+    ROUTES_LAZY = _env_bool("ROUTES_LAZY", True)
+    ROUTES_STRICT = _env_bool("ROUTES_STRICT", False)
+
+    # Prometheus metrics. A METRICS_TOKEN makes scrapes send it as a Bearer
+    # token. With several worker processes, each writes its numbers to
+    # METRICS_DIR every METRICS_FLUSH_INTERVAL seconds and any of them serves
+    # the sum (app/server.py picks a directory when unset).
+    METRICS_ENABLED = _env_bool("METRICS_ENABLED", True)
+    METRICS_PATH = os.getenv("METRICS_PATH", "/metrics")
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+    METRICS_DIR = os.getenv("METRICS_DIR", "")
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+
+    # SQL accounting (app/utils/query_stats.py): statements slower than
+    # SQL_SLOW_QUERY_MS are logged, and a statement shape repeated
+    # SQL_N_PLUS_ONE_THRESHOLD+ times in one request is flagged as an N+1.
+    # SQL_QUERY_HEADERS adds X-Query-Count/-Time-Ms/-N-Plus-One to responses.
+    SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", 200))
+    SQL_LOG_PARAMETERS = _env_bool("SQL_LOG_PARAMETERS", True)
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", 5))
+    SQL_QUERY_HEADERS = _env_bool("SQL_QUERY_HEADERS", False)
+
+    # Request profiling (app/utils/profiler.py): a PROFILE_SAMPLE_RATE share
+    # of requests, plus any request whose PROFILE_HEADER carries a token
+    # signed with PROFILE_TRIGGER_SECRET (`flask profile-token`), is profiled
+    # with PROFILE_BACKEND ("sampling" or "cprofile"). The last
+    # PROFILE_MAX_FILES profiles are kept in PROFILE_DIR (default
+    # instance/profiles). Off unless a rate or a secret is set.
+    PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", 0.0))
+    PROFILE_TRIGGER_SECRET = os.getenv("PROFILE_TRIGGER_SECRET", "")
+    PROFILE_HEADER = os.getenv("PROFILE_HEADER", "X-Profile")
+    PROFILE_BACKEND = os.getenv("PROFILE_BACKEND", "sampling")
+    PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", 5))
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "")
+    PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", 50))
+
     # App port from environment
     PORT = int(os.getenv("PORT", 5000))
 
+    # Serving model: worker processes x threads. Each worker process has its
+    # own connection pool, sized to its thread count.
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", CPU_COUNT * 2 + 1))
+    WEB_THREADS = int(os.getenv("WEB_THREADS", 4))
+
+    # run.py: "werkzeug" (dev server) or "gunicorn" (pre-forking, see app/server.py)
+    WSGI_SERVER = os.getenv("WSGI_SERVER", "werkzeug")
+    WEB_TIMEOUT = int(os.getenv("WEB_TIMEOUT", 30))
+    WEB_GRACEFUL_TIMEOUT = int(os.getenv("WEB_GRACEFUL_TIMEOUT", 30))
+    WEB_KEEPALIVE = int(os.getenv("WEB_KEEPALIVE", 5))
+    WEB_MAX_REQUESTS = int(os.getenv("WEB_MAX_REQUESTS", 0))  # 0: never recycle
+    WEB_PIDFILE = os.getenv("WEB_PIDFILE", "gunicorn.pid")
+
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    SQL_QUERY_HEADERS = _env_bool("SQL_QUERY_HEADERS", True)
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(
+        Config.SQLALCHEMY_DATABASE_URI,
+        pool_size=5,
+        max_overflow=5,
+        pool_timeout=30,
+        pool_recycle=1800,
+        statement_timeout_ms=30_000,
+    )
 
 
 class TestingConfig(Config):
     TESTING = True
+    ROUTES_STRICT = True
+    SQL_QUERY_HEADERS = _env_bool("SQL_QUERY_HEADERS", True)
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(
+        SQLALCHEMY_DATABASE_URI,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=5,
+        pool_recycle=-1,
+        statement_timeout_ms=5_000,
+    )
 
 
 class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
+    WSGI_SERVER = os.getenv("WSGI_SERVER", "gunicorn")
+    # Several workers need a shared cache: set a redis:// URL to enable it
+    RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "")
+    # Slow-query logs leave out bound values (user data) unless asked for
+    SQL_LOG_PARAMETERS = _env_bool("SQL_LOG_PARAMETERS", False)
+    # Per worker: one connection per thread plus a little burst headroom.
+    # Database-wide that is WEB_CONCURRENCY * (pool_size + max_overflow).
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(
+        Config.SQLALCHEMY_DATABASE_URI,
+        pool_size=Config.WEB_THREADS,
+        max_overflow=max(Config.WEB_THREADS // 2, 2),
+        pool_timeout=10,
+        pool_recycle=1800,
+        statement_timeout_ms=15_000,
+    )
 
 
 # Dictionary to map config names
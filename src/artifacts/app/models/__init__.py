@@ -1,7 +1,28 @@
+import os
+
+from flask import Flask
+from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
+from app.utils.pool_stats import pool_monitor
+from app.utils.query_stats import query_stats
+from app.utils.response_cache import track_writes
+
+# Alembic revisions (`flask db upgrade`), next to the app package
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "migrations"
+)
+
 db = SQLAlchemy()
+migrate = Migrate()
 
 
 def bind_app(app: Flask) -> None:
     db.init_app(app)
+    migrate.init_app(app, db, directory=MIGRATIONS_DIR)
+    track_writes(db.session)
+    query_stats.init_app(app)
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            pool_monitor.attach(bind_key or "default", engine)
+            query_stats.attach(engine)
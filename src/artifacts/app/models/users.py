@@ -1,12 +1,24 @@
 from enum import Enum
 import logging
+import math
 import secrets
 import string
 
 from flask import Flask
 from flask_login import UserMixin
+from sqlalchemy import Select, event, select
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.models import db
+from app.utils.credential_cache import credential_cache
+from app.utils.identity_cache import identity_cache
+from app.utils.pagination import (
+    clamp_per_page,
+    count_cache,
+    decode_cursor,
+    keyset_page,
+    offset_page,
+)
 from werkzeug.security import generate_password_hash, check_password_hash
 
 # Correct the logging level
@@ -14,6 +26,41 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# session.info key: user id -> (newest token_version, drop cached credentials)
+_EXPIRED_AUTH = "expired_auth"
+
+
+def expire_auth_on_commit(
+    user_id: int, token_version: int | None = None, credentials: bool = False
+) -> None:
+    """Drops `user_id`'s cached auth state once the current transaction
+    commits, revoking JWTs older than `token_version`; a rollback keeps it.
+
+    Raising the minimum version before the commit would make this process
+    reject tokens that stay valid if the transaction rolls back.
+    """
+    pending = db.session.info.setdefault(_EXPIRED_AUTH, {})
+    version, drop_credentials = pending.get(user_id, (None, False))
+    if token_version is not None:
+        version = max(version or 0, token_version)
+    pending[user_id] = (version, drop_credentials or credentials)
+
+
+def _expire_committed_auth(session) -> None:
+    for user_id, (version, credentials) in session.info.pop(_EXPIRED_AUTH, {}).items():
+        if credentials:
+            credential_cache.invalidate_user(user_id)
+        identity_cache.invalidate_user(user_id, version)
+
+
+def _forget_expired_auth(session) -> None:
+    session.info.pop(_EXPIRED_AUTH, None)
+
+
+event.listen(db.session, "after_commit", _expire_committed_auth)
+event.listen(db.session, "after_rollback", _forget_expired_auth)
+
+
 # Enum for User Roles
 class UserRole(Enum):
     ADMIN = "admin"
@@ -23,6 +70,11 @@ class UserRole(Enum):
 
 class User(db.Model, UserMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # Role filter + keyset order by id, served from one index range scan
+        db.Index("ix_users_role_id", "role", "id"),
+        db.Index("ix_users_email", "email"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     full_name = db.Column(db.String(255), nullable=False)
@@ -30,12 +82,15 @@ class User(db.Model, UserMixin):
     username = db.Column(db.String(80), unique=True, nullable=False)
     password = db.Column(db.String(255), nullable=False)
     role = db.Column(db.Enum(UserRole), nullable=False)
+    # Bumped on password/role changes; JWTs carrying an older value are revoked
+    token_version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     def to_dict(self):
         return {
             "id": self.id,
             "full_name": self.full_name,
             "username": self.username,
+            "email": self.email,
             "role": self.role.value,
         }
 
@@ -61,10 +116,37 @@ class User(db.Model, UserMixin):
             role=role,
         )
 
+    def snapshot(self) -> dict:
+        """Column values only, safe to cache across sessions."""
+        return {
+            column.key: getattr(self, column.key) for column in self.__table__.columns
+        }
+
+    @staticmethod
+    def _expire_cached_auth(user: "User", data: dict, role: bool = True) -> None:
+        """Drop cached auth state; password/role changes also revoke issued JWTs.
+
+        A role (when `role` is editable) or username equal to the current one
+        is not a change and keeps tokens and cached credentials valid.
+        """
+        if user.id is None:
+            return
+        revoke = "password" in data or (
+            role and "role" in data and UserRole(data["role"]) != user.role
+        )
+        if revoke:
+            user.token_version = (user.token_version or 1) + 1
+        renamed = data.get("username", user.username) != user.username
+        expire_auth_on_commit(
+            user.id, user.token_version, credentials=revoke or renamed
+        )
+
     @staticmethod
     def update_user_as_admin(user: "User", data: dict) -> "User":
+        User._expire_cached_auth(user, data)
         if "password" in data:
             data["password"] = generate_password_hash(data["password"])
+            user.password = data["password"]
         if "role" in data:
             data["role"] = UserRole(data["role"])
         if "full_name" in data:
@@ -79,8 +161,10 @@ class User(db.Model, UserMixin):
 
     @staticmethod
     def update_user_as_user(user: "User", data: dict) -> "User":
+        User._expire_cached_auth(user, data, role=False)
         if "password" in data:
             data["password"] = generate_password_hash(data["password"])
+            user.password = data["password"]
         if "full_name" in data:
             user.full_name = data["full_name"]
         if "username" in data:
@@ -89,177 +173,115 @@ class User(db.Model, UserMixin):
             user.email = data["email"]
         return user
 
+    @staticmethod
+    def filtered_query(filters: dict) -> Select:
+        """Users matching the UserQueryParams filters.
+
+        username and email are prefix matches (index-friendly), role is exact
+        and full_name is a case-insensitive substring match.
+        """
+        query = select(User)
+        if filters.get("full_name"):
+            query = query.where(
+                User.full_name.icontains(filters["full_name"], autoescape=True)
+            )
+        if filters.get("username"):
+            query = query.where(
+                User.username.startswith(filters["username"], autoescape=True)
+            )
+        if filters.get("email"):
+            query = query.where(
+                User.email.startswith(filters["email"], autoescape=True)
+            )
+        if filters.get("role"):
+            query = query.where(User.role == UserRole(filters["role"]))
+        return query
+
+    @staticmethod
+    def list_users(params: dict) -> dict:
+        """One page of users shaped like UserResponseModel.
+
+        Passing `page` keeps the page/per_page contract; otherwise pages are
+        keyset-paginated by id and `next_cursor` fetches the next one. Raises
+        ValueError for an unknown role or a bad cursor.
+        """
+        filters = {
+            key: params[key]
+            for key in ("full_name", "username", "email", "role")
+            if params.get(key)
+        }
+        query = User.filtered_query(filters)
+        per_page = clamp_per_page(params.get("per_page"))
+        total, estimated = count_cache.count(
+            query, User.__tablename__, tuple(sorted(filters.items()))
+        )
+
+        page, next_cursor = params.get("page"), None
+        if page and not params.get("cursor"):
+            users = offset_page(query, User, User.id, max(page, 1), per_page)
+        else:
+            after = decode_cursor(params["cursor"]) if params.get("cursor") else None
+            users, next_cursor = keyset_page(query, User.id, per_page, after)
+
+        return {
+            "success": True,
+            "data": [user.to_dict() for user in users],
+            "total": total,
+            "total_estimated": estimated,
+            "pages": math.ceil(total / per_page),
+            "current_page": page,
+            "per_page": per_page,
+            "next_cursor": next_cursor,
+        }
+
     @staticmethod
     def load_user(user_id: int) -> "User":
         return User.query.get(int(user_id))
 
+    @staticmethod
+    def current_token_version(user_id: int) -> "int | None":
+        """The user's token_version, from the identity cache while its entry is
+        fresh (IDENTITY_CACHE_TTL) and from the database otherwise, so changes
+        made by other worker processes show up within the TTL. None if the
+        user is gone."""
+        snapshot = identity_cache.get(user_id)
+        if snapshot is None:
+            user = db.session.get(User, user_id)
+            if user is None:
+                return None
+            snapshot = user.snapshot()
+            identity_cache.put(user_id, snapshot)
+        return snapshot["token_version"]
+
+    @staticmethod
+    def load_cached_user(user_id: int, token_version: int) -> "User | None":
+        """Load a user through the identity cache, attaching it to the current
+        session without a query on a hit. Returns None if the user is gone or
+        `token_version` is stale."""
+        snapshot = identity_cache.get(user_id)
+        if snapshot is None:
+            user = db.session.get(User, user_id)
+            if user is None:
+                return None
+            identity_cache.put(user_id, user.snapshot())
+        else:
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            user = db.session.merge(user, load=False)
+        return user if user.token_version == token_version else None
+
     @staticmethod
     def create_initial_users(app):
-        """Create initial users if they do not already exist."""
-        users = [
-            {
-                "full_name": "Admin",
-                "username": "admin",
-                "email": "admin@admin.com",
-                "role": UserRole.ADMIN,
-                "password": "admin123",
-            },
-            {
-                "full_name": "Alice Johnson",
-                "username": "alicej",
-                "email": "alice.johnson@example.com",
-                "role": UserRole.ADMIN,
-                "password": "AliceSecure1!",
-            },
-            {
-                "full_name": "Bob Smith",
-                "username": "bobsmith",
-                "email": "bob.smith@example.com",
-                "role": UserRole.USER,
-                "password": "BobStrongPwd2@",
-            },
-            {
-                "full_name": "Charlie Evans",
-                "username": "charliee",
-                "email": "charlie.evans@example.com",
-                "role": UserRole.GUEST,
-                "password": "CharlieGuest3#",
-            },
-            {
-                "full_name": "Diana Lopez",
-                "username": "dianal",
-                "email": "diana.lopez@example.com",
-                "role": UserRole.USER,
-                "password": "DianaUser4$",
-            },
-            {
-                "full_name": "Ethan Brown",
-                "username": "ethanb",
-                "email": "ethan.brown@example.com",
-                "role": UserRole.ADMIN,
-                "password": "EthanAdmin5%",
-            },
-            {
-                "full_name": "Fiona Garcia",
-                "username": "fionag",
-                "email": "fiona.garcia@example.com",
-                "role": UserRole.GUEST,
-                "password": "FionaGuest6^",
-            },
-            {
-                "full_name": "George Miller",
-                "username": "georgem",
-                "email": "george.miller@example.com",
-                "role": UserRole.USER,
-                "password": "GeorgeUser7&",
-            },
-            {
-                "full_name": "Hannah Wilson",
-                "username": "hannahw",
-                "email": "hannah.wilson@example.com",
-                "role": UserRole.ADMIN,
-                "password": "HannahAdmin8*",
-            },
-            {
-                "full_name": "Ian Clark",
-                "username": "ianclark",
-                "email": "ian.clark@example.com",
-                "role": UserRole.USER,
-                "password": "IanUser9(",
-            },
-            {
-                "full_name": "Julia Martinez",
-                "username": "juliam",
-                "email": "julia.martinez@example.com",
-                "role": UserRole.GUEST,
-                "password": "JuliaGuest0)",
-            },
-            {
-                "full_name": "Kevin Harris",
-                "username": "kevinh",
-                "email": "kevin.harris@example.com",
-                "role": UserRole.USER,
-                "password": "KevinPass11!",
-            },
-            {
-                "full_name": "Laura Lewis",
-                "username": "laural",
-                "email": "laura.lewis@example.com",
-                "role": UserRole.ADMIN,
-                "password": "LauraSecure12@",
-            },
-            {
-                "full_name": "Michael Young",
-                "username": "michaely",
-                "email": "michael.young@example.com",
-                "role": UserRole.USER,
-                "password": "MichaelStrong13#",
-            },
-            {
-                "full_name": "Nina Scott",
-                "username": "ninas",
-                "email": "nina.scott@example.com",
-                "role": UserRole.GUEST,
-                "password": "NinaGuest14$",
-            },
-            {
-                "full_name": "Oscar Adams",
-                "username": "oscara",
-                "email": "oscar.adams@example.com",
-                "role": UserRole.USER,
-                "password": "OscarPass15%",
-            },
-            {
-                "full_name": "Paula Roberts",
-                "username": "paular",
-                "email": "paula.roberts@example.com",
-                "role": UserRole.ADMIN,
-                "password": "PaulaSecure16^",
-            },
-            {
-                "full_name": "Quentin Baker",
-                "username": "quentinb",
-                "email": "quentin.baker@example.com",
-                "role": UserRole.GUEST,
-                "password": "QuentinGuest17&",
-            },
-            {
-                "full_name": "Rachel Turner",
-                "username": "rachelt",
-                "email": "rachel.turner@example.com",
-                "role": UserRole.USER,
-                "password": "RachelUser18*",
-            },
-            {
-                "full_name": "Samuel Phillips",
-                "username": "samuelp",
-                "email": "samuel.phillips@example.com",
-                "role": UserRole.USER,
-                "password": "SamuelSecure19(",
-            },
-            {
-                "full_name": "Tina Watson",
-                "username": "tinaw",
-                "email": "tina.watson@example.com",
-                "role": UserRole.GUEST,
-                "password": "TinaGuest20)",
-            },
-        ]
+        """Create initial users if they do not already exist.
+
+        Kept for existing callers; `flask seed` is the bulk-seeding entry point.
+        """
+        from app.commands.seed import DEFAULT_SEED_FILE, read_seed_file, seed_users
 
         with app.app_context():
             db.create_all()
-            for user_data in users:
-                existing_user = User.query.filter_by(email=user_data["email"]).first()
-                if not existing_user:
-                    new_user = User.create_user(
-                        full_name=user_data["full_name"],
-                        username=user_data["username"],
-                        email=user_data["email"],
-                        role=user_data["role"],
-                        password=user_data["password"],
-                    )
-                    db.session.add(new_user)
-                    db.session.commit()
-                    logger.info(f"Added user: {user_data['full_name']}")
-                else:
-                    logger.info(f"user '{user_data['full_name']}' already exists.")
+            result = seed_users(read_seed_file(DEFAULT_SEED_FILE))
+            logger.info(
+                f"Added {result.inserted} initial users "
+                f"({result.skipped} already existed)."
+            )
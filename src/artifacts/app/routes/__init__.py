@@ -1,27 +1,288 @@
 # app/routes/__init__.py
 
+import hashlib
 import importlib
+import json
+import logging
+import os
 import pkgutil
-from flask_restx import Api
-from app import routes  # reference to the app.routes package
+import threading
+import time
+from typing import Optional
 
+from flask import Flask
+from flask_restx import Api, Namespace, Resource
 
-def register_routes(api: Api) -> None:
-    """Auto-imports and registers all route modules with `namespace` and `path` defined."""
+logger = logging.getLogger(__name__)
 
-    # Iterate over all modules in app.routes
-    for _, module_name, is_pkg in pkgutil.iter_modules(routes.__path__):
-        if is_pkg:
+# Written by `flask routes-manifest`; lets the factory register namespaces
+# without importing the route modules behind them
+MANIFEST_FILE = os.path.join(os.path.dirname(__file__), "manifest.json")
+MANIFEST_VERSION = 1
+
+_load_lock = threading.Lock()
+
+
+class RouteImportError(RuntimeError):
+    """A route module failed to import with ROUTES_STRICT enabled."""
+
+
+class RouteReport:
+    """How each route module was registered and what importing it cost."""
+
+    def __init__(self):
+        self.modules: dict[str, dict] = {}
+        self.lazy_namespaces: list[LazyNamespace] = []
+        self._lock = threading.Lock()
+
+    def record(self, module_name: str, mode: str, **details) -> None:
+        with self._lock:
+            self.modules[module_name] = {"mode": mode, **details}
+
+    def log(self, elapsed_ms: float) -> None:
+        modes = [entry["mode"] for entry in self.modules.values()]
+        logger.info(
+            f"Registered {len(modes)} route modules ({modes.count('lazy')} lazy, "
+            f"{modes.count('eager')} imported, {modes.count('failed')} failed) "
+            f"in {elapsed_ms:.1f}ms"
+        )
+        for module_name, entry in self.modules.items():
+            if entry.get("import_ms") is not None:
+                logger.info(f"  {module_name}: {entry['import_ms']:.1f}ms")
+
+    def load_all(self) -> None:
+        """Imports every lazily registered route module now. A preforking
+        server calls this in the master so workers inherit the modules
+        instead of each importing them on its first requests."""
+        for namespace in self.lazy_namespaces:
+            try:
+                namespace.load()
+            except Exception:
+                logger.exception(f"Failed to load route module {namespace.module_name}")
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.modules.items()}
+
+
+def route_modules() -> dict[str, str]:
+    """Route module names mapped to their source files, found without
+    importing anything."""
+    found = {}
+    for info in pkgutil.iter_modules(__path__):
+        if info.ispkg:
             continue  # Skip sub-packages if any
+        source = os.path.join(info.module_finder.path, f"{info.name}.py")
+        if os.path.exists(source):
+            found[f"{__name__}.{info.name}"] = source
+    return found
+
+
+def source_digest(source: str) -> str:
+    with open(source, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def import_route_module(module_name: str):
+    """Imports a route module, returning (module, milliseconds). The time
+    includes any dependencies the module is the first to import."""
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    return module, (time.perf_counter() - started) * 1000
+
+
+# -------------------- Lazy namespaces --------------------
+
+
+class LazyNamespace(Namespace):
+    """Stands in for a route module's namespace, built from its manifest entry.
+
+    URL rules point at proxy resources, so nothing is imported at startup.
+    The module is imported on the first request to any of its routes, or
+    when something (the Swagger spec) reads `resources` after registration.
+    """
+
+    def __init__(self, entry: dict, report: RouteReport):
+        super().__init__(entry["name"], description=entry.get("description"))
+        self.module_name = entry["module"]
+        self._report = report
+        self.module = None  # The route module, once imported
+        self._real: Optional[Namespace] = None
+        self._registered = False
+        for route in entry["resources"]:
+            proxy = _proxy_resource(self, route["class"], route["methods"])
+            self.add_resource(proxy, *route["urls"], endpoint=route["endpoint"])
 
-        module_full_name = f"{routes.__name__}.{module_name}"
+    @property
+    def resources(self) -> list:
+        if self._registered:
+            return self.load().resources
+        return self._proxy_routes
 
+    @resources.setter
+    def resources(self, value: list) -> None:
+        self._proxy_routes = value
+
+    def mark_registered(self) -> None:
+        self._registered = True
+
+    def load(self) -> Namespace:
+        """Imports the route module once and hands its docs to the APIs."""
+        if self._real is not None:
+            return self._real
+        with _load_lock:
+            if self._real is None:
+                module, elapsed_ms = import_route_module(self.module_name)
+                real = module.namespace
+                for api in self.apis:
+                    api.models.update(real.models)
+                    api.error_handlers.update(real.error_handlers)
+                for route in self._proxy_routes:
+                    target = getattr(module, route.resource.target_name)
+                    target.endpoint = route.resource.endpoint
+                    target.mediatypes = route.resource.mediatypes
+                self.authorizations = real.authorizations
+                self.module = module
+                self._real = real
+                self._report.record(self.module_name, "lazy", import_ms=elapsed_ms)
+                logger.info(f"Loaded {self.module_name} in {elapsed_ms:.1f}ms")
+        return self._real
+
+
+def _proxy_resource(namespace: LazyNamespace, class_name: str, methods: list):
+    """A Resource that imports the real one on first dispatch and delegates."""
+
+    def dispatch_request(self, *args, **kwargs):
+        real = namespace.load()
+        view = getattr(namespace.module, class_name)(self.api).dispatch_request
+        for decorator in real.decorators:
+            view = decorator(view)
+        return view(*args, **kwargs)
+
+    return type(
+        class_name,
+        (Resource,),
+        {
+            "methods": set(methods),
+            "target_name": class_name,
+            "dispatch_request": dispatch_request,
+        },
+    )
+
+
+# -------------------- Manifest --------------------
+
+
+def build_manifest() -> dict:
+    """Imports every route module into a scratch API and records what the
+    factory needs to register it lazily. Raises RouteImportError on failure."""
+    api = Api(Flask(__name__), doc=False)
+    entries = []
+    for module_name, source in sorted(route_modules().items()):
+        digest = source_digest(source)
         try:
-            module = importlib.import_module(module_full_name)
+            module, _ = import_route_module(module_name)
+        except Exception as e:
+            raise RouteImportError(f"Failed to load {module_name}: {e}") from e
+        if not (hasattr(module, "namespace") and hasattr(module, "path")):
+            # Listed anyway so startup knows there is nothing to register
+            entries.append({"module": module_name, "digest": digest, "path": None})
+            continue
+        namespace = module.namespace
+        api.add_namespace(namespace, path=module.path)
+        entries.append(
+            {
+                "module": module_name,
+                "digest": digest,
+                "path": module.path,
+                "name": namespace.name,
+                "description": namespace.description,
+                "resources": [
+                    {
+                        "class": route.resource.__name__,
+                        "urls": list(route.urls),
+                        "endpoint": route.resource.endpoint,
+                        "methods": sorted(route.resource.methods),
+                    }
+                    for route in namespace.resources
+                ],
+            }
+        )
+    return {"version": MANIFEST_VERSION, "modules": entries}
 
-            # Only register if both `namespace` and `path` exist
-            if hasattr(module, "namespace") and hasattr(module, "path"):
-                api.add_namespace(module.namespace, path=module.path)
 
+def load_manifest(path: str = MANIFEST_FILE) -> dict[str, dict]:
+    """Manifest entries by module name; empty if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return {entry["module"]: entry for entry in manifest.get("modules", [])}
+
+
+def stale_modules(manifest: dict[str, dict]) -> list[str]:
+    """Route modules that are missing from `manifest` or changed since."""
+    return [
+        module_name
+        for module_name, source in sorted(route_modules().items())
+        if module_name not in manifest
+        or manifest[module_name]["digest"] != source_digest(source)
+    ]
+
+
+# -------------------- Registration --------------------
+
+
+def register_routes(api: Api, lazy: bool = True, strict: bool = False) -> RouteReport:
+    """Registers every route module that defines `namespace` and `path`.
+
+    With `lazy`, modules whose source still matches the manifest are
+    registered from it and imported on first use; the rest are imported now.
+    With `strict`, an import error raises RouteImportError instead of being
+    logged and skipped.
+    """
+    started = time.perf_counter()
+    manifest = load_manifest() if lazy else {}
+    report = RouteReport()
+
+    for module_name, source in sorted(route_modules().items()):
+        entry = manifest.get(module_name)
+        if entry is not None and entry["digest"] == source_digest(source):
+            if entry["path"] is None:
+                report.record(module_name, "skipped")
+                continue
+            namespace = LazyNamespace(entry, report)
+            api.add_namespace(namespace, path=entry["path"])
+            namespace.mark_registered()
+            report.lazy_namespaces.append(namespace)
+            report.record(module_name, "lazy", import_ms=None)
+            continue
+
+        try:
+            module, elapsed_ms = import_route_module(module_name)
         except Exception as e:
-            print(f"Failed to load module {module_full_name}: {e}")
+            if strict:
+                raise RouteImportError(f"Failed to load {module_name}: {e}") from e
+            logger.exception(f"Failed to load route module {module_name}")
+            report.record(module_name, "failed", error=type(e).__name__)
+            continue
+        # Only register if both `namespace` and `path` exist
+        if hasattr(module, "namespace") and hasattr(module, "path"):
+            api.add_namespace(module.namespace, path=module.path)
+        report.record(module_name, "eager", import_ms=elapsed_ms)
+
+    report.log((time.perf_counter() - started) * 1000)
+    eager = [
+        name
+        for name, entry in report.modules.items()
+        if entry["mode"] in ("eager", "failed")
+    ]
+    if lazy and eager:
+        logger.warning(
+            f"Imported {', '.join(eager)} at startup: missing from the route "
+            "manifest or changed since; run `flask routes-manifest`"
+        )
+    return report
@@ -10,7 +10,7 @@ hello_schema = HelloSchema(namespace)
 
 @namespace.route("/")
 class HelloResource(Resource):
-    @hello_schema.expect_model()
+    @hello_schema.expect
     def post(self):
         data = namespace.payload
         name = data.get("name")
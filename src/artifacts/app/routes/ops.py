@@ -0,0 +1,80 @@
+# app/routes/ops.py
+from http import HTTPStatus
+
+from flask import current_app, request, send_file
+from flask_restx import Namespace, Resource
+
+from app.models.users import UserRole
+from app.utils.auth_utils import auth_required
+from app.utils.metrics import latency_summary
+from app.utils.pool_stats import pool_monitor
+from app.utils.profiler import request_profiler
+from app.utils.query_stats import query_stats
+
+path = "/ops"
+namespace = Namespace("ops", description="Operational diagnostics")
+
+
+@namespace.route("/pool")
+class PoolStatsResource(Resource):
+    @namespace.response(HTTPStatus.OK, "Connection pool state per engine")
+    @auth_required([UserRole.ADMIN])
+    def get(self):
+        """Pool size, checked-out connections, overflow and saturation."""
+        return {"engines": pool_monitor.snapshot()}
+
+
+@namespace.route("/routes")
+class RouteReportResource(Resource):
+    @namespace.response(HTTPStatus.OK, "Registration mode and import time per module")
+    @auth_required([UserRole.ADMIN])
+    def get(self):
+        """How each route module was registered (lazy/eager) and its import cost."""
+        return {"modules": current_app.extensions["route_report"].as_dict()}
+
+
+@namespace.route("/latency")
+class LatencyResource(Resource):
+    @namespace.response(HTTPStatus.OK, "Latency percentiles per route, slowest first")
+    @auth_required([UserRole.ADMIN])
+    def get(self):
+        """p50/p90/p99 per route from the request-duration histograms (all workers)."""
+        return {"routes": latency_summary()}
+
+
+@namespace.route("/queries")
+class QueryStatsResource(Resource):
+    @namespace.doc(params={"limit": "Shapes to return (default 20)"})
+    @namespace.doc(params={"order_by": "total_ms (default), count, mean_ms or max_ms"})
+    @namespace.response(HTTPStatus.OK, "SQL statement shapes, most expensive first")
+    @namespace.response(HTTPStatus.BAD_REQUEST, "Invalid order_by")
+    @auth_required([UserRole.ADMIN])
+    def get(self):
+        """Count and DB time per statement shape in this worker process."""
+        order_by = request.args.get("order_by", "total_ms")
+        if order_by not in ("total_ms", "count", "mean_ms", "max_ms"):
+            return {"message": f"Unknown order_by {order_by!r}"}, HTTPStatus.BAD_REQUEST
+        limit = request.args.get("limit", 20, type=int)
+        return {"statements": query_stats.top(limit, order_by)}
+
+
+@namespace.route("/profiles")
+class ProfileListResource(Resource):
+    @namespace.response(HTTPStatus.OK, "Stored request profiles, newest first")
+    @auth_required([UserRole.ADMIN])
+    def get(self):
+        """Summaries of the profiles in PROFILE_DIR (all workers)."""
+        return {"profiles": request_profiler.entries()}
+
+
+@namespace.route("/profiles/<string:file_name>")
+class ProfileFileResource(Resource):
+    @namespace.response(HTTPStatus.OK, "Collapsed stacks or pstats data")
+    @namespace.response(HTTPStatus.NOT_FOUND, "No such profile")
+    @auth_required([UserRole.ADMIN])
+    def get(self, file_name):
+        """Download one profile's output file (the `file` of its summary)."""
+        path = request_profiler.path_for(file_name)
+        if path is None:
+            return {"message": f"Profile {file_name} not found"}, HTTPStatus.NOT_FOUND
+        return send_file(path, as_attachment=True, download_name=file_name)
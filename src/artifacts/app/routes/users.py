@@ -0,0 +1,100 @@
+# app/routes/users.py
+import json
+from http import HTTPStatus
+
+from flask import Response, request, stream_with_context
+from flask_restx import Namespace, Resource
+
+from app.api.user_schema import UserExportParams, UserImportParams, UserQueryParams
+from app.models.users import User, UserRole
+from app.utils.auth_utils import auth_required
+from app.utils.user_transfer import (
+    FORMATS,
+    UserImporter,
+    detect_format,
+    export_users,
+    iter_text_lines,
+    parse_records,
+)
+
+path = "/users"
+namespace = Namespace("users", description="User operations")
+
+user_query = UserQueryParams(namespace)
+user_query_parser = user_query.as_queryparser()
+user_export = UserExportParams(namespace)
+user_export_parser = user_export.as_queryparser()
+user_import = UserImportParams(namespace)
+user_import_parser = user_import.as_queryparser()
+
+
+@namespace.route("/")
+class UserListResource(Resource):
+    @user_query.expect_query
+    @user_query.response(HTTPStatus.OK, "Paginated users")
+    @user_query.response(HTTPStatus.BAD_REQUEST, "Invalid filter or cursor")
+    @auth_required([UserRole.ADMIN])
+    @user_query.cached(User.__tablename__)
+    def get(self):
+        try:
+            return User.list_users(user_query_parser.parse_args())
+        except ValueError as e:
+            return {"message": str(e)}, HTTPStatus.BAD_REQUEST
+
+
+@namespace.route("/export")
+class UserExportResource(Resource):
+    @user_export.expect_query
+    @user_export.response(HTTPStatus.OK, "NDJSON or CSV stream of users")
+    @user_export.response(HTTPStatus.BAD_REQUEST, "Invalid format or filter")
+    @auth_required([UserRole.ADMIN])
+    def get(self):
+        args = user_export_parser.parse_args()
+        fmt = args.get("format") or "ndjson"
+        if fmt not in FORMATS:
+            return {"message": f"Unknown format {fmt!r}"}, HTTPStatus.BAD_REQUEST
+        try:
+            query = User.filtered_query(args)
+        except ValueError as e:
+            return {"message": str(e)}, HTTPStatus.BAD_REQUEST
+
+        return Response(
+            stream_with_context(export_users(query, fmt)),
+            mimetype=FORMATS[fmt],
+            headers={"Content-Disposition": f"attachment; filename=users.{fmt}"},
+        )
+
+
+@namespace.route("/import")
+class UserImportResource(Resource):
+    @user_import.expect_query
+    @user_import.response(
+        HTTPStatus.OK, "NDJSON stream of row errors, batch progress and a summary"
+    )
+    @user_import.response(HTTPStatus.BAD_REQUEST, "Invalid format or mode")
+    @auth_required([UserRole.ADMIN])
+    def post(self):
+        args = user_import_parser.parse_args()
+        upload = args.get("file")
+        if upload:
+            stream = upload.stream
+            fmt = args.get("format") or detect_format(upload.mimetype, upload.filename)
+        else:
+            stream = request.stream
+            fmt = args.get("format") or detect_format(request.mimetype)
+        if fmt not in FORMATS:
+            return {"message": f"Unknown format {fmt!r}"}, HTTPStatus.BAD_REQUEST
+        try:
+            importer = UserImporter(
+                args.get("mode") or "insert",
+                args.get("batch_size") or 500,
+                hash_workers=1,
+            )
+        except ValueError as e:
+            return {"message": str(e)}, HTTPStatus.BAD_REQUEST
+
+        events = importer.run(parse_records(iter_text_lines(stream), fmt))
+        return Response(
+            stream_with_context(json.dumps(event) + "\n" for event in events),
+            mimetype=FORMATS["ndjson"],
+        )
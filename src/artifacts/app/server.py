@@ -0,0 +1,109 @@
+# app/server.py
+import gc
+import logging
+import os
+import shutil
+import signal
+import tempfile
+
+from flask import Flask
+
+from app.models import db
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _tmpfs_dir():
+    return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def gunicorn_options(config) -> dict:
+    """Gunicorn settings from the WEB_* config values."""
+    return {
+        "bind": f"0.0.0.0:{config.PORT}",
+        "workers": config.WEB_CONCURRENCY,
+        "threads": config.WEB_THREADS,
+        "worker_class": "gthread",
+        "preload_app": True,
+        "timeout": config.WEB_TIMEOUT,
+        "graceful_timeout": config.WEB_GRACEFUL_TIMEOUT,
+        "keepalive": config.WEB_KEEPALIVE,
+        "max_requests": config.WEB_MAX_REQUESTS,
+        "max_requests_jitter": config.WEB_MAX_REQUESTS // 10,
+        "pidfile": config.WEB_PIDFILE,
+        # Heartbeat files on tmpfs; a disk-backed /tmp can stall workers
+        "worker_tmp_dir": _tmpfs_dir(),
+    }
+
+
+def serve(app: Flask, config) -> None:
+    """Runs `app` under gunicorn: preloaded in the master, forked into
+    WEB_CONCURRENCY workers of WEB_THREADS threads each.
+
+    Graceful restarts:
+      kill -HUP <master>     new workers (same code), old ones finish requests
+      python run.py reload   new master with new code, then the old one
+                             drains and exits (SIGUSR2 + SIGTERM)
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class ProductionServer(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(config).items():
+                if value is not None:
+                    self.cfg.set(key, value)
+            self.cfg.set("post_fork", post_fork)
+            self.cfg.set("when_ready", when_ready)
+            self.cfg.set("worker_exit", worker_exit)
+            self.cfg.set("on_exit", on_exit)
+
+        def load(self):
+            # Workers write their metrics here so any of them can serve /metrics
+            metrics_dir = config.METRICS_DIR or tempfile.mkdtemp(
+                prefix="metrics-", dir=_tmpfs_dir()
+            )
+            metrics.set_directory(metrics_dir, config.METRICS_FLUSH_INTERVAL)
+            # Runs once in the master (preload_app). Import the lazily
+            # registered route modules here, or every worker imports its own
+            # copy after the fork. Freezing what exists then keeps the GC
+            # from touching, and so copying, those pages in every worker.
+            app.extensions["route_report"].load_all()
+            gc.collect()
+            gc.freeze()
+            return app
+
+    def post_fork(server, worker):
+        # Connections opened in the master must not be shared across forks;
+        # close=False leaves the master's sockets for the master to close
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+        metrics.reset()  # Count only this worker's requests
+
+    def worker_exit(server, worker):
+        metrics.flush()  # Its counters stay in the totals after it is gone
+
+    def on_exit(server):
+        if not config.METRICS_DIR and metrics.directory:
+            shutil.rmtree(metrics.directory, ignore_errors=True)
+
+    def when_ready(server):
+        if server.master_pid:  # Started by SIGUSR2: retire the old master
+            server.log.info(f"Stopping previous master {server.master_pid}")
+            os.kill(server.master_pid, signal.SIGTERM)
+
+    ProductionServer().run()
+
+
+def reload_server(config) -> int:
+    """Asks the running master (from WEB_PIDFILE) for a graceful code reload."""
+    try:
+        with open(config.WEB_PIDFILE) as f:
+            pid = int(f.read().strip())
+        os.kill(pid, signal.SIGUSR2)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not signal the server in {config.WEB_PIDFILE}: {e}")
+        return 1
+    logger.info(f"Sent SIGUSR2 to {pid}; the new master retires it once ready")
+    return 0
@@ -0,0 +1,110 @@
+# app/utils/aio.py
+import asyncio
+import inspect
+import os
+import threading
+from functools import wraps
+
+from flask import Flask, current_app
+from flask_restx import Resource
+
+
+class EventLoopThread:
+    """One asyncio loop on a daemon thread, shared by every request thread.
+
+    Flask's default runs each async view in a fresh event loop, so nothing
+    loop-bound (such as pooled async database connections) survives the
+    request. Here every async view runs on this loop instead, so their I/O
+    overlaps across requests. Blocking calls inside an async view stall all
+    of them; hand those to `asyncio.to_thread`.
+    """
+
+    def __init__(self, name: str = "async-views"):
+        self.name = name
+        self._loop = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        # (Re)started lazily, so a forked worker never uses its parent's loop
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name=self.name, daemon=True
+                    ).start()
+                    self._loop, self._pid = loop, os.getpid()
+        return self._loop
+
+    def run(self, coro):
+        """Runs `coro` on the loop and blocks the calling thread for its result."""
+        loop = self.loop
+        if threading.current_thread().name == self.name:
+            coro.close()
+            raise RuntimeError("Cannot block the event loop thread on itself")
+        # The task runs in a copy of the caller's context (request, app, g)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def async_to_sync(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.run(func(*args, **kwargs))
+
+        return wrapper
+
+
+event_loop = EventLoopThread()
+
+
+def init_async(app: Flask) -> None:
+    """Run the app's async views and handlers on the shared event loop."""
+    app.async_to_sync = event_loop.async_to_sync
+
+
+def handler_wrapper(func, flow):
+    """Builds a decorator's wrapper around `func` from `flow`, a generator
+    function called with each call's arguments.
+
+    `flow` yields at most once, to receive func's return value, and returns
+    the wrapper's result; returning without yielding skips `func`. The
+    wrapper is a coroutine function when `func` is one, so the same decorator
+    works on `def` and `async def` handlers.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            steps = flow(*args, **kwargs)
+            try:
+                next(steps)
+                steps.send(await func(*args, **kwargs))
+            except StopIteration as stop:
+                return stop.value
+            raise RuntimeError(f"{flow.__qualname__} yielded more than once")
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        steps = flow(*args, **kwargs)
+        try:
+            next(steps)
+            steps.send(func(*args, **kwargs))
+        except StopIteration as stop:
+            return stop.value
+        raise RuntimeError(f"{flow.__qualname__} yielded more than once")
+
+    return wrapper
+
+
+def run_sync(method):
+    """Resource method decorator: runs an `async def` method to completion."""
+    return current_app.ensure_sync(method)
+
+
+class AsyncResource(Resource):
+    """A Resource whose methods may be `async def`; sync ones run as usual."""
+
+    method_decorators = [run_sync]
@@ -1,9 +1,8 @@
 # app/utils/auth_utils.py
 import base64
-import json
 import logging
+import time
 from datetime import timedelta
-from functools import wraps
 from http import HTTPStatus
 from typing import Any, Optional
 
@@ -12,14 +11,16 @@ from flask_httpauth import HTTPBasicAuth
 from flask_jwt_extended import (
     JWTManager,
     create_access_token,
-    get_jwt_identity,
+    get_jwt,
     verify_jwt_in_request,
 )
-from flask_login import login_user
 
 from app.models import db
-from app.models.user import User, UserRole
-
+from app.models.users import User, UserRole
+from app.utils.aio import handler_wrapper
+from app.utils.credential_cache import credential_cache
+from app.utils.identity_cache import identity_cache
+from app.utils.metrics import auth_duration
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
@@ -36,11 +37,73 @@ def init_jwt(app: Flask) -> None:
     jwt_auth.init_app(app)
 
 
+# Compact JWT claims; the user id travels as the standard "sub" claim
+CLAIM_USERNAME = "usr"
+CLAIM_ROLE = "role"
+CLAIM_TOKEN_VERSION = "tv"
+
+
+class Principal:
+    """The authenticated caller.
+
+    Built from JWT claims alone, so authorization needs no database round
+    trip; the full User row is only loaded when a handler reads `.user`.
+    """
+
+    __slots__ = ("_user", "role", "token_version", "user_id", "username")
+
+    def __init__(
+        self,
+        user_id: int,
+        username: str,
+        role: UserRole,
+        token_version: int,
+        user: Optional[User] = None,
+    ):
+        self.user_id = user_id
+        self.username = username
+        self.role = role
+        self.token_version = token_version
+        self._user = user
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "Principal":
+        return cls(
+            user_id=int(claims["sub"]),
+            username=str(claims[CLAIM_USERNAME]),
+            role=UserRole(claims[CLAIM_ROLE]),
+            token_version=int(claims[CLAIM_TOKEN_VERSION]),
+        )
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(user.id, user.username, user.role, user.token_version or 1, user)
+
+    @property
+    def user(self) -> Optional[User]:
+        """The full User, loaded through the identity cache on first access."""
+        if self._user is None:
+            self._user = User.load_cached_user(self.user_id, self.token_version)
+        return self._user
+
+
+def current_principal() -> Optional[Principal]:
+    """The Principal that auth_required authorized for this request."""
+    return g.get("principal")
+
+
 def generate_token(user: User) -> str:
-    """Generate a JWT token for the given user."""
-    user_data = json.dumps(user.to_dict())
+    """Generate a JWT token carrying the claims auth_required authorizes from."""
     expires = timedelta(days=1)
-    return create_access_token(identity=user_data, expires_delta=expires)
+    return create_access_token(
+        identity=str(user.id),
+        additional_claims={
+            CLAIM_USERNAME: user.username,
+            CLAIM_ROLE: user.role.value,
+            CLAIM_TOKEN_VERSION: user.token_version or 1,
+        },
+        expires_delta=expires,
+    )
 
 
 def get_user_metadata_from_basic_auth(auth_header: str) -> tuple[str, str]:
@@ -55,11 +118,31 @@ def get_user_metadata_from_basic_auth(auth_header: str) -> tuple[str, str]:
 
 
 def verify_user_basic(username: str, password: str) -> Optional[User]:
-    """Authenticate user via basic auth."""
+    """Authenticate user via basic auth.
+
+    Verified credentials are cached, so repeat requests load the user by
+    primary key instead of re-running the password hash. Stateless like the
+    JWT path: the caller is kept on `g` only, never in a login session.
+    """
+    cached = credential_cache.get(username, password)
+    if cached is not None:
+        user = db.session.get(User, cached.user_id)
+        if (
+            user
+            and user.username == username
+            and credential_cache.matches_hash(cached, user.password)
+        ):
+            g.current_user = {
+                "username": user.username,
+                "user_id": user.id,
+            }
+            return user
+        credential_cache.invalidate_user(cached.user_id)
+
     user = User.query.filter_by(username=username).first()
 
     if user and User.check_password(user.password, password):
-        login_user(user)
+        credential_cache.put(username, password, user.id, user.password)
         g.current_user = {
             "username": user.username,
             "user_id": user.id,
@@ -69,65 +152,93 @@ def verify_user_basic(username: str, password: str) -> Optional[User]:
     return None
 
 
-def verify_user_jwt() -> Optional[User]:
-    """Authenticate user via JWT token."""
+def verify_user_jwt() -> Optional[Principal]:
+    """Authenticate user via JWT claims; the user row is only read (through
+    the identity cache) to check the token version."""
     verify_jwt_in_request()
-    user_identity = json.loads(get_jwt_identity())
-    user = User.load_user(user_identity.get("user_id"))
-
-    if user:
-        login_user(user)
-        g.current_user = {
-            "username": user.username,
-            "user_id": user.id,
-        }
-        return user
-
+    try:
+        principal = Principal.from_claims(get_jwt())
+    except (KeyError, TypeError, ValueError):
+        return None  # Missing or malformed claims (e.g. tokens from older builds)
+
+    # Revoked in this process, then against the user's current version (cached
+    # for at most IDENTITY_CACHE_TTL), which catches changes in other workers
+    if identity_cache.is_revoked(principal.user_id, principal.token_version):
+        return None
+    if User.current_token_version(principal.user_id) != principal.token_version:
+        return None
+
+    g.current_user = {
+        "username": principal.username,
+        "user_id": principal.user_id,
+    }
+    return principal
+
+
+def _auth_scheme(auth_header: Optional[str]) -> str:
+    if not auth_header:
+        return "none"
+    if auth_header.startswith("Bearer "):
+        return "jwt"
+    if auth_header.startswith("Basic "):
+        return "basic"
+    return "other"
+
+
+def authorize(allowed_roles: list[UserRole] | None, scheme: str, auth_header: str):
+    """Authenticates the request and checks its role; sets g.principal and
+    returns None, or returns the error response."""
+    if scheme == "none":
+        return {"message": "Missing Authorization header"}, HTTPStatus.UNAUTHORIZED
+
+    if scheme == "jwt":
+        principal = verify_user_jwt()
+    elif scheme == "basic":
+        try:
+            username, password = get_user_metadata_from_basic_auth(auth_header)
+            user = verify_user_basic(username, password)
+            principal = Principal.from_user(user) if user else None
+        except ValueError:
+            return {"message": "Invalid Basic Auth header"}, HTTPStatus.UNAUTHORIZED
+    else:
+        return {"message": "Invalid Authorization scheme"}, HTTPStatus.UNAUTHORIZED
+
+    if not principal:
+        return {"message": "Invalid credentials"}, HTTPStatus.UNAUTHORIZED
+
+    # Role check
+    if allowed_roles and principal.role not in allowed_roles:
+        return {
+            "message": "You do not have permission to access this resource"
+        }, HTTPStatus.FORBIDDEN
+
+    g.principal = principal
     return None
 
 
 def auth_required(allowed_roles: list[UserRole] | None):
     """
     Decorator to protect routes with JWT or Basic Auth,
-    and optional role-based authorization.
+    and optional role-based authorization. Works on sync and async handlers.
+
+    Time spent here is recorded per scheme and outcome (auth_duration_seconds).
     """
 
     def decorator(func: Any):
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
+        def flow(*args, **kwargs):
+            started = time.perf_counter()
             auth_header = request.headers.get("Authorization")
-
-            if not auth_header:
-                return {
-                    "message": "Missing Authorization header"
-                }, HTTPStatus.UNAUTHORIZED
-
-            if auth_header.startswith("Bearer "):
-                user = verify_user_jwt()
-            elif auth_header.startswith("Basic "):
-                try:
-                    username, password = get_user_metadata_from_basic_auth(auth_header)
-                    user = verify_user_basic(username, password)
-                except ValueError:
-                    return {
-                        "message": "Invalid Basic Auth header"
-                    }, HTTPStatus.UNAUTHORIZED
-            else:
-                return {
-                    "message": "Invalid Authorization scheme"
-                }, HTTPStatus.UNAUTHORIZED
-
-            if not user:
-                return {"message": "Invalid credentials"}, HTTPStatus.UNAUTHORIZED
-
-            # Role check
-            if allowed_roles and user.role not in allowed_roles:
-                return {
-                    "message": "You do not have permission to access this resource"
-                }, HTTPStatus.FORBIDDEN
-
-            return func(*args, **kwargs)
-
-        return wrapper
+            scheme = _auth_scheme(auth_header)
+            outcome = "error"  # e.g. verify_jwt_in_request raising on bad tokens
+            try:
+                error = authorize(allowed_roles, scheme, auth_header)
+                outcome = "ok" if error is None else f"{int(error[1])}"
+            finally:
+                auth_duration.observe((scheme, outcome), time.perf_counter() - started)
+            if error is not None:
+                return error
+            return (yield)  # The handler's result, sync or awaited
+
+        return handler_wrapper(func, flow)
 
     return decorator
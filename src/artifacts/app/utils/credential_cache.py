@@ -0,0 +1,133 @@
+# app/utils/credential_cache.py
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from flask import Flask
+
+
+class CachedCredential(NamedTuple):
+    user_id: int
+    password_tag: bytes  # Keyed digest of the stored password hash
+    expires_at: float
+
+
+class CredentialCache:
+    """Bounded LRU+TTL cache of successful Basic-auth verifications.
+
+    Entries are keyed by an HMAC of `username:password` under a per-process
+    random key, so neither plaintext passwords nor reusable digests are kept
+    in memory. A hit skips the password KDF; callers still load the user and
+    confirm the stored hash with `matches_hash`, which catches password
+    changes made by other worker processes.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._key = secrets.token_bytes(32)
+        self._entries: OrderedDict[bytes, CachedCredential] = OrderedDict()
+        self._by_user: dict[int, set[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, max_entries: int, ttl: float) -> None:
+        with self._lock:
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self._clear()
+
+    def _digest(self, *parts: str) -> bytes:
+        message = "\x00".join(parts).encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def get(self, username: str, password: str) -> Optional[CachedCredential]:
+        """Returns the cached verification for these credentials, if still fresh."""
+        if self.max_entries <= 0:
+            return None
+        key = self._digest(username, password)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    self._discard(key, entry.user_id)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, username: str, password: str, user_id: int, password_hash: str):
+        if self.max_entries <= 0:
+            return
+        key = self._digest(username, password)
+        entry = CachedCredential(
+            user_id, self._digest(password_hash), time.monotonic() + self.ttl
+        )
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._unlink(key, previous.user_id)
+            self._entries[key] = entry
+            self._by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, old_entry = self._entries.popitem(last=False)
+                self._unlink(old_key, old_entry.user_id)
+
+    def matches_hash(self, entry: CachedCredential, password_hash: str) -> bool:
+        return hmac.compare_digest(entry.password_tag, self._digest(password_hash))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drops every cached verification for `user_id`."""
+        with self._lock:
+            for key in self._by_user.pop(user_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+        self.hits = self.misses = 0
+
+    def _discard(self, key: bytes, user_id: int) -> None:
+        self._entries.pop(key, None)
+        self._unlink(key, user_id)
+
+    def _unlink(self, key: bytes, user_id: int) -> None:
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+
+# Shared by auth_utils (lookups) and the User model (invalidation)
+credential_cache = CredentialCache()
+
+
+def init_credential_cache(app: Flask) -> None:
+    """Size the Basic-auth cache from BASIC_AUTH_CACHE_SIZE / _TTL."""
+    credential_cache.configure(
+        max_entries=app.config.get("BASIC_AUTH_CACHE_SIZE", 1024),
+        ttl=app.config.get("BASIC_AUTH_CACHE_TTL", 300.0),
+    )
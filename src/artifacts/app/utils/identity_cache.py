@@ -0,0 +1,100 @@
+# app/utils/identity_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from flask import Flask
+
+
+class IdentityCache:
+    """Per-process LRU+TTL cache of user rows behind JWT principals.
+
+    Holds plain column snapshots (never live ORM instances, which belong to
+    one session) and the newest token version seen for each user, so tokens
+    revoked by a password or role change in this process fail immediately.
+    Other processes see the new version when their entry expires after
+    `ttl` seconds and is reloaded.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, tuple[dict, float]] = OrderedDict()
+        self._min_versions: OrderedDict[int, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, max_entries: int, ttl: float) -> None:
+        with self._lock:
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self._entries.clear()
+            self._min_versions.clear()
+            self.hits = self.misses = 0
+
+    def get(self, user_id: int) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] <= time.monotonic():
+                self._entries.pop(user_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, user_id: int, snapshot: dict) -> None:
+        with self._lock:
+            self._raise_min_version(user_id, snapshot.get("token_version"))
+            if self.max_entries <= 0:
+                return
+            self._entries[user_id] = (snapshot, time.monotonic() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int, token_version: Optional[int] = None):
+        """Drops the cached row; a `token_version` also revokes older tokens."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._raise_min_version(user_id, token_version)
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        with self._lock:
+            return token_version < self._min_versions.get(user_id, 0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _raise_min_version(self, user_id: int, token_version: Optional[int]):
+        if token_version is None:
+            return
+        if token_version > self._min_versions.get(user_id, 0):
+            self._min_versions[user_id] = token_version
+            self._min_versions.move_to_end(user_id)
+            # Best effort: only the most recently changed users are remembered
+            while len(self._min_versions) > max(self.max_entries, 1) * 4:
+                self._min_versions.popitem(last=False)
+
+
+# Shared by auth_utils (lookups) and the User model (invalidation)
+identity_cache = IdentityCache()
+
+
+def init_identity_cache(app: Flask) -> None:
+    """Size the JWT identity cache from IDENTITY_CACHE_SIZE / _TTL."""
+    identity_cache.configure(
+        max_entries=app.config.get("IDENTITY_CACHE_SIZE", 1024),
+        ttl=app.config.get("IDENTITY_CACHE_TTL", 60.0),
+    )
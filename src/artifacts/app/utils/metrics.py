@@ -0,0 +1,413 @@
+# app/utils/metrics.py
+import bisect
+import glob
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Optional
+
+from flask import Flask, Response, current_app, g, request
+from flask_restx import Api
+
+logger = logging.getLogger(__name__)
+
+# Request latency buckets in seconds; p99 is interpolated inside a bucket
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+EXPOSITION_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Metric:
+    """Base for the metric types below.
+
+    Each thread records into its own dict of cells, so the request path takes
+    no lock: only a thread's first write registers its dict. Readers copy
+    every thread's cells (atomic under the GIL) and add them up; the cells of
+    threads that have exited are folded into one retired total then, so a
+    server that keeps replacing its threads does not keep adding shards.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.reset()
+
+    def reset(self) -> None:
+        self._local = threading.local()
+        self._shards: dict[threading.Thread, dict] = {}
+        self._retired: dict = {}
+        self._shards_lock = threading.Lock()
+
+    def _cells(self) -> dict:
+        try:
+            return self._local.cells
+        except AttributeError:
+            cells = self._local.cells = {}
+            with self._shards_lock:
+                self._shards[threading.current_thread()] = cells
+            return cells
+
+    def collect(self) -> dict:
+        """Label values mapped to this process's value, summed over threads."""
+        with self._shards_lock:
+            for thread in [t for t in self._shards if not t.is_alive()]:
+                self._fold(self._retired, self._shards.pop(thread))
+            shards = [self._retired.copy(), *self._shards.values()]
+        totals = {}
+        for shard in shards:
+            self._fold(totals, shard)
+        return totals
+
+    def _fold(self, totals: dict, shard: dict) -> None:
+        for labels, value in shard.copy().items():
+            totals[labels] = self._merge(totals.get(labels), value)
+
+    @staticmethod
+    def _merge(total, value):
+        return value if total is None else total + value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        cells = self._cells()
+        cells[labels] = cells.get(labels, 0) + amount
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """Cells are [count per bucket..., count above the last, sum, count]."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, labels: tuple, value: float) -> None:
+        cells = self._cells()
+        cell = cells.get(labels)
+        if cell is None:
+            cell = cells[labels] = [0] * (len(self.buckets) + 3)
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    @staticmethod
+    def _merge(total, value):
+        value = list(value)  # Copy; the owning thread keeps writing to it
+        return value if total is None else [a + b for a, b in zip(total, value)]
+
+    def quantile(self, cell: list, q: float) -> Optional[float]:
+        """Estimates the q-quantile from bucket counts like PromQL's
+        histogram_quantile: linear within the bucket it falls in."""
+        count = cell[-1]
+        if not count:
+            return None
+        rank, seen = q * count, 0
+        for i, bucket_count in enumerate(cell[: len(self.buckets)]):
+            if seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                fraction = (rank - seen) / bucket_count if bucket_count else 0.0
+                return lower + (self.buckets[i] - lower) * fraction
+            seen += bucket_count
+        return self.buckets[-1]  # Above the largest bucket
+
+
+class MetricsRegistry:
+    """The app's metrics, with Prometheus text exposition.
+
+    Under several worker processes, set a shared `directory`: every process
+    then writes its numbers there every `flush_interval` seconds and
+    exposition adds them all up, so any worker can answer a scrape. Gauges
+    of processes that are gone are dropped; their counters are kept.
+    """
+
+    def __init__(self):
+        self.metrics: list[_Metric] = []
+        self.directory = ""
+        self.flush_interval = 5.0
+        self._flusher_pid = None
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def reset(self) -> None:
+        """Forgets this process's values, e.g. those a worker inherited."""
+        for metric in self.metrics:
+            metric.reset()
+
+    # -------------------- Multiple processes --------------------
+
+    def set_directory(self, directory: str, flush_interval: float = 5.0) -> None:
+        """Share metrics through `directory`, removing files of earlier runs."""
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "metrics-*.json")):
+            os.unlink(path)
+        self.directory = directory
+        self.flush_interval = flush_interval
+
+    def ensure_flusher(self) -> None:
+        """Starts this process's flush thread (once per process)."""
+        if not self.directory or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid != os.getpid():
+                self._flusher_pid = os.getpid()
+                threading.Thread(
+                    target=self._flush_forever, name="metrics-flush", daemon=True
+                ).start()
+
+    def _flush_forever(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError as e:
+                logger.warning(f"Could not write metrics to {self.directory}: {e}")
+
+    def flush(self) -> None:
+        """Writes this process's values to its file in `directory`."""
+        if not self.directory:
+            return
+        values = {
+            metric.name: [[list(labels), value] for labels, value in collected]
+            for metric, collected in self._collect_local()
+        }
+        path = os.path.join(self.directory, f"metrics-{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"pid": os.getpid(), "metrics": values}, f)
+        os.replace(tmp_path, path)
+
+    def _collect_local(self):
+        return [(metric, list(metric.collect().items())) for metric in self.metrics]
+
+    def _collect_files(self) -> list[tuple[int, dict]]:
+        found = []
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue  # Replaced or removed while reading
+            if data["pid"] != os.getpid():
+                found.append((data["pid"], data["metrics"]))
+        return found
+
+    def collect(self) -> list[tuple[_Metric, dict]]:
+        """Every metric with its values, over all processes when shared."""
+        collected = [(metric, dict(values)) for metric, values in self._collect_local()]
+        if not self.directory:
+            return collected
+        for pid, values in self._collect_files():
+            alive = _pid_alive(pid)
+            for metric, totals in collected:
+                if metric.kind == "gauge" and not alive:
+                    continue
+                for labels, value in values.get(metric.name, ()):
+                    labels = tuple(labels)
+                    totals[labels] = metric._merge(totals.get(labels), value)
+        return collected
+
+    # -------------------- Exposition --------------------
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text format."""
+        lines = []
+        for metric, values in self.collect():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, value in sorted(values.items()):
+                pairs = list(zip(metric.labelnames, labels))
+                if metric.kind != "histogram":
+                    lines.append(f"{metric.name}{_labels(pairs)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip((*metric.buckets, math.inf), value):
+                    cumulative += count
+                    le = _labels([*pairs, ("le", _number(bound))])
+                    lines.append(f"{metric.name}_bucket{le} {cumulative}")
+                lines.append(f"{metric.name}_sum{_labels(pairs)} {_number(value[-2])}")
+                lines.append(f"{metric.name}_count{_labels(pairs)} {value[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by someone else
+    return True
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(v))}"' for name, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+metrics = MetricsRegistry()
+
+http_requests = metrics.register(
+    Counter(
+        "http_requests_total",
+        "Requests handled, by route and status.",
+        ("namespace", "route", "method", "status"),
+    )
+)
+http_request_duration = metrics.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time from the first request hook to the response being returned.",
+        ("namespace", "route", "method"),
+    )
+)
+http_requests_in_flight = metrics.register(
+    Gauge(
+        "http_requests_in_flight",
+        "Requests currently being handled.",
+        ("namespace",),
+    )
+)
+auth_duration = metrics.register(
+    Histogram(
+        "auth_duration_seconds",
+        "Time auth_required spends authenticating and authorizing a request.",
+        ("scheme", "outcome"),
+    )
+)
+
+
+# -------------------- Request hooks --------------------
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def init_metrics(app: Flask, api: Api) -> None:
+    """Records every request and serves the metrics on METRICS_PATH.
+
+    Routes are labelled by URL rule (e.g. /users/<int:id>) and by the RESTX
+    namespace that registered them, so label sets stay bounded.
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return
+
+    # Longest first, so a namespace never matches another's prefix
+    namespaces = sorted((ns.name for ns in api.namespaces), key=len, reverse=True)
+    routes: dict[str, tuple[str, str]] = {}  # endpoint -> (namespace, route)
+
+    def route_labels() -> tuple[str, str]:
+        rule = request.url_rule
+        if rule is None:
+            return "", UNMATCHED_ROUTE
+        labels = routes.get(rule.endpoint)
+        if labels is None:
+            namespace = next(
+                (name for name in namespaces if rule.endpoint.startswith(f"{name}_")),
+                "",
+            )
+            labels = routes[rule.endpoint] = (namespace, rule.rule)
+        return labels
+
+    @app.before_request
+    def start_timer():
+        metrics.ensure_flusher()
+        namespace, route = route_labels()
+        http_requests_in_flight.inc((namespace,))
+        g.metrics_request = (time.perf_counter(), namespace, route)
+
+    @app.after_request
+    def record_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def record_request(exc):
+        started = g.pop("metrics_request", None)
+        if started is None:
+            return  # An earlier before_request hook failed
+        started, namespace, route = started
+        status = str(g.pop("metrics_status", 500))
+        http_requests_in_flight.dec((namespace,))
+        http_requests.inc((namespace, route, request.method, status))
+        http_request_duration.observe(
+            (namespace, route, request.method), time.perf_counter() - started
+        )
+
+    def metrics_view():
+        token = current_app.config.get("METRICS_TOKEN")
+        if token and request.headers.get("Authorization") != f"Bearer {token}":
+            return Response("Unauthorized\n", status=401, mimetype="text/plain")
+        return Response(metrics.exposition(), mimetype=EXPOSITION_MIMETYPE)
+
+    app.add_url_rule(
+        app.config.get("METRICS_PATH", "/metrics"), "metrics", metrics_view
+    )
+
+
+def latency_summary() -> list[dict]:
+    """p50/p90/p99 and counts per route, over all processes, slowest p99 first."""
+    summary = []
+    for metric, values in metrics.collect():
+        if metric is not http_request_duration:
+            continue
+        for (namespace, route, method), cell in values.items():
+            summary.append(
+                {
+                    "namespace": namespace,
+                    "route": route,
+                    "method": method,
+                    "count": cell[-1],
+                    "mean_ms": cell[-2] / cell[-1] * 1000 if cell[-1] else None,
+                    **{
+                        f"p{round(q * 100)}_ms": _ms(metric.quantile(cell, q))
+                        for q in (0.5, 0.9, 0.99)
+                    },
+                }
+            )
+    return sorted(summary, key=lambda row: row["p99_ms"] or 0, reverse=True)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
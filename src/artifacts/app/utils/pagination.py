@@ -0,0 +1,142 @@
+# app/utils/pagination.py
+import base64
+import binascii
+import json
+import threading
+import time
+from typing import Any, Optional
+
+from flask import current_app
+from sqlalchemy import Select, func, select, text
+
+from app.models import db
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+# Unfiltered tables at least this large report the planner's row estimate
+ESTIMATE_MIN_ROWS = 100_000
+
+_ESTIMATE_SQL = {
+    "postgresql": "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)",
+    "mysql": (
+        "SELECT table_rows FROM information_schema.tables "
+        "WHERE table_schema = DATABASE() AND table_name = :t"
+    ),
+}
+
+
+def clamp_per_page(per_page: Optional[int]) -> int:
+    return min(max(per_page or DEFAULT_PER_PAGE, 1), MAX_PER_PAGE)
+
+
+def encode_cursor(last_key: int) -> str:
+    """Opaque cursor pointing just past `last_key`."""
+    raw = json.dumps({"k": last_key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Raises ValueError for anything `encode_cursor` did not produce."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded))["k"]
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(key, int):
+        raise ValueError("Invalid pagination cursor")
+    return key
+
+
+def keyset_page(
+    query: Select, key_column, per_page: int, after: Optional[int] = None
+) -> tuple[list, Optional[str]]:
+    """One page of rows ordered by `key_column`, strictly after `after`.
+
+    Seeks on the key index instead of skipping rows, so every page costs the
+    same no matter how deep it is. Returns (rows, next_cursor).
+    """
+    if after is not None:
+        query = query.where(key_column > after)
+    rows = db.session.scalars(query.order_by(key_column).limit(per_page + 1)).all()
+    if len(rows) <= per_page:
+        return rows, None
+    rows = rows[:per_page]
+    return rows, encode_cursor(getattr(rows[-1], key_column.key))
+
+
+def offset_page(query: Select, model, key_column, page: int, per_page: int) -> list:
+    """Classic page/per_page rows, via a deferred join.
+
+    The OFFSET only walks the key index; full rows are fetched for the
+    page's keys alone.
+    """
+    keys = (
+        query.with_only_columns(key_column)
+        .order_by(key_column)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .subquery()
+    )
+    return db.session.scalars(
+        select(model)
+        .join(keys, key_column == keys.c[key_column.key])
+        .order_by(key_column)
+    ).all()
+
+
+class CountCache:
+    """Short-lived cache of row counts per filter set.
+
+    Unfiltered counts of large PostgreSQL/MySQL tables come from the
+    catalog's estimate instead of a full COUNT(*).
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: dict[Any, tuple[int, bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def count(
+        self, query: Select, table_name: str, filters_key: tuple
+    ) -> tuple[int, bool]:
+        """Returns (total, is_estimate) for the rows `query` selects."""
+        ttl = current_app.config.get("COUNT_CACHE_TTL", 30.0)
+        cache_key = (table_name, filters_key)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(cache_key)
+        if cached is not None and cached[2] > now:
+            return cached[0], cached[1]
+
+        total, is_estimate = None, False
+        if not filters_key:
+            total = self._estimate(table_name)
+            is_estimate = total is not None
+        if total is None:
+            total = db.session.scalar(
+                select(func.count()).select_from(query.order_by(None).subquery())
+            )
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()  # Cheap reset; entries expire quickly anyway
+            self._entries[cache_key] = (total, is_estimate, now + ttl)
+        return total, is_estimate
+
+    def invalidate(self, table_name: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == table_name]:
+                del self._entries[key]
+
+    @staticmethod
+    def _estimate(table_name: str) -> Optional[int]:
+        sql = _ESTIMATE_SQL.get(db.session.get_bind().dialect.name)
+        if sql is None:
+            return None
+        estimate = db.session.execute(text(sql), {"t": table_name}).scalar()
+        if estimate is None or estimate < ESTIMATE_MIN_ROWS:
+            return None
+        return int(estimate)
+
+
+count_cache = CountCache()
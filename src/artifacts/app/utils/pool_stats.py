@@ -0,0 +1,84 @@
+# app/utils/pool_stats.py
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class PoolMonitor:
+    """Counts connection-pool events per engine and reports saturation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: dict[str, Engine] = {}
+        self._counters: dict[str, dict] = {}
+
+    def attach(self, name: str, engine: Engine) -> None:
+        counters = {
+            "connects": 0,
+            "checkouts": 0,
+            "invalidations": 0,
+            "peak_checked_out": 0,
+        }
+        with self._lock:
+            self._engines[name] = engine
+            self._counters[name] = counters
+        pool = engine.pool
+
+        def on_connect(*args):
+            with self._lock:
+                counters["connects"] += 1
+
+        def on_checkout(*args):
+            # engine.dispose() swaps in a new pool that keeps these listeners,
+            # so count the engine's current pool, not the one attached to
+            checked_out = _call(engine.pool, "checkedout")
+            with self._lock:
+                counters["checkouts"] += 1
+                if (
+                    checked_out is not None
+                    and checked_out > counters["peak_checked_out"]
+                ):
+                    counters["peak_checked_out"] = checked_out
+
+        def on_invalidate(*args):
+            with self._lock:
+                counters["invalidations"] += 1
+
+        event.listen(pool, "connect", on_connect)
+        event.listen(pool, "checkout", on_checkout)
+        event.listen(pool, "invalidate", on_invalidate)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            engines = dict(self._engines)
+            counters = {name: dict(values) for name, values in self._counters.items()}
+        return {
+            name: {**_pool_state(engine.pool), **counters[name]}
+            for name, engine in engines.items()
+        }
+
+
+def _call(pool, method: str):
+    func = getattr(pool, method, None)
+    return func() if callable(func) else None
+
+
+def _pool_state(pool) -> dict:
+    size = _call(pool, "size")
+    checked_out = _call(pool, "checkedout")
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    capacity = (size or 0) + max(max_overflow, 0)
+    return {
+        "pool": type(pool).__name__,
+        "size": size,
+        "max_overflow": max_overflow,
+        "timeout": getattr(pool, "_timeout", None),
+        "checked_in": _call(pool, "checkedin"),
+        "checked_out": checked_out,
+        "overflow": _call(pool, "overflow"),
+        "saturation": (checked_out / capacity) if capacity and checked_out else 0.0,
+    }
+
+
+pool_monitor = PoolMonitor()
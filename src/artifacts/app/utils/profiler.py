@@ -0,0 +1,277 @@
+# app/utils/profiler.py
+import cProfile
+import glob
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from flask import Flask, g, request
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("sampling", "cprofile")
+OUTPUT_SUFFIX = {"sampling": ".collapsed", "cprofile": ".pstats"}
+
+
+# -------------------- Backends --------------------
+
+
+class StackSampler:
+    """Samples one thread's Python stack every `interval` seconds from a
+    helper thread; the profiled thread itself runs untouched.
+
+    Output is in the collapsed-stack format flame graph tools read: one
+    `outer;inner;leaf count` line per distinct stack.
+    """
+
+    suffix = OUTPUT_SUFFIX["sampling"]
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="profile-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                name = getattr(code, "co_qualname", code.co_name)
+                stack.append(f"{os.path.basename(code.co_filename)}:{name}")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class DeterministicProfiler:
+    """cProfile over the request thread, saved in pstats format
+    (`python -m pstats <file>`, snakeviz, ...). Exact call counts, but it
+    slows the profiled request down noticeably."""
+
+    suffix = OUTPUT_SUFFIX["cprofile"]
+
+    def __init__(self, interval: float):
+        self._profile = cProfile.Profile()
+        self.sample_count = None
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def write(self, path: str) -> None:
+        self._profile.dump_stats(path)
+
+
+# -------------------- Trigger header --------------------
+
+
+def sign_trigger(secret: str, path: str, ttl: int = 300) -> str:
+    """A trigger header value that profiles requests to `path` for `ttl`
+    seconds: `<expires>.<hmac>`."""
+    expires = int(time.time()) + ttl
+    return f"{expires}.{_signature(secret, expires, path)}"
+
+
+def _signature(secret: str, expires: int, path: str) -> str:
+    message = f"{expires}:{path}".encode("utf-8")
+    return hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def verify_trigger(secret: str, value: str, path: str) -> bool:
+    expires, _, signature = value.partition(".")
+    try:
+        if int(expires) < time.time():
+            return False
+    except ValueError:
+        return False
+    return hmac.compare_digest(signature, _signature(secret, int(expires), path))
+
+
+# -------------------- Request hook --------------------
+
+
+class RequestProfiler:
+    """Profiles a random PROFILE_SAMPLE_RATE of requests, plus any request
+    carrying a valid signed PROFILE_HEADER, into a ring of the last
+    PROFILE_MAX_FILES profiles in PROFILE_DIR (shared by all workers).
+
+    Each profile is a backend output file and a `.json` summary with the
+    same id. Requests that are not profiled pay one random() call.
+    """
+
+    def __init__(self):
+        self.directory = ""
+        self.sample_rate = 0.0
+        self.secret = ""
+        self.header = "X-Profile"
+        self.backend = "sampling"
+        self.interval = 0.005
+        self.max_files = 50
+        self._ids = itertools.count()
+        self._trim_lock = threading.Lock()
+
+    def configure(self, app: Flask) -> None:
+        backend = app.config.get("PROFILE_BACKEND", "sampling")
+        if backend not in BACKENDS:
+            raise ValueError(f"PROFILE_BACKEND must be one of {BACKENDS}")
+        self.directory = app.config.get("PROFILE_DIR") or os.path.join(
+            app.instance_path, "profiles"
+        )
+        self.sample_rate = app.config.get("PROFILE_SAMPLE_RATE", 0.0)
+        self.secret = app.config.get("PROFILE_TRIGGER_SECRET", "")
+        self.header = app.config.get("PROFILE_HEADER", "X-Profile")
+        self.backend = backend
+        self.interval = app.config.get("PROFILE_INTERVAL_MS", 5) / 1000
+        self.max_files = app.config.get("PROFILE_MAX_FILES", 50)
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or bool(self.secret)
+
+    def _wanted(self) -> Optional[str]:
+        """Why this request should be profiled, or None."""
+        if self.secret:
+            value = request.headers.get(self.header)
+            if value and verify_trigger(self.secret, value, request.path):
+                return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def start(self) -> None:
+        reason = self._wanted()
+        if reason is None:
+            return
+        backend_class = (
+            StackSampler if self.backend == "sampling" else DeterministicProfiler
+        )
+        backend = backend_class(self.interval)
+        try:
+            backend.start()
+        except ValueError as e:  # e.g. another profiler is active
+            logger.warning(f"Could not start the {self.backend} profiler: {e}")
+            return
+        profile_id = f"{time.time_ns() // 1_000_000}-{os.getpid()}-{next(self._ids)}"
+        g.profile = (backend, profile_id, reason, time.perf_counter())
+
+    def add_header(self, response):
+        profile = g.get("profile")
+        if profile is not None:
+            response.headers[f"{self.header}-Id"] = profile[1]
+            g.profile_status = response.status_code
+        return response
+
+    def finish(self, exc) -> None:
+        profile = g.pop("profile", None)
+        if profile is None:
+            return
+        backend, profile_id, reason, started = profile
+        backend.stop()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        rule = request.url_rule
+        summary = {
+            "id": profile_id,
+            "backend": self.backend,
+            "reason": reason,
+            "method": request.method,
+            "path": request.path,
+            "route": rule.rule if rule else None,
+            "status": g.pop("profile_status", 500),
+            "duration_ms": round(elapsed_ms, 3),
+            "samples": backend.sample_count,
+            "file": profile_id + backend.suffix,
+            "created": time.time(),
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            backend.write(os.path.join(self.directory, summary["file"]))
+            with open(os.path.join(self.directory, f"{profile_id}.json"), "w") as f:
+                json.dump(summary, f)
+            self._trim()
+        except OSError as e:
+            logger.warning(f"Could not save profile {profile_id}: {e}")
+
+    def _trim(self) -> None:
+        """Drops the oldest profiles beyond max_files."""
+        with self._trim_lock:
+            summaries = sorted(glob.glob(os.path.join(self.directory, "*.json")))
+            for path in summaries[: max(len(summaries) - self.max_files, 0)]:
+                stem = path[: -len(".json")]
+                for suffix in (".json", *OUTPUT_SUFFIX.values()):
+                    try:
+                        os.unlink(stem + suffix)
+                    except FileNotFoundError:
+                        pass  # Never written, or trimmed by another worker
+
+    def entries(self) -> list[dict]:
+        """Summaries of the stored profiles, newest first."""
+        profiles = []
+        for path in glob.glob(os.path.join(self.directory, "*.json")):
+            try:
+                with open(path) as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue  # Trimmed or still being written
+        return sorted(profiles, key=lambda p: p["created"], reverse=True)
+
+    def path_for(self, file_name: str) -> Optional[str]:
+        """Path of a stored profile output file, if `file_name` is one."""
+        stem, dot, suffix = file_name.rpartition(".")
+        if not dot or f".{suffix}" not in OUTPUT_SUFFIX.values():
+            return None
+        if not stem.replace("-", "").isdigit():
+            return None  # Only ids this class generates; no path tricks
+        path = os.path.join(self.directory, file_name)
+        return path if os.path.exists(path) else None
+
+
+request_profiler = RequestProfiler()
+
+
+def init_profiler(app: Flask) -> None:
+    """Install the profiling hooks when PROFILE_SAMPLE_RATE or
+    PROFILE_TRIGGER_SECRET is set; otherwise requests are not touched."""
+    request_profiler.configure(app)
+    if not request_profiler.enabled:
+        return
+    app.before_request(request_profiler.start)
+    app.after_request(request_profiler.add_header)
+    app.teardown_request(request_profiler.finish)
+    logger.info(
+        f"Profiling {request_profiler.sample_rate:.2%} of requests"
+        f"{' and signed triggers' if request_profiler.secret else ''} "
+        f"({request_profiler.backend}) into {request_profiler.directory}"
+    )
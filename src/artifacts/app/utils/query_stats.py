@@ -0,0 +1,188 @@
+# app/utils/query_stats.py
+import functools
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.metrics import Counter as MetricCounter
+from app.utils.metrics import Histogram, metrics
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Statement shapes kept for /ops/queries; later new shapes are not tracked
+MAX_SHAPES = 500
+
+db_queries_per_request = metrics.register(
+    Histogram(
+        "db_queries_per_request",
+        "SQL statements issued per request.",
+        ("route", "method"),
+        buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+    )
+)
+db_time_per_request = metrics.register(
+    Histogram(
+        "db_time_per_request_seconds",
+        "Time spent in SQL statements per request.",
+        ("route", "method"),
+    )
+)
+db_n_plus_one_requests = metrics.register(
+    MetricCounter(
+        "db_n_plus_one_requests_total",
+        "Requests that repeated one statement shape SQL_N_PLUS_ONE_THRESHOLD+ times.",
+        ("route", "method"),
+    )
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def statement_shape(statement: str) -> str:
+    """`statement` with whitespace collapsed and IN lists of any length folded
+    to `(?)`, so repeats with other values or list sizes share one shape."""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestQueries:
+    """Statements issued while handling one request."""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Shapes run at least `threshold` times: N+1 candidates."""
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+
+class QueryStats:
+    """Times every statement on the attached engines.
+
+    Per request: count, DB time and repeated shapes, sent back as X-Query-*
+    headers with SQL_QUERY_HEADERS (dev) and always aggregated into the
+    db_* metrics. Per process: totals per statement shape. Statements slower
+    than SQL_SLOW_QUERY_MS are logged wherever they run.
+    """
+
+    def __init__(self):
+        self.slow_seconds = 0.2
+        self.log_parameters = True
+        self.n_plus_one_threshold = 5
+        self.headers = False
+        self._shapes: dict[str, list] = {}  # shape -> [count, seconds, max]
+        self._lock = threading.Lock()
+
+    def configure(self, app: Flask) -> None:
+        self.slow_seconds = app.config.get("SQL_SLOW_QUERY_MS", 200) / 1000
+        self.log_parameters = app.config.get("SQL_LOG_PARAMETERS", True)
+        self.n_plus_one_threshold = app.config.get("SQL_N_PLUS_ONE_THRESHOLD", 5)
+        self.headers = app.config.get("SQL_QUERY_HEADERS", False)
+
+    def init_app(self, app: Flask) -> None:
+        self.configure(app)
+        app.after_request(self._add_headers)
+        app.teardown_request(self._finish_request)
+
+    def attach(self, engine: Engine) -> None:
+        if event.contains(engine, "after_cursor_execute", self._after_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    # -------------------- Engine events --------------------
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        shape = statement_shape(statement)
+
+        if has_request_context():
+            queries = g.get("request_queries")
+            if queries is None:
+                queries = g.request_queries = RequestQueries()
+            queries.count += 1
+            queries.seconds += elapsed
+            queries.shapes[shape] += 1
+
+        with self._lock:
+            totals = self._shapes.get(shape)
+            if totals is None and len(self._shapes) < MAX_SHAPES:
+                totals = self._shapes[shape] = [0, 0.0, 0.0]
+            if totals is not None:
+                totals[0] += 1
+                totals[1] += elapsed
+                totals[2] = max(totals[2], elapsed)
+
+        if elapsed >= self.slow_seconds:
+            params = f" {_truncate(repr(parameters))}" if self.log_parameters else ""
+            logger.warning(f"Slow query ({elapsed * 1000:.1f}ms): {shape}{params}")
+
+    # -------------------- Request hooks --------------------
+
+    def _add_headers(self, response):
+        if not self.headers:
+            return response
+        queries = g.get("request_queries") or RequestQueries()
+        response.headers["X-Query-Count"] = str(queries.count)
+        response.headers["X-Query-Time-Ms"] = f"{queries.seconds * 1000:.2f}"
+        repeated = queries.repeated(self.n_plus_one_threshold)
+        if repeated:
+            response.headers["X-Query-N-Plus-One"] = str(len(repeated))
+        return response
+
+    def _finish_request(self, exc):
+        queries = g.pop("request_queries", None) or RequestQueries()
+        rule = request.url_rule
+        labels = (rule.rule if rule else "<unmatched>", request.method)
+        db_queries_per_request.observe(labels, queries.count)
+        db_time_per_request.observe(labels, queries.seconds)
+
+        repeated = queries.repeated(self.n_plus_one_threshold)
+        if repeated:
+            db_n_plus_one_requests.inc(labels)
+            if self.headers:
+                for shape, n in repeated.items():
+                    logger.warning(
+                        f"Possible N+1 in {labels[1]} {labels[0]}: {n}x {shape}"
+                    )
+
+    # -------------------- Reporting --------------------
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> list[dict]:
+        """This process's statement shapes, most expensive first."""
+        with self._lock:
+            shapes = {shape: list(totals) for shape, totals in self._shapes.items()}
+        rows = [
+            {
+                "statement": shape,
+                "count": count,
+                "total_ms": seconds * 1000,
+                "mean_ms": seconds / count * 1000,
+                "max_ms": longest * 1000,
+            }
+            for shape, (count, seconds, longest) in shapes.items()
+        ]
+        return sorted(rows, key=lambda row: row[order_by], reverse=True)[:limit]
+
+
+def _truncate(text: str, limit: int = 500) -> str:
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+# Shared by bind_app (sync engines) and the async engine, if any
+query_stats = QueryStats()
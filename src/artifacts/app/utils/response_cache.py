@@ -0,0 +1,292 @@
+# app/utils/response_cache.py
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any, NamedTuple, Optional
+
+from flask import Flask, current_app, g, request
+from flask_restx.utils import unpack
+from sqlalchemy import event
+from werkzeug.wrappers import Response
+
+from app.utils.aio import handler_wrapper
+
+SAFE_METHODS = ("GET", "HEAD")
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    mimetype: str
+    body: bytes
+
+    def pack(self) -> bytes:
+        return f"{self.etag}\n{self.mimetype}\n".encode("utf-8") + self.body
+
+    @classmethod
+    def unpack(cls, raw: bytes) -> "CachedResponse":
+        etag, mimetype, body = raw.split(b"\n", 2)
+        return cls(etag.decode("utf-8"), mimetype.decode("utf-8"), body)
+
+
+class MemoryBackend:
+    """Per-process LRU+TTL store. Generations (and so invalidations) are only
+    seen by the process that bumped them; use Redis with several workers."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, key: str) -> int:
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def bump(self, key: str) -> None:
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+
+class RedisBackend:
+    """Shared store on anything speaking the Redis protocol.
+
+    `client` needs get/set(ex=)/incr, e.g. `redis.Redis` or a stand-in such
+    as `fakeredis.FakeRedis` in tests. Generations live in Redis too, so a
+    write in one worker invalidates the cache for all of them.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        import redis  # Optional dependency, only needed for redis:// URLs
+
+        return cls(redis.Redis.from_url(url, socket_timeout=1.0))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(key, value, ex=max(int(ttl), 1))
+
+    def generation(self, key: str) -> int:
+        return int(self.client.get(key) or 0)
+
+    def bump(self, key: str) -> None:
+        self.client.incr(key)
+
+
+class ResponseCache:
+    """Marshalled GET responses keyed by resource generation.
+
+    Each resource (by convention a table name) has a generation counter that
+    is part of every key; invalidating the resource bumps it, so every cached
+    page of it is dropped at once without scanning keys.
+    """
+
+    def __init__(self, backend=None, ttl: float = 60.0, prefix: str = "respcache"):
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def configure(self, backend, ttl: float) -> None:
+        with self._lock:
+            self.backend = backend
+            self.ttl = ttl
+            self.hits = self.misses = 0
+
+    def key(self, resource: str, variant: str) -> Optional[str]:
+        """The cache key for `variant` of `resource`, or None when disabled."""
+        if self.backend is None:
+            return None
+        generation = self.backend.generation(f"{self.prefix}:gen:{resource}")
+        digest = hashlib.sha256(variant.encode("utf-8")).hexdigest()[:32]
+        return f"{self.prefix}:{resource}:{generation}:{digest}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raw = self.backend.get(key)
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return CachedResponse.unpack(raw)
+
+    def set(self, key: str, entry: CachedResponse, ttl: float) -> None:
+        self.backend.set(key, entry.pack(), ttl)
+
+    def invalidate(self, resource: str) -> None:
+        if self.backend is not None:
+            self.backend.bump(f"{self.prefix}:gen:{resource}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__ if self.backend else None,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared by the cached() decorator and the session write tracking below
+response_cache = ResponseCache()
+
+
+def init_response_cache(app: Flask) -> None:
+    """Pick the backend from RESPONSE_CACHE_URL: "memory", redis://... or ""
+    (ETags and 304s only)."""
+    url = app.config.get("RESPONSE_CACHE_URL", "memory")
+    if not url:
+        backend = None
+    elif url == "memory":
+        workers = app.config.get("WEB_CONCURRENCY", 1)
+        if workers > 1 and not (app.debug or app.testing):
+            logger.warning(
+                "RESPONSE_CACHE_URL=memory with several workers: writes only "
+                "invalidate the worker that made them; use a redis:// URL"
+            )
+        backend = MemoryBackend(app.config.get("RESPONSE_CACHE_SIZE", 1024))
+    else:
+        backend = RedisBackend.from_url(url)
+    response_cache.configure(backend, app.config.get("RESPONSE_CACHE_TTL", 60.0))
+
+
+# -------------------- Invalidation on commit --------------------
+
+
+def track_writes(session) -> None:
+    """Invalidate the resource named after every table a committed
+    transaction wrote to, through the ORM or ORM-enabled bulk statements."""
+    if event.contains(session, "after_commit", _invalidate_written):
+        return
+    event.listen(session, "after_flush", _record_flush)
+    event.listen(session, "do_orm_execute", _record_bulk_write)
+    event.listen(session, "after_commit", _invalidate_written)
+    event.listen(session, "after_rollback", _forget_written)
+
+
+def _written(session) -> set:
+    return session.info.setdefault("response_cache_tables", set())
+
+
+def _record_flush(session, flush_context) -> None:
+    written = _written(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            written.add(table.name)
+
+
+def _record_bulk_write(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            _written(state.session).add(table.name)
+
+
+def _invalidate_written(session) -> None:
+    for table_name in session.info.pop("response_cache_tables", ()):
+        response_cache.invalidate(table_name)
+
+
+def _forget_written(session) -> None:
+    session.info.pop("response_cache_tables", None)
+
+
+# -------------------- Decorator --------------------
+
+
+def _as_response(result: Any, args: tuple) -> Response:
+    """Renders a handler's return value the way RESTX would."""
+    if isinstance(result, Response):
+        return result
+    data, code, headers = unpack(result)
+    api = getattr(args[0], "api", None) if args else None
+    if api is not None:
+        return api.make_response(data, code, headers=headers)
+    return current_app.make_response((data, code, headers))
+
+
+def _variant(per_user: bool) -> str:
+    query = sorted(request.args.items(multi=True))
+    variant = f"{request.path}?{query}"
+    if per_user:
+        principal = g.get("principal")
+        variant += f"#{principal.user_id if principal else ''}"
+    return variant
+
+
+def cached(resource: str, ttl: Optional[float] = None, per_user: bool = False):
+    """Strong ETags and 304s for GET, plus an optional response cache.
+
+    GET/HEAD responses with status 200 get an ETag of their body and
+    If-None-Match is answered with 304. With a backend configured and a
+    positive `ttl` (default RESPONSE_CACHE_TTL) the rendered body is cached
+    per path and query string (and caller with `per_user`), skipping the
+    handler entirely on a hit. Successful writes through a decorated handler
+    invalidate `resource`; so does any commit touching the table of that name.
+
+    Apply it below auth_required so authorization runs on every request.
+    Works on sync and async handlers.
+    """
+
+    def decorator(func):
+        def flow(*args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                response = _as_response((yield), args)
+                if response.status_code < HTTPStatus.BAD_REQUEST:
+                    response_cache.invalidate(resource)
+                return response
+
+            lifetime = response_cache.ttl if ttl is None else ttl
+            key = response_cache.key(resource, _variant(per_user)) if lifetime else None
+            entry = response_cache.get(key) if key else None
+            if entry is None:
+                response = _as_response((yield), args)
+                if response.status_code != HTTPStatus.OK or response.is_streamed:
+                    return response
+                body = response.get_data()
+                entry = CachedResponse(
+                    hashlib.sha256(body).hexdigest()[:32], response.mimetype, body
+                )
+                if key:
+                    response_cache.set(key, entry, lifetime)
+            else:
+                response = current_app.response_class(
+                    entry.body, mimetype=entry.mimetype
+                )
+
+            response.set_etag(entry.etag)
+            return response.make_conditional(request)
+
+        return handler_wrapper(func, flow)
+
+    return decorator
@@ -0,0 +1,293 @@
+# app/utils/user_transfer.py
+import codecs
+import csv
+import io
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from sqlalchemy import Select, insert, select, update
+
+from app.commands.seed import hash_passwords
+from app.models import db
+from app.models.users import User, UserRole, expire_auth_on_commit
+from app.utils.pagination import count_cache
+
+EXPORT_COLUMNS = ("id", "full_name", "username", "email", "role")
+IMPORT_FIELDS = ("full_name", "username", "email", "role")
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+IMPORT_MODES = ("insert", "upsert")
+EXPORT_BATCH_SIZE = 1000
+READ_CHUNK_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------- Export --------------------
+
+
+def export_users(query: Select, fmt: str) -> Iterator[str]:
+    """Streams the users `query` selects as NDJSON lines or CSV rows.
+
+    Rows come through a server-side cursor in batches of EXPORT_BATCH_SIZE
+    and only the exported columns are loaded (never ORM objects or password
+    hashes), so memory stays flat however large the table is.
+    """
+    columns = [getattr(User, name) for name in EXPORT_COLUMNS]
+    statement = (
+        query.with_only_columns(*columns)
+        .order_by(User.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    encode = _csv_encoder() if fmt == "csv" else _ndjson_encoder()
+    if fmt == "csv":
+        yield ",".join(EXPORT_COLUMNS) + "\r\n"
+    for rows in db.session.execute(statement).partitions():
+        yield encode(rows)
+
+
+def _ndjson_encoder():
+    def encode(rows: Iterable) -> str:
+        return "".join(
+            json.dumps(
+                {
+                    "id": row.id,
+                    "full_name": row.full_name,
+                    "username": row.username,
+                    "email": row.email,
+                    "role": row.role.value,
+                },
+                separators=(",", ":"),
+            )
+            + "\n"
+            for row in rows
+        )
+
+    return encode
+
+
+def _csv_encoder():
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode(rows: Iterable) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            (row.id, row.full_name, row.username, row.email, row.role.value)
+            for row in rows
+        )
+        return buffer.getvalue()
+
+    return encode
+
+
+# -------------------- Import --------------------
+
+
+def iter_text_lines(stream, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """Decodes a binary stream into lines, one chunk at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while chunk := stream.read(chunk_size):
+        lines = (pending + decoder.decode(chunk)).splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def detect_format(mimetype: str | None, filename: str | None = None) -> str:
+    """csv for text/csv or *.csv uploads, ndjson otherwise."""
+    if mimetype == FORMATS["csv"] or (filename or "").lower().endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+
+def parse_records(lines: Iterable[str], fmt: str) -> Iterator[tuple[int, Any]]:
+    """Yields (line_number, record) pairs; the record is a ValueError when the
+    line could not be parsed."""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("expected a JSON object")
+            yield line_number, record
+        except ValueError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e}")
+
+
+def _validate(record: dict) -> dict:
+    missing = [field for field in IMPORT_FIELDS if not record.get(field)]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    row = {field: str(record[field]).strip() for field in IMPORT_FIELDS}
+    row["role"] = UserRole(row["role"])
+    if record.get("password"):
+        row["password"] = str(record["password"])
+    return row
+
+
+class UserImporter:
+    """Writes parsed records in batches and reports per-row results.
+
+    Each batch is one transaction: a single query finds the usernames that
+    already exist, then new users go in as one multi-row INSERT and (with
+    mode="upsert") existing ones are updated by primary key in bulk.
+    """
+
+    def __init__(
+        self,
+        mode: str = "insert",
+        batch_size: int = 500,
+        hash_workers: int | None = 1,
+    ):
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"mode must be one of {', '.join(IMPORT_MODES)}")
+        self.mode = mode
+        self.batch_size = max(batch_size, 1)
+        # 1 hashes in-process: the import route runs inside a server worker,
+        # where forking a pool per batch costs more than it saves. None
+        # hashes across a process per CPU, like the seed command.
+        self.hash_workers = hash_workers
+        self.stats = {"processed": 0, "inserted": 0, "updated": 0, "failed": 0}
+
+    def run(self, records: Iterable[tuple[int, Any]]) -> Iterator[dict]:
+        """Yields an event per failed row, a progress event per batch and a
+        final summary."""
+        batch = {}
+        for line_number, record in records:
+            self.stats["processed"] += 1
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                row = _validate(record)
+                if row["username"] in batch:
+                    raise ValueError(f"duplicate username {row['username']!r}")
+            except ValueError as e:
+                yield self._failed(line_number, e)
+                continue
+            batch[row["username"]] = (line_number, row)
+            if len(batch) >= self.batch_size:
+                yield from self._flush(batch)
+                batch = {}
+        if batch:
+            yield from self._flush(batch)
+        yield {"event": "done", **self.stats}
+
+    def _failed(self, line_number: int, error: Exception) -> dict:
+        self.stats["failed"] += 1
+        return {"event": "error", "line": line_number, "error": str(error)}
+
+    def _flush(self, batch: dict[str, tuple[int, dict]]) -> Iterator[dict]:
+        existing = {
+            row.username: row
+            for row in db.session.execute(
+                select(User.username, User.id, User.role, User.password).where(
+                    User.username.in_(batch)
+                )
+            )
+        }
+        inserts, updates, errors = [], [], []
+        for username, (line_number, row) in batch.items():
+            if username not in existing:
+                if "password" not in row:
+                    errors.append((line_number, "password is required for new users"))
+                else:
+                    inserts.append(row)
+            elif self.mode == "upsert":
+                updates.append(
+                    (existing[username], {"id": existing[username].id, **row})
+                )
+            else:
+                errors.append((line_number, f"user {username!r} already exists"))
+
+        try:
+            self._write(inserts, updates)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            # Database errors can echo row parameters, so only the type goes out
+            logger.exception("User import batch failed")
+            errors = [
+                (line_number, f"batch failed: {type(e).__name__}")
+                for line_number, _ in batch.values()
+            ]
+            inserts, updates = [], []
+
+        for line_number, message in sorted(errors):
+            yield self._failed(line_number, ValueError(message))
+        self.stats["inserted"] += len(inserts)
+        self.stats["updated"] += len(updates)
+        yield {"event": "progress", **self.stats}
+
+    def _write(self, inserts: list[dict], updates: list[tuple[Any, dict]]) -> None:
+        """`updates` pairs each row with the user's current (id, role,
+        password); passwords that already match their hash are left alone."""
+        hashed = [*inserts, *(row for _, row in updates if "password" in row)]
+        if hashed:
+            current = [None] * len(inserts) + [
+                user.password for user, row in updates if "password" in row
+            ]
+            hashes = hash_passwords(
+                [row["password"] for row in hashed],
+                self.hash_workers,
+                None,
+                reuse_hashes=False,
+                current_hashes=current,
+            )
+            for row, password_hash in zip(hashed, hashes):
+                row["password"] = password_hash
+
+        if inserts:
+            db.session.execute(insert(User), inserts)
+            count_cache.invalidate(User.__tablename__)
+        if updates:
+            revoked = []
+            for user, row in updates:
+                if row.get("password") == user.password:
+                    del row["password"]
+                if "password" in row or row["role"] != user.role:
+                    revoked.append(user.id)
+            db.session.execute(update(User), [row for _, row in updates])
+            self._revoke([user.id for user, _ in updates], revoked)
+
+    @staticmethod
+    def _revoke(user_ids: list[int], revoked: list[int]) -> None:
+        """Bulk updates skip User.update_user_*; expire cached auth the same
+        way. Password and role changes bump token_version, revoking the
+        user's JWTs once the batch commits."""
+        versions = {}
+        if revoked:
+            statement = (
+                update(User)
+                .where(User.id.in_(revoked))
+                .values(token_version=User.token_version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if db.session.get_bind().dialect.update_returning:
+                versions = dict(
+                    db.session.execute(
+                        statement.returning(User.id, User.token_version)
+                    ).all()
+                )
+            else:  # e.g. MySQL: read the new versions back in the same transaction
+                db.session.execute(statement)
+                versions = dict(
+                    db.session.execute(
+                        select(User.id, User.token_version).where(User.id.in_(revoked))
+                    ).all()
+                )
+        for user_id in user_ids:
+            expire_auth_on_commit(
+                user_id, versions.get(user_id), credentials=user_id in versions
+            )
@@ -0,0 +1,12 @@
+# app/api/health_schema.py
+from flask_restx import fields
+from app.api.base_schema import BaseSchemaAPIModel
+
+
+class HealthSchema(BaseSchemaAPIModel):
+    __modelname__ = "Health"
+
+    status = fields.String(required=True, description="ok or degraded")
+    database = fields.Boolean(required=True, description="Database reachable")
+    cache = fields.Boolean(description="Response cache reachable (null: disabled)")
+    elapsed_ms = fields.Float(required=True, description="Time spent checking")
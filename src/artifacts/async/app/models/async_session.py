@@ -0,0 +1,110 @@
+# app/models/async_session.py
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from flask import Flask, current_app
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+
+from app.utils.query_stats import query_stats
+from app.utils.response_cache import track_writes
+
+# Backend -> asyncio driver used when ASYNC_DATABASE_URI is not set
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "mysql": "aiomysql",
+    "postgresql": "asyncpg",
+}
+
+
+class TrackedSession(Session):
+    """Sync session behind every AsyncSession; its commits invalidate cached
+    responses just like `db.session` commits do."""
+
+
+track_writes(TrackedSession)
+
+
+def async_database_uri(database_uri: str) -> str:
+    """`database_uri` with its driver swapped for the backend's asyncio one."""
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"No asyncio driver known for {backend!r}; "
+            "set ASYNC_DATABASE_URI (env ASYNC_DATABASE_URL)"
+        )
+    url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url.render_as_string(hide_password=False)
+
+
+class AsyncDatabase:
+    """Async engine and sessions next to `db`, for `async def` views.
+
+    Created per app on first use, from ASYNC_DATABASE_URI (or the app's
+    database through its asyncio driver) with the same pool sizing as `db`.
+    Async views all run on one event loop (app.utils.aio), so its pooled
+    connections are reused across requests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def _state(self, app: Flask) -> dict:
+        state = app.extensions.get("async_db")
+        if state is None or state["pid"] != os.getpid():
+            with self._lock:
+                state = app.extensions.get("async_db")
+                if state is None or state["pid"] != os.getpid():
+                    if state is not None:
+                        # Forked: the parent's connections are not ours to close
+                        state["engine"].sync_engine.dispose(close=False)
+                    state = app.extensions["async_db"] = self._create(app)
+        return state
+
+    def _create(self, app: Flask) -> dict:
+        uri = app.config.get("ASYNC_DATABASE_URI") or async_database_uri(
+            app.config["SQLALCHEMY_DATABASE_URI"]
+        )
+        options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+        # Driver-specific; e.g. asyncpg takes server_settings, not options
+        options.pop("connect_args", None)
+        engine = create_async_engine(uri, **options)
+        query_stats.attach(engine.sync_engine)
+        sessionmaker = async_sessionmaker(
+            engine, expire_on_commit=False, sync_session_class=TrackedSession
+        )
+        return {"pid": os.getpid(), "engine": engine, "sessionmaker": sessionmaker}
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._state(current_app._get_current_object())["engine"]
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """An AsyncSession for this block, closed (and rolled back unless
+        committed) on exit:
+
+            async with async_db.session() as session:
+                users = (await session.scalars(select(User))).all()
+        """
+        sessionmaker = self._state(current_app._get_current_object())["sessionmaker"]
+        async with sessionmaker() as session:
+            yield session
+
+    async def dispose(self) -> None:
+        """Closes the pooled connections, e.g. on ASGI lifespan shutdown."""
+        state = current_app.extensions.pop("async_db", None)
+        if state is not None and state["pid"] == os.getpid():
+            await state["engine"].dispose()
+
+
+async_db = AsyncDatabase()
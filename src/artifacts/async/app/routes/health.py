@@ -0,0 +1,61 @@
+# app/routes/health.py
+import asyncio
+import time
+from http import HTTPStatus
+from typing import Optional
+
+from flask import current_app
+from flask_restx import Namespace
+from sqlalchemy import text
+
+from app.api.health_schema import HealthSchema
+from app.models.async_session import async_db
+from app.utils.aio import AsyncResource
+from app.utils.response_cache import response_cache
+
+path = "/health"
+namespace = Namespace("health", description="Liveness of the app's dependencies")
+
+health_schema = HealthSchema(namespace)
+
+
+async def ping_database() -> bool:
+    async with async_db.session() as session:
+        await session.execute(text("SELECT 1"))
+    return True
+
+
+async def ping_cache() -> Optional[bool]:
+    backend = response_cache.backend
+    if backend is None:
+        return None
+    # Backends are blocking clients; keep them off the event loop
+    await asyncio.to_thread(backend.generation, f"{response_cache.prefix}:health")
+    return True
+
+
+async def check(probe, timeout: float) -> Optional[bool]:
+    try:
+        return await asyncio.wait_for(probe, timeout)
+    except Exception:
+        return False
+
+
+@namespace.route("/")
+class HealthResource(AsyncResource):
+    @health_schema.response(HTTPStatus.SERVICE_UNAVAILABLE, "A dependency is down")
+    @health_schema.marshal()
+    async def get(self):
+        """Checks the database and the response cache concurrently."""
+        started = time.perf_counter()
+        timeout = current_app.config.get("HEALTH_CHECK_TIMEOUT", 2.0)
+        database, cache = await asyncio.gather(
+            check(ping_database(), timeout), check(ping_cache(), timeout)
+        )
+        healthy = database and cache is not False
+        return {
+            "status": "ok" if healthy else "degraded",
+            "database": database,
+            "cache": cache,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }, (HTTPStatus.OK if healthy else HTTPStatus.SERVICE_UNAVAILABLE)
@@ -0,0 +1,50 @@
+# asgi.py
+"""ASGI entry point, next to run.py: `python asgi.py` or `uvicorn asgi:asgi_app`.
+
+Requests are handed to a pool of WEB_THREADS threads per process; async views
+from all of them share one event loop (app.utils.aio).
+"""
+
+import asyncio
+
+from a2wsgi import WSGIMiddleware
+
+from app import create_app
+from app.config import get_config_name, config_by_name
+from app.models.async_session import async_db
+
+config_name = get_config_name()
+app = create_app(config_name=config_name)
+config_class = config_by_name[config_name]
+
+
+class ASGIApp(WSGIMiddleware):
+    """The Flask app over ASGI, closing the async engine's pool on shutdown."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            return await super().__call__(scope, receive, send)
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                with app.app_context():
+                    await asyncio.to_thread(app.ensure_sync(async_db.dispose))
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+asgi_app = ASGIApp(app, workers=config_class.WEB_THREADS)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    debug = app.config.get("DEBUG", True)
+    uvicorn.run(
+        "asgi:asgi_app",
+        host="0.0.0.0",
+        port=config_class.PORT,
+        workers=1 if debug else config_class.WEB_CONCURRENCY,
+        reload=debug,
+    )
@@ -0,0 +1,96 @@
+# tests/test_async.py
+import asyncio
+import importlib
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+from app.models import async_session
+from app.models.async_session import async_database_uri, async_db
+from app.utils.aio import event_loop, handler_wrapper
+
+
+def test_health_checks_the_database_and_cache(client):
+    response = client.get("/health/")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body["status"], body["database"], body["cache"]) == ("ok", True, True)
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [
+        ("sqlite:///db.sqlite3", "sqlite+aiosqlite:///db.sqlite3"),
+        ("postgresql://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+    ],
+)
+def test_async_database_uri_swaps_the_driver(uri, expected):
+    assert async_database_uri(uri) == expected
+
+
+def test_async_database_uri_names_the_setting_for_unknown_backends():
+    with pytest.raises(ValueError, match="set ASYNC_DATABASE_URI"):
+        async_database_uri("oracle://db/app")
+
+
+def test_handler_wrapper_wraps_sync_and_async_handlers():
+    def flow(value):
+        if value < 0:
+            return "skipped"
+        result = yield
+        return result * 2
+
+    def handler(value):
+        return value + 1
+
+    async def async_handler(value):
+        return value + 1
+
+    wrapped = handler_wrapper(handler, flow)
+    async_wrapped = handler_wrapper(async_handler, flow)
+
+    assert (wrapped(1), wrapped(-1)) == (4, "skipped")
+    assert inspect.iscoroutinefunction(async_wrapped)
+    assert event_loop.run(async_wrapped(1)) == 4
+    assert event_loop.run(async_wrapped(-1)) == "skipped"
+
+
+def test_async_engine_is_recreated_after_fork(app, monkeypatch):
+    engine = async_db.engine
+    assert async_db.engine is engine
+    disposed = []
+    monkeypatch.setattr(
+        engine.sync_engine, "dispose", lambda close=True: disposed.append(close)
+    )
+
+    # A forked worker sees another pid: it must not reuse the parent's pool
+    child_pid = async_session.os.getpid() + 1
+    monkeypatch.setattr(async_session, "os", SimpleNamespace(getpid=lambda: child_pid))
+
+    assert async_db.engine is not engine
+    assert disposed == [False]
+
+
+def test_lifespan_shutdown_disposes_the_async_engine(monkeypatch):
+    monkeypatch.setenv("FLASK_CONFIG", "test")
+    asgi = importlib.import_module("asgi")
+    with asgi.app.app_context():
+        engine = async_db.engine
+    pool = engine.sync_engine.pool
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(asgi.asgi_app({"type": "lifespan"}, receive, send))
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert "async_db" not in asgi.app.extensions
+    # AsyncEngine.dispose() closes the pool's connections and swaps in a new one
+    assert engine.sync_engine.pool is not pool
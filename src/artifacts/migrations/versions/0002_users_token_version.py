@@ -0,0 +1,33 @@
+"""users.token_version and the user listing indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-04-02 00:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing users start at version 1, which every issued token carries
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.create_index("ix_users_role_id", "users", ["role", "id"])
+    op.create_index("ix_users_email", "users", ["email"])
+
+
+def downgrade():
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_role_id", table_name="users")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("token_version")
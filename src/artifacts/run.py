@@ -1,3 +1,6 @@
+# run.py
+import sys
+
 from app import create_app
 from app.config import get_config_name, config_by_name
 
@@ -6,4 +9,15 @@ app = create_app(config_name=config_name)
 config_class = config_by_name[config_name]
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=config_class.PORT, debug=app.config.get("DEBUG", True))
+    if config_class.WSGI_SERVER == "gunicorn":
+        from app.server import reload_server, serve
+
+        if sys.argv[1:] == ["reload"]:
+            sys.exit(reload_server(config_class))
+        serve(app, config_class)
+    else:
+        app.run(
+            host="0.0.0.0",
+            port=config_class.PORT,
+            debug=app.config.get("DEBUG", True),
+        )
@@ -0,0 +1,69 @@
+# tests/conftest.py
+import base64
+import importlib.metadata
+
+import pytest
+import werkzeug
+
+# Flask 2.2's test client reads werkzeug.__version__, which Werkzeug 3.1 dropped
+if not hasattr(werkzeug, "__version__"):
+    werkzeug.__version__ = importlib.metadata.version("werkzeug")
+
+from app import create_app
+from app.models import db
+from app.models.users import User, UserRole
+from app.utils.auth_utils import generate_token
+from app.utils.pagination import count_cache
+
+
+@pytest.fixture
+def app():
+    app = create_app("test")
+    # Counts are cached per process and would outlive each test's database
+    count_cache.invalidate(User.__tablename__)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    def make(username: str, password: str = "secret", role=UserRole.USER) -> User:
+        user = User.create_user(
+            full_name=username.title(),
+            username=username,
+            email=f"{username}@example.com",
+            password=password,
+            role=role,
+        )
+        db.session.add(user)
+        db.session.commit()
+        return user
+
+    return make
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user("admin", role=UserRole.ADMIN)
+
+
+@pytest.fixture
+def admin_headers(admin):
+    return bearer(admin)
+
+
+def bearer(user: User) -> dict:
+    return {"Authorization": f"Bearer {generate_token(user)}"}
+
+
+def basic(username: str, password: str) -> dict:
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return {"Authorization": f"Basic {credentials}"}
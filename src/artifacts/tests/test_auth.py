@@ -0,0 +1,77 @@
+# tests/test_auth.py
+from conftest import basic, bearer
+from sqlalchemy import update
+
+from app.models import db
+from app.models.users import User
+from app.utils.credential_cache import credential_cache
+from app.utils.identity_cache import identity_cache
+
+
+def test_basic_auth_caches_verified_credentials(client, admin):
+    headers = basic("admin", "secret")
+    for _ in range(2):
+        assert client.get("/users/", headers=headers).status_code == 200
+
+    stats = credential_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_basic_auth_rejects_wrong_password(client, admin):
+    response = client.get("/users/", headers=basic("admin", "wrong"))
+
+    assert response.status_code == 401
+    assert credential_cache.stats()["size"] == 0
+
+
+def test_password_change_drops_cached_credentials(client, admin):
+    assert client.get("/users/", headers=basic("admin", "secret")).status_code == 200
+
+    User.update_user_as_admin(admin, {"password": "changed"})
+    db.session.commit()
+
+    assert client.get("/users/", headers=basic("admin", "secret")).status_code == 401
+    assert client.get("/users/", headers=basic("admin", "changed")).status_code == 200
+
+
+def test_role_change_revokes_issued_tokens(client, admin, admin_headers):
+    assert client.get("/users/", headers=admin_headers).status_code == 200
+
+    User.update_user_as_admin(admin, {"role": "user"})
+    db.session.commit()
+
+    assert client.get("/users/", headers=admin_headers).status_code == 401
+    assert client.get("/users/", headers=bearer(admin)).status_code == 403
+
+
+def test_unchanged_role_and_username_keep_tokens_valid(client, admin, admin_headers):
+    assert client.get("/users/", headers=basic("admin", "secret")).status_code == 200
+
+    User.update_user_as_admin(admin, {"role": "admin", "username": "admin"})
+    User.update_user_as_user(admin, {"role": "user", "full_name": "Renamed"})
+    db.session.commit()
+
+    assert admin.token_version == 1
+    assert client.get("/users/", headers=admin_headers).status_code == 200
+    assert client.get("/users/", headers=basic("admin", "secret")).status_code == 200
+    assert credential_cache.stats()["hits"] == 1
+
+
+def test_rolled_back_change_keeps_tokens_valid(client, admin, admin_headers):
+    User.update_user_as_admin(admin, {"password": "changed"})
+    db.session.rollback()
+
+    assert client.get("/users/", headers=admin_headers).status_code == 200
+
+
+def test_change_in_another_worker_revokes_once_the_cache_expires(
+    client, admin, admin_headers
+):
+    identity_cache.configure(max_entries=16, ttl=0)
+    assert client.get("/users/", headers=admin_headers).status_code == 200
+
+    # Another process: the row changes, this process's caches hear nothing
+    db.session.execute(update(User).where(User.id == admin.id).values(token_version=2))
+    db.session.commit()
+
+    assert client.get("/users/", headers=admin_headers).status_code == 401
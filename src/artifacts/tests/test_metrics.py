@@ -0,0 +1,148 @@
+# tests/test_metrics.py
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from app.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    http_request_duration,
+    http_requests,
+    metrics,
+)
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    registry.register(Counter("jobs_total", "Jobs.", ("queue",)))
+    registry.register(Gauge("jobs_running", "Running jobs.", ("queue",)))
+    registry.register(Histogram("job_seconds", "Job time.", (), buckets=(1, 2, 4)))
+    return registry
+
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    return process.pid
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    histogram = Histogram("h", "", buckets=(1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe((), value)
+
+    cell = histogram.collect()[()]
+
+    assert cell == [1, 2, 1, 0, 6.5, 4]
+    assert histogram.quantile(cell, 0.5) == pytest.approx(1.5)
+    assert histogram.quantile(cell, 0.25) == pytest.approx(1.0)
+    assert histogram.quantile(cell, 0.99) == pytest.approx(3.92)
+    assert histogram.quantile([0, 0, 0, 0, 0.0, 0], 0.5) is None
+
+
+def test_threads_record_into_separate_cells_that_add_up():
+    counter = Counter("c", "", ("queue",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc(("a",))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.collect() == {("a",): 4000}
+
+
+def test_exited_threads_are_folded_into_one_total():
+    histogram = Histogram("h", "", buckets=(1, 2))
+    histogram.observe((), 0.5)
+
+    for count, value in enumerate((1.5, 3.0, 1.5), start=2):
+        thread = threading.Thread(target=histogram.observe, args=((), value))
+        thread.start()
+        thread.join()
+        assert histogram.collect()[()][-1] == count
+
+    assert histogram.collect() == {(): [1, 2, 1, 6.5, 4]}
+    assert list(histogram._shards) == [threading.current_thread()]
+
+
+def test_exposition_renders_cumulative_buckets_and_escapes_labels(registry):
+    jobs, _, seconds = registry.metrics
+    jobs.inc(('say "hi"\n',), 2)
+    seconds.observe((), 1.5)
+    seconds.observe((), 9.0)
+
+    text = registry.exposition()
+
+    assert '# TYPE jobs_total counter\njobs_total{queue="say \\"hi\\"\\n"} 2\n' in text
+    assert 'job_seconds_bucket{le="1"} 0\n' in text
+    assert 'job_seconds_bucket{le="2"} 1\n' in text
+    assert 'job_seconds_bucket{le="4"} 1\n' in text
+    assert 'job_seconds_bucket{le="+Inf"} 2\n' in text
+    assert "job_seconds_sum 10.5\njob_seconds_count 2\n" in text
+
+
+def test_shared_directory_merges_other_processes(registry, tmp_path):
+    jobs, running, seconds = registry.metrics
+    registry.set_directory(str(tmp_path))
+    jobs.inc(("a",))
+    running.inc(("a",))
+    seconds.observe((), 1.5)
+    registry.flush()
+
+    def other_process(pid):
+        data = {
+            "pid": pid,
+            "metrics": {
+                "jobs_total": [[["a"], 2], [["b"], 5]],
+                "jobs_running": [[["a"], 3]],
+                "job_seconds": [[[], [1, 0, 0, 0, 0.5, 1]]],
+            },
+        }
+        (tmp_path / f"metrics-{pid}.json").write_text(json.dumps(data))
+
+    other_process(os.getppid())
+    other_process(dead_pid())
+
+    totals = {metric.name: values for metric, values in registry.collect()}
+
+    # Counters and histograms of exited workers stay; their gauges do not
+    assert totals["jobs_total"] == {("a",): 5, ("b",): 10}
+    assert totals["jobs_running"] == {("a",): 4}
+    assert totals["job_seconds"] == {(): [2, 1, 0, 0, 2.5, 3]}
+
+
+def test_set_directory_removes_files_of_earlier_runs(registry, tmp_path):
+    (tmp_path / "metrics-1.json").write_text("{}")
+
+    registry.set_directory(str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_metrics_endpoint_records_routes_and_checks_token(app, client, admin_headers):
+    metrics.reset()
+    app.config["METRICS_TOKEN"] = "scrape"
+    client.get("/users/", headers=admin_headers)
+    client.get("/missing")
+
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    totals = {metric.name: values for metric, values in metrics.collect()}
+    assert totals[http_requests.name][("users", "/users/", "GET", "200")] == 1
+    assert totals[http_requests.name][("", "<unmatched>", "GET", "404")] == 1
+    assert totals[http_request_duration.name][("users", "/users/", "GET")][-1] == 1
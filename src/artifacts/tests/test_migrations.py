@@ -0,0 +1,43 @@
+# tests/test_migrations.py
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask_migrate import upgrade
+from sqlalchemy import text
+
+from app import create_app
+from app.models import MIGRATIONS_DIR, db
+
+
+@pytest.fixture
+def empty_app():
+    app = create_app("test")
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.drop_all()
+        db.session.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+
+def test_migrations_match_the_models(empty_app):
+    upgrade(directory=MIGRATIONS_DIR)
+
+    with db.engine.connect() as connection:
+        context = MigrationContext.configure(connection)
+        assert compare_metadata(context, db.metadata) == []
+
+
+def test_upgrade_keeps_existing_users_and_their_tokens(empty_app):
+    upgrade(directory=MIGRATIONS_DIR, revision="0001")
+    db.session.execute(
+        text(
+            "INSERT INTO users (full_name, email, username, password, role) "
+            "VALUES ('Old', 'old@example.com', 'old', 'hash', 'USER')"
+        )
+    )
+    db.session.commit()
+
+    upgrade(directory=MIGRATIONS_DIR)
+
+    version = db.session.execute(text("SELECT token_version FROM users")).scalar()
+    assert version == 1
@@ -0,0 +1,83 @@
+# tests/test_pagination.py
+import pytest
+from sqlalchemy import insert
+
+from app.models import db
+from app.models.users import User, UserRole
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def users(admin):
+    """admin plus 24 users; every third one a guest."""
+    rows = [
+        {
+            "full_name": f"User {i}",
+            "username": f"user{i:02d}",
+            "email": f"user{i:02d}@example.com",
+            "password": "not-a-real-hash",
+            "role": UserRole.GUEST if i % 3 == 0 else UserRole.USER,
+        }
+        for i in range(1, 25)
+    ]
+    db.session.execute(insert(User), rows)
+    db.session.commit()
+    return db.session.scalars(db.select(User).order_by(User.id)).all()
+
+
+def walk(client, headers, **params) -> list[dict]:
+    """Every page of GET /users/ through next_cursor."""
+    pages, cursor = [], None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/users/", query_string=query, headers=headers)
+        assert response.status_code == 200
+        pages.append(response.json)
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_pages_cover_every_user_once_in_order(client, admin_headers, users):
+    pages = walk(client, admin_headers, per_page=10)
+
+    ids = [user["id"] for page in pages for user in page["data"]]
+    assert ids == [user.id for user in users]
+    assert [len(page["data"]) for page in pages] == [10, 10, 5]
+    assert {page["total"] for page in pages} == {25}
+
+
+def test_cursor_pages_keep_filters(client, admin_headers, users):
+    pages = walk(client, admin_headers, per_page=3, role="guest")
+
+    ids = [user["id"] for page in pages for user in page["data"]]
+    assert ids == [user.id for user in users if user.role is UserRole.GUEST]
+
+
+def test_page_numbers_match_cursor_pages(client, admin_headers, users):
+    response = client.get(
+        "/users/", query_string={"page": 2, "per_page": 10}, headers=admin_headers
+    )
+
+    assert [user["id"] for user in response.json["data"]] == [
+        user.id for user in users[10:20]
+    ]
+    assert response.json["next_cursor"] is None
+
+
+def test_invalid_cursor_is_a_bad_request(client, admin_headers):
+    response = client.get(
+        "/users/", query_string={"cursor": "not-a-cursor"}, headers=admin_headers
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", ["", "e30", encode_cursor(1)[:-2], "eyJrIjoiMSJ9"])
+def test_decode_cursor_rejects_foreign_values(cursor):
+    with pytest.raises(ValueError, match="cursor"):
+        decode_cursor(cursor)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(12345)) == 12345
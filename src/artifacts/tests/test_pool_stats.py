@@ -0,0 +1,22 @@
+# tests/test_pool_stats.py
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.utils.pool_stats import PoolMonitor
+
+
+def test_counts_the_engine_pool_after_dispose(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=2
+    )
+    monitor = PoolMonitor()
+    monitor.attach("default", engine)
+    # What a forked server worker does: drop the parent's pool for a new one
+    engine.dispose(close=False)
+
+    with engine.connect(), engine.connect():
+        stats = monitor.snapshot()["default"]
+
+    assert (stats["checkouts"], stats["peak_checked_out"]) == (2, 2)
+    assert (stats["checked_out"], stats["saturation"]) == (2, 2 / 12)
+    engine.dispose()
@@ -0,0 +1,104 @@
+# tests/test_profiler.py
+import json
+
+import pytest
+
+from app.config import TestingConfig
+from app.utils.profiler import request_profiler, sign_trigger, verify_trigger
+
+SECRET = "profile-secret"
+
+
+@pytest.fixture(autouse=True)
+def profiling(monkeypatch, tmp_path):
+    """Enables signed-trigger profiling into tmp_path for the app fixture."""
+    monkeypatch.setattr(TestingConfig, "PROFILE_TRIGGER_SECRET", SECRET, raising=False)
+    monkeypatch.setattr(TestingConfig, "PROFILE_DIR", str(tmp_path), raising=False)
+    monkeypatch.setattr(TestingConfig, "PROFILE_MAX_FILES", 3, raising=False)
+    monkeypatch.setattr(TestingConfig, "PROFILE_INTERVAL_MS", 1, raising=False)
+    return tmp_path
+
+
+def trigger(path: str = "/users/", **kwargs) -> dict:
+    return {"X-Profile": sign_trigger(SECRET, path, **kwargs)}
+
+
+def test_verify_trigger_accepts_only_fresh_tokens_for_the_path():
+    token = sign_trigger(SECRET, "/users/")
+
+    assert verify_trigger(SECRET, token, "/users/")
+    assert not verify_trigger(SECRET, token, "/ops/pool")
+    assert not verify_trigger("other-secret", token, "/users/")
+    assert not verify_trigger(
+        SECRET, sign_trigger(SECRET, "/users/", ttl=-1), "/users/"
+    )
+
+
+@pytest.mark.parametrize("value", ["", "garbage", "123", "x.y", "9999999999."])
+def test_verify_trigger_rejects_malformed_values(value):
+    assert not verify_trigger(SECRET, value, "/users/")
+
+
+@pytest.mark.parametrize(
+    ("backend", "suffix"), [("sampling", ".collapsed"), ("cprofile", ".pstats")]
+)
+def test_signed_header_profiles_the_request(
+    profiling, backend, suffix, app, client, admin_headers
+):
+    app.config["PROFILE_BACKEND"] = backend
+    request_profiler.configure(app)
+
+    response = client.get("/users/", headers={**admin_headers, **trigger()})
+
+    profile_id = response.headers["X-Profile-Id"]
+    summary = json.loads((profiling / f"{profile_id}.json").read_text())
+    assert summary["file"] == profile_id + suffix
+    assert (profiling / summary["file"]).exists()
+    assert (summary["backend"], summary["reason"]) == (backend, "header")
+    assert (summary["route"], summary["status"]) == ("/users/", 200)
+
+
+def test_requests_without_a_valid_trigger_are_not_profiled(
+    profiling, client, admin_headers
+):
+    for headers in ({}, trigger("/ops/pool"), {"X-Profile": "nonsense"}):
+        response = client.get("/users/", headers={**admin_headers, **headers})
+        assert "X-Profile-Id" not in response.headers
+
+    assert list(profiling.iterdir()) == []
+
+
+def test_only_the_newest_profiles_are_kept(profiling, client, admin_headers):
+    ids = [
+        client.get("/users/", headers={**admin_headers, **trigger()}).headers[
+            "X-Profile-Id"
+        ]
+        for _ in range(5)
+    ]
+
+    assert sorted(path.stem for path in profiling.glob("*.json")) == ids[2:]
+    assert [entry["id"] for entry in request_profiler.entries()] == ids[:1:-1]
+
+
+def test_ops_profiles_lists_and_serves_files_to_admins(client, admin_headers):
+    client.get("/users/", headers={**admin_headers, **trigger()})
+
+    assert client.get("/ops/profiles").status_code == 401
+    response = client.get("/ops/profiles", headers=admin_headers)
+    (entry,) = response.get_json()["profiles"]
+    download = client.get(f"/ops/profiles/{entry['file']}", headers=admin_headers)
+
+    assert download.status_code == 200
+    assert download.headers["Content-Disposition"].startswith("attachment")
+    missing = client.get("/ops/profiles/1-2-3.pstats", headers=admin_headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["../1-2-3.pstats", "1-2-3.json", "1-2-3", "name.collapsed", "..pstats"],
+)
+def test_path_for_only_serves_generated_profile_files(app, profiling, file_name):
+    (profiling / "1-2-3.json").write_text("{}")
+
+    assert request_profiler.path_for(file_name) is None
@@ -0,0 +1,78 @@
+# tests/test_query_stats.py
+import pytest
+from sqlalchemy import select
+
+from app.models import db
+from app.models.users import User
+from app.utils.query_stats import db_n_plus_one_requests, statement_shape
+
+
+@pytest.mark.parametrize(
+    ("statement", "shape"),
+    [
+        ("SELECT *\n  FROM users\n WHERE id = ?", "SELECT * FROM users WHERE id = ?"),
+        ("WHERE id IN (?, ?, ?)", "WHERE id IN (?)"),
+        ("WHERE id IN (%s,%s)", "WHERE id IN (?)"),
+        ("WHERE id IN (%(id_1)s, %(id_2)s)", "WHERE id IN (?)"),
+        ("WHERE id IN (:id_1, :id_2)", "WHERE id IN (?)"),
+        ("WHERE id IN ($1, $2, $3, $4)", "WHERE id IN (?)"),
+        ("WHERE id IN (?)", "WHERE id IN (?)"),
+        ("WHERE lower(name) = ?", "WHERE lower(name) = ?"),
+    ],
+)
+def test_statement_shape_folds_whitespace_and_in_lists(statement, shape):
+    assert statement_shape(statement) == shape
+
+
+@pytest.fixture
+def lookups(app, make_user):
+    """GET /lookups/<n>: loads n users one query at a time."""
+    user_ids = [make_user(f"user{i}").id for i in range(6)]
+
+    def view(n):
+        for user_id in user_ids[:n]:
+            db.session.execute(select(User).where(User.id == user_id)).scalar_one()
+        return "ok"
+
+    app.add_url_rule("/lookups/<int:n>", "lookups", view)
+    return user_ids
+
+
+def n_plus_one_count() -> int:
+    return db_n_plus_one_requests.collect().get(("/lookups/<int:n>", "GET"), 0)
+
+
+def test_repeated_statement_is_flagged_as_n_plus_one(client, lookups, caplog):
+    before = n_plus_one_count()
+
+    response = client.get("/lookups/6")
+
+    assert response.headers["X-Query-Count"] == "6"
+    assert float(response.headers["X-Query-Time-Ms"]) > 0
+    assert response.headers["X-Query-N-Plus-One"] == "1"
+    assert n_plus_one_count() == before + 1
+    assert "Possible N+1 in GET /lookups/<int:n>: 6x SELECT" in caplog.text
+
+
+def test_statements_below_threshold_are_not_flagged(client, lookups):
+    before = n_plus_one_count()
+
+    response = client.get("/lookups/4")
+
+    assert response.headers["X-Query-Count"] == "4"
+    assert "X-Query-N-Plus-One" not in response.headers
+    assert n_plus_one_count() == before
+
+
+def test_ops_queries_lists_statement_shapes(client, admin_headers, lookups):
+    client.get("/lookups/6")
+
+    response = client.get("/ops/queries?order_by=count", headers=admin_headers)
+    statements = response.get_json()["statements"]
+
+    assert response.status_code == 200
+    assert [row["count"] for row in statements] == sorted(
+        (row["count"] for row in statements), reverse=True
+    )
+    bad = client.get("/ops/queries?order_by=rows", headers=admin_headers)
+    assert bad.status_code == 400
@@ -0,0 +1,102 @@
+# tests/test_response_cache.py
+import pytest
+from sqlalchemy import insert
+
+from app.models import db
+from app.models.users import User, UserRole
+from app.utils.response_cache import (
+    RedisBackend,
+    ResponseCache,
+    init_response_cache,
+    response_cache,
+)
+
+
+class StubRedis:
+    """The get/set/incr subset of redis.Redis that RedisBackend uses; one
+    instance shared by several caches stands in for one Redis server."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1).encode()
+
+
+@pytest.fixture
+def redis_server(app):
+    server = StubRedis()
+    response_cache.configure(RedisBackend(server), ttl=60)
+    return server
+
+
+def usernames(response) -> list[str]:
+    return [user["username"] for user in response.get_json()["data"]]
+
+
+def test_etag_answers_if_none_match_with_304(client, admin_headers):
+    response = client.get("/users/", headers=admin_headers)
+    etag = response.headers["ETag"]
+
+    response = client.get("/users/", headers={**admin_headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert (response_cache.stats()["hits"], response_cache.stats()["misses"]) == (1, 1)
+
+
+def test_etags_work_without_a_backend(app, client, admin_headers):
+    app.config["RESPONSE_CACHE_URL"] = ""
+    init_response_cache(app)
+    etag = client.get("/users/", headers=admin_headers).headers["ETag"]
+
+    response = client.get("/users/", headers={**admin_headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response_cache.stats()["backend"] is None
+
+
+def test_commit_invalidates_cached_listing(client, admin_headers, make_user):
+    first = client.get("/users/", headers=admin_headers)
+
+    make_user("alice")
+    response = client.get(
+        "/users/", headers={**admin_headers, "If-None-Match": first.headers["ETag"]}
+    )
+
+    assert response.status_code == 200
+    assert usernames(response) == ["admin", "alice"]
+    assert response.headers["ETag"] != first.headers["ETag"]
+
+
+def test_shared_backend_sees_other_workers_writes(client, admin_headers, redis_server):
+    assert usernames(client.get("/users/", headers=admin_headers)) == ["admin"]
+    assert usernames(client.get("/users/", headers=admin_headers)) == ["admin"]
+    assert response_cache.stats()["hits"] == 1
+
+    # Another worker commits a new user (outside this process's session
+    # tracking) and bumps the shared generation
+    db.session.connection().execute(
+        insert(User.__table__).values(
+            full_name="Alice",
+            username="alice",
+            email="alice@example.com",
+            password="-",
+            role=UserRole.USER,
+        )
+    )
+    db.session.commit()
+    assert usernames(client.get("/users/", headers=admin_headers)) == ["admin"]
+    other_worker = ResponseCache(RedisBackend(redis_server))
+    other_worker.invalidate(User.__tablename__)
+
+    assert usernames(client.get("/users/", headers=admin_headers)) == [
+        "admin",
+        "alice",
+    ]
@@ -0,0 +1,85 @@
+# tests/test_serializer.py
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_restx import Api, Namespace, Resource, fields, marshal
+
+from app.api.base_schema import BaseSchemaAPIModel
+
+
+class ItemSchema(BaseSchemaAPIModel):
+    __modelname__ = "TestItem"
+
+    id = fields.Integer()
+    name = fields.String(default="unnamed")
+    price = fields.Float()
+    active = fields.Boolean()
+    note = fields.String()
+    tags = fields.List(fields.String)
+    owner = fields.Nested(
+        {"name": fields.String, "score": fields.Float}, allow_null=True
+    )
+
+
+ROWS = [
+    {
+        "id": 1,
+        "name": "first",
+        "price": 9.5,
+        "active": True,
+        "note": "n",
+        "tags": ["a", "b"],
+        "owner": {"name": "alice", "score": 2},
+    },
+    {"id": 2, "name": None, "price": None, "active": 0, "note": None, "tags": []},
+    {"id": "3", "price": "1.25", "active": "", "owner": None},
+]
+
+
+def as_objects(rows: list[dict]) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            **{
+                key: SimpleNamespace(**value) if isinstance(value, dict) else value
+                for key, value in row.items()
+            }
+        )
+        for row in rows
+    ]
+
+
+@pytest.mark.parametrize("rows", [ROWS, as_objects(ROWS)], ids=["dicts", "objects"])
+def test_compiled_serializer_matches_restx(rows):
+    expected = marshal(rows, ItemSchema._declared_fields)
+
+    assert ItemSchema.serializer()(rows) == expected
+    assert ItemSchema.serializer()(rows[0]) == expected[0]
+
+
+def test_fast_marshal_is_opt_in_and_renders_like_restx():
+    app = Flask(__name__)
+    api = Api(app)
+    namespace = Namespace("items")
+    schema = ItemSchema(namespace)
+
+    @namespace.route("/restx")
+    class RestxItems(Resource):
+        @schema.marshal(many=True)
+        def get(self):
+            return as_objects(ROWS)
+
+    @namespace.route("/fast")
+    class FastItems(Resource):
+        @schema.marshal(many=True, fast=True)
+        def get(self):
+            return as_objects(ROWS)
+
+    api.add_namespace(namespace)
+    client = app.test_client()
+
+    assert schema.marshal(many=True) is schema.marshal(many=True, fast=False)
+    restx = client.get("/items/restx")
+    fast = client.get("/items/fast")
+    assert fast.get_json() == restx.get_json()
+    assert restx.get_json() == marshal(ROWS, ItemSchema._declared_fields)
@@ -0,0 +1,54 @@
+# tests/test_server.py
+import os
+
+import pytest
+
+from app import config
+from app.config import available_cpus
+
+
+def test_preload_imports_every_lazy_route_module(app):
+    report = app.extensions["route_report"]
+    assert report.lazy_namespaces
+    assert all(namespace.module is None for namespace in report.lazy_namespaces)
+
+    report.load_all()
+
+    assert all(namespace.module for namespace in report.lazy_namespaces)
+
+
+@pytest.fixture
+def cgroup(tmp_path, monkeypatch):
+    """Points available_cpus() at quota files under tmp_path."""
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)))
+
+    def write(v2=None, v1=None):
+        files = []
+        if v2 is not None:
+            (tmp_path / "cpu.max").write_text(v2)
+        files.append((str(tmp_path / "cpu.max"), None))
+        if v1 is not None:
+            (tmp_path / "quota").write_text(v1[0])
+            (tmp_path / "period").write_text(v1[1])
+        files.append((str(tmp_path / "quota"), str(tmp_path / "period")))
+        monkeypatch.setattr(config, "_CPU_QUOTA_FILES", tuple(files))
+
+    return write
+
+
+@pytest.mark.parametrize(
+    ("v2", "v1", "expected"),
+    [
+        (None, None, 8),  # No cgroup files: the affinity mask
+        ("max 100000\n", None, 8),
+        ("250000 100000\n", None, 3),  # 2.5 CPUs round up
+        ("2000000 100000\n", None, 8),  # Quota above the affinity mask
+        ("50000 100000\n", None, 1),
+        (None, ("200000\n", "100000\n"), 2),
+        (None, ("-1\n", "100000\n"), 8),
+    ],
+)
+def test_available_cpus_respects_affinity_and_quota(cgroup, v2, v1, expected):
+    cgroup(v2=v2, v1=v1)
+
+    assert available_cpus() == expected
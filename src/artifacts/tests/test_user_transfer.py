@@ -0,0 +1,172 @@
+# tests/test_user_transfer.py
+import csv
+import io
+import json
+
+import pytest
+from conftest import bearer
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.commands import seed
+from app.commands.seed import hash_passwords
+from app.models import db
+from app.models.users import User, UserRole
+
+
+@pytest.fixture
+def root(make_user):
+    return make_user("root", role=UserRole.ADMIN)
+
+
+def import_users(client, headers, records, mode="insert") -> list[dict]:
+    body = "".join(
+        record if isinstance(record, str) else json.dumps(record) + "\n"
+        for record in records
+    )
+    response = client.post(
+        f"/users/import?mode={mode}",
+        data=body,
+        content_type="application/x-ndjson",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def record(username: str, **fields) -> dict:
+    return {
+        "full_name": username.title(),
+        "username": username,
+        "email": f"{username}@example.com",
+        "role": "user",
+        **fields,
+    }
+
+
+def test_export_streams_ndjson_and_csv(client, admin_headers, make_user):
+    make_user("alice")
+
+    response = client.get("/users/export", headers=admin_headers)
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert response.mimetype == "application/x-ndjson"
+    assert [(row["username"], row["role"]) for row in rows] == [
+        ("admin", "admin"),
+        ("alice", "user"),
+    ]
+    assert all("password" not in row for row in rows)
+
+    response = client.get("/users/export?format=csv", headers=admin_headers)
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert response.mimetype == "text/csv"
+    assert [row["username"] for row in rows] == ["admin", "alice"]
+
+
+def test_import_reports_row_errors(client, admin_headers):
+    events = import_users(
+        client,
+        admin_headers,
+        [
+            record("alice", password="secret"),
+            "not json\n",
+            record("bob"),
+            {"username": "carol"},
+            record("alice", password="again"),
+            record("admin", password="secret"),
+        ],
+    )
+
+    errors = {event["line"]: event["error"] for event in events[:-2]}
+    assert set(errors) == {2, 3, 4, 5, 6}
+    assert "password is required" in errors[3]
+    assert "duplicate username" in errors[5]
+    assert "already exists" in errors[6]
+    assert events[-1] == {
+        "event": "done",
+        "processed": 6,
+        "inserted": 1,
+        "updated": 0,
+        "failed": 5,
+    }
+    assert db.session.query(User).filter_by(username="alice").one()
+
+
+def test_upsert_password_change_revokes_tokens(client, admin, root):
+    old_headers = bearer(admin)
+    assert client.get("/users/", headers=old_headers).status_code == 200
+
+    import_users(
+        client,
+        bearer(root),
+        [record("admin", role="admin", password="changed")],
+        mode="upsert",
+    )
+
+    assert client.get("/users/", headers=old_headers).status_code == 401
+    db.session.expire_all()
+    assert db.session.get(User, admin.id).token_version == 2
+    assert client.get("/users/", headers=bearer(admin)).status_code == 200
+
+
+def test_upsert_role_change_revokes_tokens(client, admin, root):
+    old_headers = bearer(admin)
+    assert client.get("/users/", headers=old_headers).status_code == 200
+
+    import_users(client, bearer(root), [record("admin")], mode="upsert")
+
+    assert client.get("/users/", headers=old_headers).status_code == 401
+    assert client.get("/users/", headers=bearer(admin)).status_code == 403
+
+
+def test_upsert_without_auth_changes_keeps_tokens(client, admin, root):
+    headers = bearer(admin)
+    old_hash = admin.password
+
+    events = import_users(
+        client,
+        bearer(root),
+        [record("admin", full_name="Renamed", role="admin", password="secret")],
+        mode="upsert",
+    )
+
+    assert events[-1]["updated"] == 1
+    db.session.expire_all()
+    user = db.session.get(User, admin.id)
+    assert (user.full_name, user.token_version) == ("Renamed", 1)
+    assert user.password == old_hash
+    assert client.get("/users/", headers=headers).status_code == 200
+
+
+def test_import_route_hashes_in_process(client, admin_headers, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("the import route must not fork a hashing pool")
+
+    monkeypatch.setattr(seed, "ProcessPoolExecutor", no_pool)
+
+    events = import_users(
+        client,
+        admin_headers,
+        [record(f"user{i}", password=f"secret{i}") for i in range(6)],
+    )
+
+    assert events[-1]["inserted"] == 6
+    user = db.session.query(User).filter_by(username="user5").one()
+    assert check_password_hash(user.password, "secret5")
+
+
+def test_hash_passwords_keeps_matching_hashes_across_workers():
+    current = generate_password_hash("same")
+    passwords = ["same", "new", "same", "other"]
+
+    hashes = hash_passwords(
+        passwords,
+        2,
+        None,
+        reuse_hashes=False,
+        current_hashes=[current, current, None, None],
+    )
+
+    assert hashes[0] == current
+    assert check_password_hash(hashes[1], "new")
+    assert hashes[2] != current
+    assert check_password_hash(hashes[2], "same")
+    assert check_password_hash(hashes[3], "other")
@@ -0,0 +1,171 @@
+# src/flask_scaffolder/batch.py
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from flask_scaffolder.bundle import ArtifactBundle
+from flask_scaffolder.core import (
+    ArtifactEntry,
+    _artifact_requirements,
+    index_artifacts,
+    locate_artifacts,
+    scaffold_project,
+    setup_logger,
+    warm_templates,
+)
+
+REQUIRED_CONTEXT = ("SECRET_KEY", "DATABASE_URI")
+PROFILE_FILE = "scaffold-profile.json"
+
+# Per-worker state, filled in once by _init_worker
+_worker = {}
+
+
+def load_batch_manifest(path: str, defaults: dict | None = None):
+    """Reads a batch manifest and returns a list of (output_dir, context) pairs.
+
+    The manifest (YAML, or JSON for `.json` files) looks like::
+
+        defaults:
+          DATABASE_URI: sqlite:///db.sqlite3
+        projects:
+          - output: tenants/acme
+            context:
+              SECRET_KEY: acme-secret
+
+    Each project's context is `defaults` (e.g. from CLI flags), then the
+    manifest `defaults`, then the project's own `context`.
+    """
+    data = _read_manifest(path)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must be a mapping with a 'projects' list")
+    manifest_defaults = data.get("defaults") or {}
+    if not isinstance(manifest_defaults, dict):
+        raise ValueError(f"'defaults' in {path} must be a mapping")
+    entries = data.get("projects") or []
+    if not isinstance(entries, list):
+        raise ValueError(f"'projects' in {path} must be a list")
+
+    shared = {**(defaults or {}), **manifest_defaults}
+    projects = []
+    for index, project in enumerate(entries):
+        if not isinstance(project, dict):
+            raise ValueError(f"Project #{index} in {path} must be a mapping")
+        context = project.get("context") or {}
+        if not isinstance(context, dict):
+            raise ValueError(f"Project #{index} in {path} has a non-mapping 'context'")
+        output = project.get("output")
+        if not output:
+            raise ValueError(f"Project #{index} in {path} has no 'output'")
+        context = {**shared, **context}
+        missing = [key for key in REQUIRED_CONTEXT if not context.get(key)]
+        if missing:
+            raise ValueError(f"Project '{output}' is missing {', '.join(missing)}")
+        projects.append((output, context))
+    return projects
+
+
+def _read_manifest(path: str):
+    with open(path) as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError(
+                "PyYAML is required for YAML batch manifests: "
+                "pip install 'flask-scaffolder[batch]'"
+            ) from None
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {path}: {e}") from None
+
+
+def _init_worker(
+    artifacts_dir: str | None,
+    bundle: ArtifactBundle | None,
+    entries: list[ArtifactEntry],
+    offline: bool,
+    use_cache: bool,
+    profile: bool,
+):
+    _worker.update(
+        artifacts_dir=artifacts_dir,
+        bundle=bundle,
+        entries=entries,
+        offline=offline,
+        use_cache=use_cache,
+        profile=profile,
+    )
+    # No-op after fork (inherited from the parent); loads bytecode otherwise
+    warm_templates(artifacts_dir, entries, bundle)
+
+
+def _scaffold_one(output: str, context: dict) -> str:
+    options = dict(_worker)
+    if options.pop("profile"):
+        options["profile_path"] = os.path.join(output, PROFILE_FILE)
+    scaffold_project(output, context, **options)
+    return output
+
+
+def run_batch(
+    projects: list[tuple[str, dict]],
+    offline: bool = False,
+    use_cache: bool = True,
+    max_workers: int | None = None,
+    profile: bool = False,
+) -> int:
+    """Scaffolds all `projects` from a process pool; returns the failure count.
+
+    With `profile`, each project gets its own JSON report in its output dir.
+    """
+    logger = setup_logger()
+    artifacts_dir, bundle = locate_artifacts()
+
+    # Index and compile once here; workers receive (or inherit) the results
+    entries = index_artifacts(artifacts_dir, logger, bundle)
+    warm_templates(artifacts_dir, entries, bundle)
+    requirements = _artifact_requirements(artifacts_dir, bundle)
+    if bundle is not None:
+        # Only workers stream the files, each from its own open
+        bundle.close()
+
+    if use_cache and requirements and os.path.exists(requirements):
+        from flask_scaffolder import venv_cache
+
+        try:
+            # Build the golden venv before the pool starts, not once per worker
+            venv_cache.ensure_golden_venv(requirements, logger, offline)
+        except Exception as e:
+            logger.warning(f"⚠️ Virtual environment cache unavailable: {e}")
+
+    logger.info(f"🚀 Scaffolding {len(projects)} projects...")
+    failures = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(artifacts_dir, bundle, entries, offline, use_cache, profile),
+    ) as pool:
+        futures = {
+            pool.submit(_scaffold_one, output, context): output
+            for output, context in projects
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures += 1
+                logger.error(f"❌ Failed to scaffold {futures[future]}: {e}")
+    elapsed = time.perf_counter() - started
+
+    done = len(projects) - failures
+    rate = done / elapsed if elapsed else 0.0
+    logger.info(
+        f"📈 Scaffolded {done}/{len(projects)} projects in {elapsed:.2f}s "
+        f"({rate:.2f} projects/s)"
+    )
+    return failures
@@ -0,0 +1,182 @@
+# src/flask_scaffolder/bundle.py
+# Packs the artifacts tree into one compressed file shipped as package data.
+# Only uses the standard library: setup.py loads it at build time, before
+# the package's own dependencies are installed.
+import functools
+import gzip
+import hashlib
+import io
+import json
+import os
+import tarfile
+import threading
+from importlib.resources import files
+
+BUNDLE_NAME = "artifacts.bundle"
+INDEX_NAME = ".bundle-index.json"
+BUNDLE_VERSION = 2
+# Dev-checkout clutter that must never reach a bundle or a generated project
+IGNORED_NAMES = {
+    "__pycache__",
+    ".DS_Store",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+}
+IGNORED_SUFFIXES = (".pyc", ".pyo")
+TEMPLATE_SUFFIX = ".j2"
+# Artifacts needed before the file stream is read, so they also go in the index
+REQUIREMENTS_NAME = "requirements.txt"
+
+
+def is_ignored(name: str) -> bool:
+    return name in IGNORED_NAMES or name.endswith(IGNORED_SUFFIXES)
+
+
+def list_artifacts(artifacts_dir: str) -> dict[str, tuple[int, str]]:
+    """Maps every artifact's POSIX relative path to its (size, sha256)."""
+    listing = {}
+    for root, dirs, names in os.walk(artifacts_dir):
+        dirs[:] = sorted(d for d in dirs if not is_ignored(d))
+        rel_dir = os.path.relpath(root, artifacts_dir).replace(os.sep, "/")
+        for name in sorted(names):
+            if is_ignored(name):
+                continue
+            rel_path = name if rel_dir == "." else f"{rel_dir}/{name}"
+            with open(os.path.join(root, name), "rb") as f:
+                data = f.read()
+            listing[rel_path] = (len(data), hashlib.sha256(data).hexdigest())
+    return listing
+
+
+def pack_artifacts(artifacts_dir: str, bundle_path: str):
+    """Writes `artifacts_dir` to `bundle_path` as a gzipped tar.
+
+    The first member is a JSON index (paths, sizes, digests, all template
+    sources and requirements.txt), so a reader gets the full listing, every
+    template and the venv's requirements without touching the rest of the
+    stream. Output is reproducible: members are sorted and carry no
+    timestamps or owners.
+    """
+    listing = list_artifacts(artifacts_dir)
+    index = {
+        "version": BUNDLE_VERSION,
+        "files": {path: list(meta) for path, meta in listing.items()},
+        "templates": {},
+        "requirements": None,
+    }
+    for rel_path in listing:
+        if rel_path.endswith(TEMPLATE_SUFFIX) or rel_path == REQUIREMENTS_NAME:
+            with open(os.path.join(artifacts_dir, rel_path), encoding="utf-8") as f:
+                text = f.read()
+            if rel_path == REQUIREMENTS_NAME:
+                index["requirements"] = text
+            else:
+                index["templates"][rel_path] = text
+
+    os.makedirs(os.path.dirname(bundle_path) or ".", exist_ok=True)
+    with (
+        open(bundle_path, "wb") as raw,
+        gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as gz,
+        tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar,
+    ):
+        _add_member(tar, INDEX_NAME, json.dumps(index).encode("utf-8"), 0o644)
+        for rel_path in listing:
+            path = os.path.join(artifacts_dir, rel_path)
+            with open(path, "rb") as f:
+                _add_member(tar, rel_path, f.read(), os.stat(path).st_mode & 0o777)
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes, mode: int):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    tar.addfile(info, io.BytesIO(data))
+
+
+@functools.cache
+def find_bundle() -> "ArtifactBundle | None":
+    """Returns the bundle built into the installed package, if there is one."""
+    resource = files("flask_scaffolder").joinpath(BUNDLE_NAME)
+    return ArtifactBundle(resource) if resource.is_file() else None
+
+
+class ArtifactBundle:
+    """Read side of a packed artifacts bundle.
+
+    Works from any importlib.resources location, including zipimport and
+    wheel installs, and only ever reads the bundle front to back. Reading the
+    index leaves the stream open just past it, so the first `members()` pass
+    continues from there and a scaffold opens the bundle once.
+    """
+
+    def __init__(self, resource):
+        self._resource = resource
+        self._lock = threading.Lock()
+        self._pending = None  # (pid, raw file, tarfile) positioned after the index
+
+    def __repr__(self) -> str:
+        return f"ArtifactBundle({self._resource})"
+
+    def __getstate__(self) -> dict:
+        # Open streams and locks stay in the process that created them
+        state = {"_resource": self._resource}
+        if "index" in self.__dict__:
+            state["index"] = self.__dict__["index"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__init__(state.pop("_resource"))
+        self.__dict__.update(state)
+
+    def _open(self):
+        """Opens the stream and reads the index member: (raw, tar, index)."""
+        raw = self._resource.open("rb")
+        try:
+            tar = tarfile.open(fileobj=raw, mode="r|gz")  # noqa: SIM115 - kept open
+            member = tar.next()
+            if member is None or member.name != INDEX_NAME:
+                raise ValueError(f"{self} has no index")
+            index = json.loads(tar.extractfile(member).read())
+        except BaseException:
+            raw.close()
+            raise
+        return raw, tar, index
+
+    @functools.cached_property
+    def index(self) -> dict:
+        raw, tar, index = self._open()
+        if index.get("version") != BUNDLE_VERSION:
+            raw.close()
+            raise ValueError(f"{self} has unsupported version {index.get('version')}")
+        with self._lock:
+            self.close()
+            self._pending = (os.getpid(), raw, tar)
+        return index
+
+    def listing(self) -> dict[str, tuple[int, str]]:
+        return {path: tuple(meta) for path, meta in self.index["files"].items()}
+
+    def close(self):
+        """Closes the stream left open by reading the index, if unused."""
+        pending, self._pending = self._pending, None
+        if pending is not None and pending[0] == os.getpid():
+            pending[2].close()
+            pending[1].close()
+
+    def members(self):
+        """Yields (rel_path, bytes, mode) for every file, in stream order."""
+        self.index  # noqa: B018 - checks the version before streaming
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is not None and pending[0] == os.getpid():
+            _, raw, tar = pending
+        else:
+            # Already streamed once, or inherited across a fork: the open
+            # stream (and its file offset) belongs to another reader
+            raw, tar, _ = self._open()
+        with raw, tar:
+            for member in tar:
+                if member.isfile() and member.name != INDEX_NAME:
+                    data = tar.extractfile(member).read()
+                    yield member.name, data, member.mode & 0o777
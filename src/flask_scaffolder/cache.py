@@ -0,0 +1,29 @@
+# src/flask_scaffolder/cache.py
+import hashlib
+import os
+
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+def cache_dir(*parts: str) -> str:
+    """Returns (and creates) a directory inside the per-user scaffolder cache.
+
+    The root can be moved with FLASK_SCAFFOLDER_CACHE_DIR, otherwise it follows
+    XDG_CACHE_HOME and falls back to ~/.cache/flask_scaffolder.
+    """
+    root = os.environ.get("FLASK_SCAFFOLDER_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "flask_scaffolder",
+    )
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_digest(path: str) -> str:
+    """Returns the hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,7 +1,7 @@
 # src/flask_scaffolder/cli.py
 import argparse
-
-from flask_scaffolder.core import scaffold_project
+import os
+import sys
 
 
 def main():
@@ -11,8 +11,8 @@ def main():
         default="my_project",
         help="Target directory for the scaffolded project.",
     )
-    parser.add_argument("--secret-key", required=True)
-    parser.add_argument("--database-uri", required=True)
+    parser.add_argument("--secret-key")
+    parser.add_argument("--database-uri")
     parser.add_argument("--flask-app", default="run.py")
     parser.add_argument("--smtp-server", default="")
     parser.add_argument("--smtp-port", type=int, default=587)
@@ -22,9 +22,89 @@ def main():
     parser.add_argument("--api-title", default="")
     parser.add_argument("--api-version", type=float, default=1.0)
     parser.add_argument("--api-description", default="")
+    parser.add_argument(
+        "--async",
+        dest="async_app",
+        action="store_true",
+        help="Generate an async-capable app: async views, an async SQLAlchemy"
+        " session and an ASGI entry point (asgi.py).",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Install dependencies only from the local wheel cache.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use or populate the wheel and virtualenv caches.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Scaffold every project listed in a YAML/JSON manifest.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count).",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help="Write a JSON timing report (default: <output>/scaffold-profile.json;"
+        " per project with --batch).",
+    )
     args = parser.parse_args()
+    if args.offline and args.no_cache:
+        parser.error("--offline requires the wheel cache; drop --no-cache")
+
+    context = _build_context(args)
+
+    if args.batch:
+        from flask_scaffolder.batch import load_batch_manifest, run_batch
+
+        defaults = {key: value for key, value in context.items() if value is not None}
+        try:
+            projects = load_batch_manifest(args.batch, defaults)
+        except (OSError, RuntimeError, ValueError) as e:
+            parser.error(str(e))
+        failures = run_batch(
+            projects,
+            offline=args.offline,
+            use_cache=not args.no_cache,
+            max_workers=args.workers,
+            profile=args.profile is not None,
+        )
+        sys.exit(1 if failures else 0)
+
+    if not args.secret_key or not args.database_uri:
+        parser.error("--secret-key and --database-uri are required without --batch")
+
+    # Imported only now so --help and argument errors never load Jinja2
+    from flask_scaffolder.core import scaffold_project
+
+    profile_path = None
+    if args.profile is not None:
+        profile_path = args.profile or os.path.join(
+            args.output, "scaffold-profile.json"
+        )
+
+    scaffold_project(
+        args.output,
+        context,
+        offline=args.offline,
+        use_cache=not args.no_cache,
+        profile_path=profile_path,
+    )
+
 
-    context = {
+def _build_context(args: argparse.Namespace) -> dict:
+    return {
         "SECRET_KEY": args.secret_key,
         "DATABASE_URI": args.database_uri,
         "FLASK_APP": args.flask_app,
@@ -36,8 +116,8 @@ def main():
         "API_TITLE": args.api_title,
         "API_VERSION": args.api_version,
         "API_DESCRIPTION": args.api_description,
+        "ASYNC": args.async_app,
     }
-    scaffold_project(args.output, context)
 
 
 if __name__ == "__main__":
@@ -1,57 +1,286 @@
 # src/flask_scaffolder/core.py
+import functools
+import hashlib
 import logging
 import os
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+from typing import NamedTuple
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from flask_scaffolder.bundle import (
+    IGNORED_NAMES,  # noqa: F401 - re-exported
+    REQUIREMENTS_NAME,
+    TEMPLATE_SUFFIX,
+    ArtifactBundle,
+    find_bundle,
+    list_artifacts,
+)
+from flask_scaffolder.cache import cache_dir, file_digest
+from flask_scaffolder.manifest import (
+    is_unmodified,
+    load_manifest,
+    make_record,
+    save_manifest,
+    scan_existing,
+)
+from flask_scaffolder.profiling import ScaffoldProfiler
+from flask_scaffolder.tasks import TaskGraph
 
-from jinja2 import Environment, FileSystemLoader
-
-# Use importlib.resources to locate the artifacts folder
 try:
-    from importlib.resources import files  # Python 3.9+
+    import fcntl  # POSIX only, used for reflink (FICLONE) copies
 except ImportError:
-    from importlib_resources import files  # For older Python versions
-
-
-def setup_logger(log_file_path: str):
+    fcntl = None
+
+MAIN_FILES = [
+    ".gitignore",
+    "requirements.txt",
+    ".pre-commit-config.yaml",
+    "pyproject.toml",
+    "run.py",
+]
+REQUIRED_DIRS = ["app"]
+OPTIONAL_DIRS = [".vscode", "templates", "static", "migrations", "tests"]
+# Overlays materialized only when their context flag is set; their files land
+# at the project root, so `async/asgi.py` becomes `asgi.py`
+FEATURE_DIRS = {"async": "ASYNC"}
+
+# ioctl request number for FICLONE (Linux: btrfs, xfs, bcachefs, ...)
+_FICLONE = 0x40049409
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class ArtifactEntry(NamedTuple):
+    """A single file to materialize, as a POSIX path relative to the artifacts root."""
+
+    rel_path: str
+    size: int
+    digest: str  # SHA-256 of the artifact file (template source for `.j2`)
+
+    @property
+    def is_template(self) -> bool:
+        return self.rel_path.endswith(TEMPLATE_SUFFIX)
+
+    @property
+    def feature(self) -> str | None:
+        """The FEATURE_DIRS overlay this entry belongs to, if any."""
+        top = self.rel_path.split("/", 1)[0]
+        return top if top in FEATURE_DIRS and "/" in self.rel_path else None
+
+    @property
+    def output_path(self) -> str:
+        """Path inside the generated project (`.j2` suffix and overlay dropped)."""
+        path = self.rel_path
+        if self.is_template:
+            path = path[: -len(TEMPLATE_SUFFIX)]
+        if self.feature:
+            path = path.split("/", 1)[1]
+        return path
+
+    @property
+    def phase(self) -> str:
+        """Profiling phase this entry's work is accounted to."""
+        if self.is_template:
+            return "template_render"
+        if self.rel_path.split("/", 1)[0] in OPTIONAL_DIRS:
+            return "optional_dirs"
+        return "main_file_copy"
+
+
+def setup_logger(log_file_path: str | None = None):
     logger = logging.getLogger("flask_scaffolder")
     logger.setLevel(logging.INFO)
+    for handler in logger.handlers:
+        handler.close()  # Batch runs reconfigure the logger once per project
     logger.handlers.clear()
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter("🔧 %(levelname)s: %(message)s"))
     logger.addHandler(console_handler)
 
-    file_handler = logging.FileHandler(log_file_path)
-    file_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    )
-    logger.addHandler(file_handler)
+    if log_file_path:
+        file_handler = logging.FileHandler(log_file_path)
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        )
+        logger.addHandler(file_handler)
 
     return logger
 
 
+def _new_environment(loader) -> Environment:
+    # Compiled templates are kept in memory for the life of the process and
+    # their bytecode is persisted in the user cache, so repeated and batch
+    # scaffolds never re-parse a template.
+    return Environment(
+        loader=loader,
+        bytecode_cache=FileSystemBytecodeCache(cache_dir("jinja")),
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+@functools.cache
+def get_template_environment(template_dir: str) -> Environment:
+    """Process-wide Jinja environment for templates under `template_dir`."""
+    return _new_environment(FileSystemLoader(template_dir))
+
+
+@functools.cache
+def get_bundle_environment(bundle: ArtifactBundle) -> Environment:
+    """Process-wide Jinja environment for the templates packed in `bundle`."""
+    return _new_environment(DictLoader(bundle.index["templates"]))
+
+
+def _environment_for(artifacts_dir: str | None, bundle: ArtifactBundle | None):
+    if bundle is not None:
+        return get_bundle_environment(bundle)
+    return get_template_environment(artifacts_dir)
+
+
+def warm_templates(
+    artifacts_dir: str | None,
+    entries: list[ArtifactEntry],
+    bundle: ArtifactBundle | None = None,
+):
+    """Compiles every template artifact into the shared environment up front."""
+    env = _environment_for(artifacts_dir, bundle)
+    for entry in entries:
+        if entry.is_template:
+            env.get_template(entry.rel_path)
+
+
+def _render_bytes(env: Environment, template_file: str, context: dict) -> bytes:
+    template = env.get_template(template_file.replace(os.sep, "/"))
+    return template.render(context).encode("utf-8")
+
+
+def _write_bytes(
+    path: str, data: bytes, exclusive: bool = False, mode: int | None = None
+) -> bool:
+    """Writes `data` to `path`; with `exclusive`, never overwrites an existing file.
+
+    With `mode`, the file gets exactly those permission bits, like a copy.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    try:
+        fd = os.open(path, flags | getattr(os, "O_BINARY", 0), 0o644)
+    except FileExistsError:
+        return False
+    with open(fd, "wb") as f:
+        f.write(data)
+    if mode is not None:
+        os.chmod(path, mode)
+    return True
+
+
 def render_jinja_template(template_dir, template_file, output_path, context, logger):
-    if os.path.exists(output_path):
-        logger.info(f"⏩ Skipped rendering .env (already exists): {output_path}")
-        return
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template(template_file)
-    content = template.render(context)
-    with open(output_path, "w") as f:
-        f.write(content)
-    logger.info(f"✅ Rendered: {output_path}")
+    env = get_template_environment(template_dir)
+    content = _render_bytes(env, template_file, context)
+    if _write_bytes(output_path, content, exclusive=True):
+        logger.info(f"✅ Rendered: {output_path}")
+    else:
+        logger.info(
+            f"⏩ Skipped rendering {template_file} (already exists): {output_path}"
+        )
+
+
+def run_command(
+    cmd: list, name: str, logger, profiler: ScaffoldProfiler | None = None, **kwargs
+):
+    """Runs `cmd` to completion, streaming its output into `logger` line by line.
+
+    Raises CalledProcessError on a non-zero exit, like subprocess.run(check=True),
+    and records the duration on `profiler`.
+    """
+    started = time.perf_counter()
+    returncode = None
+    try:
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            **kwargs,
+        ) as proc:
+            for line in proc.stdout:
+                logger.info(f"   [{name}] {line.rstrip()}")
+            returncode = proc.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+    finally:
+        if profiler is not None:
+            profiler.add_subprocess(
+                name, cmd, time.perf_counter() - started, returncode
+            )
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> None:
+    # Prefer a reflink, then an in-kernel copy; only fall back to reading
+    # the bytes through Python when neither is supported.
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass  # Filesystem (or file pair) does not support reflinks
+
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                written = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if written == 0:
+                    break
+                copied += written
+            return
+        except OSError:
+            if copied:
+                raise
+
+    with (
+        open(src_fd, "rb", closefd=False) as fsrc,
+        open(dst_fd, "wb", closefd=False) as fdst,
+    ):
+        shutil.copyfileobj(fsrc, fdst, _COPY_CHUNK_SIZE)
+
+
+def _fast_copy(src: str, dst: str, exclusive: bool = False) -> bool:
+    """Copies contents and mode bits; with `exclusive`, never overwrites `dst`."""
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    flags |= getattr(os, "O_BINARY", 0)
+    with open(src, "rb") as fsrc:
+        st = os.fstat(fsrc.fileno())
+        try:
+            dst_fd = os.open(dst, flags, 0o600)
+        except FileExistsError:
+            return False
+        try:
+            _copy_fd(fsrc.fileno(), dst_fd, st.st_size)
+        except BaseException:
+            os.close(dst_fd)
+            os.unlink(dst)
+            raise
+        os.close(dst_fd)
+    os.chmod(dst, st.st_mode & 0o7777)
+    return True
 
 
 def copy_file(src_dir, file_name, dest_dir, logger):
     src = os.path.join(src_dir, file_name)
     dst = os.path.join(dest_dir, file_name)
-    if os.path.exists(dst):
-        logger.info(f"⏩ Skipped (already exists): {dst}")
-        return
     try:
-        shutil.copy(src, dst)
-        logger.info(f"✅ Copied: {dst}")
+        if _fast_copy(src, dst, exclusive=True):
+            logger.info(f"✅ Copied: {dst}")
+        else:
+            logger.info(f"⏩ Skipped (already exists): {dst}")
     except Exception as e:
         logger.error(f"❌ Failed to copy {file_name}: {e}")
 
@@ -62,94 +291,462 @@ def copy_directory(src_dir, dst_dir, logger):
         logger.info(f"⏩ Skipped directory (already exists): {dest}")
         return
     try:
-        shutil.copytree(src_dir, dest)
+        shutil.copytree(src_dir, dest, copy_function=_fast_copy)
         logger.info(f"✅ Cloned directory: {dest}")
     except Exception as e:
         logger.error(f"❌ Failed to copy directory {src_dir}: {e}")
 
 
-def scaffold_project(target_dir: str, context: dict):
-    os.makedirs(target_dir, exist_ok=True)
+def index_artifacts(
+    artifacts_dir: str | None, logger, bundle: ArtifactBundle | None = None
+) -> list[ArtifactEntry]:
+    """Lists the artifacts once and returns every file to materialize.
+
+    Any `*.j2` artifact is a template rendered to the name without the suffix,
+    so `pyproject.toml.j2` stands in for `pyproject.toml`. With a `bundle`,
+    the listing comes from its index instead of walking `artifacts_dir`.
+    """
+    listing = bundle.listing() if bundle is not None else list_artifacts(artifacts_dir)
+
+    entries = []
+    for name in MAIN_FILES:
+        rel_path = name if name in listing else name + TEMPLATE_SUFFIX
+        if rel_path not in listing:
+            logger.warning(f"⚠️ '{name}' not found in artifacts")
+            continue
+        entries.append(ArtifactEntry(rel_path, *listing[rel_path]))
+
+    indexed = {e.rel_path for e in entries}
+    for rel_path in sorted(listing):
+        if "/" in rel_path or rel_path in indexed:
+            continue
+        if rel_path.endswith(TEMPLATE_SUFFIX):
+            entries.append(ArtifactEntry(rel_path, *listing[rel_path]))
+
+    for folder in REQUIRED_DIRS + OPTIONAL_DIRS:
+        found = sorted(path for path in listing if path.startswith(f"{folder}/"))
+        if not found:
+            logger.warning(f"⚠️ '{folder}/' not found in artifacts")
+            continue
+        entries.extend(ArtifactEntry(path, *listing[path]) for path in found)
+
+    for folder in FEATURE_DIRS:
+        found = sorted(path for path in listing if path.startswith(f"{folder}/"))
+        entries.extend(ArtifactEntry(path, *listing[path]) for path in found)
+
+    return entries
+
+
+def select_entries(entries: list[ArtifactEntry], context: dict) -> list[ArtifactEntry]:
+    """Drops the overlay entries of features `context` does not turn on."""
+    return [
+        entry
+        for entry in entries
+        if entry.feature is None or context.get(FEATURE_DIRS[entry.feature])
+    ]
+
+
+class _Materializer:
+    """Per-run state for materialize_artifacts; `run` is called from threads."""
+
+    def __init__(
+        self,
+        artifacts_dir: str | None,
+        target_dir: str,
+        context: dict,
+        env: Environment,
+        logger,
+        profiler: ScaffoldProfiler,
+    ):
+        self.artifacts_dir = artifacts_dir
+        self.target_dir = target_dir
+        self.context = context
+        self.env = env
+        self.logger = logger
+        self.profiler = profiler
+        self.previous = {}
+        self.existing = {}
+
+    def run(
+        self, entry: ArtifactEntry, data: bytes | None = None, mode: int | None = None
+    ):
+        """Materializes one entry and returns (manifest key, new record).
+
+        `data` and `mode` are the artifact's content and permission bits when
+        it is not read from disk.
+        """
+        key = entry.output_path
+        record = self.previous.get(key)
+        try:
+            with self.profiler.span(entry.phase):
+                record = self._materialize(entry, record, data, mode)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to materialize {entry.rel_path}: {e}")
+        return key, record
+
+    def _materialize(self, entry: ArtifactEntry, record: dict | None, data, mode):
+        dst = os.path.join(self.target_dir, entry.output_path)
+        content, digest = data, entry.digest
+        if entry.is_template:
+            content = _render_bytes(self.env, entry.rel_path, self.context)
+            digest = hashlib.sha256(content).hexdigest()
+
+        st = self.existing.get(entry.output_path)
+        if st is None:
+            if not self._write(entry, dst, content, mode, exclusive=True):
+                self.logger.info(f"⏩ Skipped (already exists): {dst}")
+                return record
+            action = "Rendered" if entry.is_template else "Copied"
+            self.logger.info(f"✅ {action}: {dst}")
+            return self._record(dst, digest)
+
+        if record is None:
+            # Not written by the scaffolder; adopt it only if it already matches
+            self.logger.info(f"⏩ Skipped (already exists): {dst}")
+            return make_record(dst, digest) if file_digest(dst) == digest else None
+
+        if record["digest"] == digest:
+            self.logger.info(f"⏩ Skipped (up to date): {dst}")
+            return record
+
+        if not is_unmodified(dst, st, record):
+            self.logger.warning(f"✋ Kept local changes (artifact updated): {dst}")
+            return record
+
+        self._write(entry, dst, content, mode, exclusive=False)
+        self.logger.info(f"🔄 Updated: {dst}")
+        return self._record(dst, digest)
+
+    def _write(self, entry: ArtifactEntry, dst: str, content, mode, exclusive: bool):
+        if content is not None:
+            return _write_bytes(dst, content, exclusive=exclusive, mode=mode)
+        src = os.path.join(self.artifacts_dir, entry.rel_path)
+        return _fast_copy(src, dst, exclusive=exclusive)
+
+    def _record(self, dst: str, digest: str) -> dict:
+        record = make_record(dst, digest)
+        self.profiler.add_bytes(record["size"])
+        return record
+
+
+def materialize_artifacts(
+    artifacts_dir: str | None,
+    entries: list[ArtifactEntry],
+    target_dir: str,
+    context: dict,
+    logger,
+    max_workers: int | None = None,
+    profiler: ScaffoldProfiler | None = None,
+    bundle: ArtifactBundle | None = None,
+):
+    """Renders and copies all indexed artifacts from a bounded thread pool.
+
+    Written files are tracked by content hash in the project's scaffold
+    manifest. A re-run rewrites a file only if its artifact changed since it
+    was last written and the copy on disk was not modified locally; all other
+    files are settled from one bulk stat per directory and the recorded hashes.
+
+    With a `bundle`, files are streamed out of it in a single sequential pass
+    and handed to the pool as they are read.
+    """
+    rel_dirs = sorted({os.path.dirname(e.output_path) for e in entries})
+    for rel_dir in rel_dirs:
+        if rel_dir:
+            os.makedirs(os.path.join(target_dir, rel_dir), exist_ok=True)
+
+    materializer = _Materializer(
+        artifacts_dir,
+        target_dir,
+        context,
+        _environment_for(artifacts_dir, bundle),
+        logger,
+        profiler or ScaffoldProfiler(),
+    )
+    materializer.previous = load_manifest(target_dir)
+    materializer.existing = scan_existing(target_dir, rel_dirs)
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="scaffold-copy"
+    ) as pool:
+        if bundle is None:
+            results = list(pool.map(materializer.run, entries))
+        else:
+            results = _stream_bundle(bundle, entries, materializer, pool, workers)
+
+    records = dict(materializer.previous)
+    for key, record in results:
+        if record is None:
+            records.pop(key, None)
+        else:
+            records[key] = record
+    save_manifest(target_dir, records)
+
+
+def _stream_bundle(bundle, entries, materializer: _Materializer, pool, workers: int):
+    wanted = {entry.rel_path: entry for entry in entries}
+    # Cap how many read-but-unwritten members are held in memory at once
+    slots = threading.BoundedSemaphore(workers * 2)
 
+    def run(entry: ArtifactEntry, data: bytes | None, mode: int | None):
+        try:
+            return materializer.run(entry, data, mode)
+        finally:
+            slots.release()
+
+    futures = []
+    for rel_path, data, mode in bundle.members():
+        entry = wanted.pop(rel_path, None)
+        if entry is None:
+            continue
+        slots.acquire()
+        # Templates render from the bundle index, not from the raw member
+        if entry.is_template:
+            data = mode = None
+        futures.append(pool.submit(run, entry, data, mode))
+
+    for rel_path in wanted:
+        materializer.logger.error(f"❌ Failed to materialize {rel_path}: not in bundle")
+    return [future.result() for future in futures]
+
+
+def _artifact_requirements(
+    artifacts_dir: str | None, bundle: ArtifactBundle | None
+) -> str | None:
+    """Path of the artifacts' requirements.txt, pulled out of `bundle` if needed.
+
+    The project's copy is identical, so the venv can be chosen from this one
+    before the project files have landed. A bundle carries it in its index,
+    so this never reads past the index.
+    """
+    if bundle is None:
+        return os.path.join(artifacts_dir, REQUIREMENTS_NAME)
+
+    meta = bundle.listing().get(REQUIREMENTS_NAME)
+    if meta is None:
+        return None
+    path = os.path.join(cache_dir("requirements"), f"{meta[1]}.txt")
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        _write_bytes(tmp_path, bundle.index["requirements"].encode("utf-8"))
+        os.replace(tmp_path, path)
+    return path
+
+
+def get_artifacts_dir() -> str:
     # Locate the artifacts folder using importlib.resources
-    artifacts_dir = str(files("flask_scaffolder").parent.joinpath("artifacts"))
+    return str(files("flask_scaffolder").parent.joinpath("artifacts"))
+
+
+def locate_artifacts() -> tuple[str | None, ArtifactBundle | None]:
+    """Returns (artifacts_dir, bundle): the packed bundle when the installed
+    package ships one, otherwise the loose artifacts folder (source checkouts).
+    """
+    bundle = find_bundle()
+    if bundle is not None:
+        return None, bundle
+    return get_artifacts_dir(), None
+
+
+def scaffold_project(
+    target_dir: str,
+    context: dict,
+    offline: bool = False,
+    use_cache: bool = True,
+    artifacts_dir: str | None = None,
+    entries: list[ArtifactEntry] | None = None,
+    profile_path: str | None = None,
+    bundle: ArtifactBundle | None = None,
+):
+    """Scaffolds one project into `target_dir`.
+
+    Artifacts come from `bundle` or `artifacts_dir`, located automatically
+    when neither is given; overlays (FEATURE_DIRS) are included when their
+    context flag is set, e.g. `ASYNC` for the async app. Batch runs pass a
+    pre-built `entries` index so the artifacts are only listed once per
+    process. With `profile_path`, a JSON timing report of every phase is
+    written there.
+
+    Setup steps run as a task graph: the venv is created (or cloned) while
+    files are copied, `git init` runs while pip installs, and a failed step
+    cancels only the steps that depend on it.
+    """
+    profiler = ScaffoldProfiler()
+    os.makedirs(target_dir, exist_ok=True)
+    if artifacts_dir is None and bundle is None:
+        artifacts_dir, bundle = locate_artifacts()
 
     log_file_path = os.path.join(target_dir, "scaffold.log")
     logger = setup_logger(log_file_path)
     logger.info("🚀 Starting project scaffold...")
 
-    render_jinja_template(
-        artifacts_dir, ".env.j2", os.path.join(target_dir, ".env"), context, logger
+    if entries is None:
+        with profiler.span("index_artifacts"):
+            entries = index_artifacts(artifacts_dir, logger, bundle)
+    entries = select_entries(entries, context)
+
+    def materialize():
+        materialize_artifacts(
+            artifacts_dir,
+            entries,
+            target_dir,
+            context,
+            logger,
+            profiler=profiler,
+            bundle=bundle,
+        )
+
+    graph = TaskGraph(logger)
+    graph.add("materialize", _timed(profiler, "materialize", materialize))
+    _add_setup_tasks(
+        graph,
+        target_dir,
+        _artifact_requirements(artifacts_dir, bundle),
+        logger,
+        offline,
+        use_cache,
+        profiler,
     )
-    _copy_main_files(artifacts_dir, target_dir, logger)
-    _copy_optional_dirs(artifacts_dir, target_dir, logger)
-    _setup_virtualenv_and_dependencies(target_dir, logger)
+    graph.run()
+
+    if profile_path:
+        profiler.write(profile_path)
+        logger.info(f"⏱️ Wrote profile report: {profile_path}")
+
+
+def _add_setup_tasks(
+    graph: TaskGraph,
+    target_dir: str,
+    artifact_requirements: str | None,
+    logger,
+    offline: bool,
+    use_cache: bool,
+    profiler: ScaffoldProfiler,
+):
+    """Adds the venv, pip, git and pre-commit steps after "materialize"."""
+    venv_path = os.path.join(target_dir, ".venv")
+    requirements = os.path.join(target_dir, "requirements.txt")
+    state = {"installed": False}
 
+    def create_venv():
+        state["installed"] = _create_virtualenv(
+            venv_path, artifact_requirements, logger, offline, use_cache, profiler
+        )
 
-def _copy_main_files(artifacts_dir: str, target_dir: str, logger):
-    for f in [
-        ".gitignore",
-        "requirements.txt",
-        ".pre-commit-config.yaml",
-        "pyproject.toml",
+    def install_requirements():
+        if state["installed"]:
+            return
+        _install_requirements(
+            venv_path, requirements, logger, offline, use_cache, profiler
+        )
+
+    def git_init():
+        _git_init(target_dir, logger, profiler)
+
+    def install_pre_commit():
+        _install_pre_commit(target_dir, venv_path, logger, profiler)
+
+    for name, func, deps in [
+        ("venv_create", create_venv, ()),
+        ("pip_install", install_requirements, ("venv_create", "materialize")),
+        ("git_init", git_init, ()),
+        (
+            "pre_commit_install",
+            install_pre_commit,
+            ("materialize", "pip_install", "git_init"),
+        ),
     ]:
-        copy_file(artifacts_dir, f, target_dir, logger)
+        graph.add(name, _timed(profiler, name, func), deps)
 
-    app_dir = os.path.join(artifacts_dir, "app")
-    if os.path.exists(app_dir):
-        copy_directory(app_dir, target_dir, logger)
-    else:
-        logger.warning("⚠️ 'app/' not found in artifacts")
 
+def _timed(profiler: ScaffoldProfiler, name: str, func):
+    def run():
+        with profiler.span(name):
+            func()
 
-def _copy_optional_dirs(artifacts_dir: str, target_dir: str, logger):
-    for folder in [".vscode", "templates", "static"]:
-        path = os.path.join(artifacts_dir, folder)
-        if os.path.exists(path):
-            copy_directory(path, target_dir, logger)
-        else:
-            logger.warning(f"⚠️ '{folder}/' not found in artifacts")
+    return run
 
 
-def _setup_virtualenv_and_dependencies(target_dir: str, logger):
-    logger.info("📦 Creating virtual environment and installing dependencies...")
-    venv_path = os.path.join(target_dir, ".venv")
+def _create_virtualenv(
+    venv_path: str,
+    requirements: str | None,
+    logger,
+    offline: bool,
+    use_cache: bool,
+    profiler: ScaffoldProfiler,
+) -> bool:
+    """Creates the project venv; returns True if it came with requirements."""
+    if os.path.exists(venv_path):
+        logger.info(f"⏩ Skipped virtual environment (already exists): {venv_path}")
+        return False
 
-    if not os.path.exists(venv_path):
-        try:
-            import venv
+    if use_cache and requirements and os.path.exists(requirements):
+        from flask_scaffolder import venv_cache
 
-            venv.create(venv_path, with_pip=True)
-            logger.info(f"✅ Created virtual environment: {venv_path}")
+        try:
+            golden = venv_cache.ensure_golden_venv(
+                requirements, logger, offline, profiler
+            )
+            venv_cache.clone_venv(golden, venv_path)
+            logger.info(f"✅ Cloned cached virtual environment: {venv_path}")
+            return True
         except Exception as e:
-            logger.error(f"❌ Failed to create venv: {e}")
-            return
-    else:
-        logger.info(f"⏩ Skipped virtual environment (already exists): {venv_path}")
+            shutil.rmtree(venv_path, ignore_errors=True)
+            logger.warning(f"⚠️ Virtual environment cache unavailable: {e}")
 
+    logger.info("📦 Creating virtual environment...")
+    import venv
+
+    venv.create(venv_path, with_pip=True)
+    logger.info(f"✅ Created virtual environment: {venv_path}")
+    return False
+
+
+def _install_requirements(
+    venv_path: str,
+    requirements: str,
+    logger,
+    offline: bool,
+    use_cache: bool,
+    profiler: ScaffoldProfiler,
+):
     pip_path = os.path.join(venv_path, "bin", "pip")
-    py_path = os.path.join(venv_path, "bin", "python")
-    requirements = os.path.join(target_dir, "requirements.txt")
-    pre_commit = os.path.join(target_dir, ".pre-commit-config.yaml")
+    if not os.path.exists(pip_path) or not os.path.exists(requirements):
+        logger.warning("⚠️ Missing pip or requirements.txt; skipped install")
+        return
 
-    try:
-        if os.path.exists(pip_path) and os.path.exists(requirements):
-            subprocess.run([pip_path, "install", "-r", requirements], check=True)
-            logger.info("✅ Installed requirements")
-
-        if not os.path.exists(os.path.join(target_dir, ".git")):
-            subprocess.run(["git", "init"], cwd=target_dir, check=True)
-            logger.info("✅ Initialized Git repository")
-
-        if os.path.exists(pre_commit) and os.path.exists(py_path):
-            subprocess.run(
-                [".venv/bin/python", "-m", "pre_commit", "install"],
-                cwd=target_dir,
-                check=True,
-            )
-            logger.info("✅ pre-commit installed and hooks set")
-        else:
-            logger.warning("⚠️ Missing pre-commit config or Python executable")
+    from flask_scaffolder import venv_cache
 
-    except Exception as e:
-        logger.error(f"❌ Error during post-install: {e}")
+    logger.info("📦 Installing dependencies...")
+    venv_cache.install_requirements(
+        pip_path,
+        requirements,
+        logger,
+        offline=offline,
+        use_cache=use_cache,
+        profiler=profiler,
+    )
+    logger.info("✅ Installed requirements")
+
+
+def _git_init(target_dir: str, logger, profiler: ScaffoldProfiler):
+    if os.path.exists(os.path.join(target_dir, ".git")):
+        return
+    run_command(["git", "init"], "git_init", logger, profiler, cwd=target_dir)
+    logger.info("✅ Initialized Git repository")
+
+
+def _install_pre_commit(target_dir: str, venv_path, logger, profiler):
+    pre_commit = os.path.join(target_dir, ".pre-commit-config.yaml")
+    py_path = os.path.join(venv_path, "bin", "python")
+    if not os.path.exists(pre_commit) or not os.path.exists(py_path):
+        logger.warning("⚠️ Missing pre-commit config or Python executable")
+        return
+    run_command(
+        [".venv/bin/python", "-m", "pre_commit", "install"],
+        "pre_commit_install",
+        logger,
+        profiler,
+        cwd=target_dir,
+    )
+    logger.info("✅ pre-commit installed and hooks set")
@@ -0,0 +1,68 @@
+# src/flask_scaffolder/manifest.py
+import json
+import os
+
+from flask_scaffolder.cache import file_digest
+
+MANIFEST_FILE = ".scaffold-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def load_manifest(target_dir: str) -> dict[str, dict]:
+    """Returns the recorded files of a previous scaffold ({} if there is none)."""
+    try:
+        with open(os.path.join(target_dir, MANIFEST_FILE)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_manifest(target_dir: str, records: dict[str, dict]):
+    path = os.path.join(target_dir, MANIFEST_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {"version": MANIFEST_VERSION, "files": dict(sorted(records.items()))},
+            f,
+            indent=2,
+        )
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def scan_existing(target_dir: str, rel_dirs) -> dict[str, os.stat_result]:
+    """Stats every file in `rel_dirs` with one scandir per directory.
+
+    Keys are POSIX-style paths relative to `target_dir`, like manifest keys.
+    """
+    existing = {}
+    for rel_dir in rel_dirs:
+        try:
+            with os.scandir(os.path.join(target_dir, rel_dir)) as it:
+                for item in it:
+                    if item.is_file():
+                        key = f"{rel_dir}/{item.name}" if rel_dir else item.name
+                        existing[key.replace(os.sep, "/")] = item.stat()
+        except FileNotFoundError:
+            continue
+    return existing
+
+
+def make_record(path: str, digest: str) -> dict:
+    st = os.stat(path)
+    return {"digest": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def is_unmodified(path: str, st: os.stat_result, record: dict) -> bool:
+    """True if the file still holds what the scaffolder last wrote there.
+
+    Only hashes the file when size matches but the mtime moved.
+    """
+    if st.st_size != record["size"]:
+        return False
+    if st.st_mtime_ns == record["mtime_ns"]:
+        return True
+    return file_digest(path) == record["digest"]
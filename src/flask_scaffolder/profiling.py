@@ -0,0 +1,81 @@
+# src/flask_scaffolder/profiling.py
+import json
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ScaffoldProfiler:
+    """Collects per-phase timings, bytes written and subprocess durations.
+
+    Spans may be opened from worker threads; their CPU time is the thread's
+    own, while the report totals cover the whole process and its children.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self._started_times = os.times()
+        self.phases = {}
+        self.subprocesses = []
+        self.bytes_written = 0
+        self.files_written = 0
+
+    @contextmanager
+    def span(self, name: str):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+    def add_phase(self, name: str, wall: float, cpu: float):
+        with self._lock:
+            phase = self.phases.setdefault(
+                name, {"wall_time": 0.0, "cpu_time": 0.0, "count": 0}
+            )
+            phase["wall_time"] += wall
+            phase["cpu_time"] += cpu
+            phase["count"] += 1
+
+    def add_bytes(self, size: int):
+        with self._lock:
+            self.bytes_written += size
+            self.files_written += 1
+
+    def add_subprocess(self, name: str, argv: list, duration: float, returncode):
+        with self._lock:
+            self.subprocesses.append(
+                {
+                    "name": name,
+                    "argv": [str(arg) for arg in argv],
+                    "duration": duration,
+                    "returncode": returncode,
+                }
+            )
+
+    def report(self) -> dict:
+        times = os.times()
+        children_cpu = (times.children_user - self._started_times.children_user) + (
+            times.children_system - self._started_times.children_system
+        )
+        with self._lock:
+            return {
+                "version": 1,
+                "python": platform.python_version(),
+                "wall_time": time.perf_counter() - self._started_wall,
+                "cpu_time": time.process_time() - self._started_cpu,
+                "children_cpu_time": children_cpu,
+                "bytes_written": self.bytes_written,
+                "files_written": self.files_written,
+                "phases": {name: dict(phase) for name, phase in self.phases.items()},
+                "subprocesses": list(self.subprocesses),
+            }
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,62 @@
+# src/flask_scaffolder/tasks.py
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+OK = "ok"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class TaskGraph:
+    """Runs named steps on a thread pool as soon as their dependencies succeed.
+
+    A step that raises is marked failed, and every step depending on it
+    (directly or transitively) is cancelled without being started.
+    """
+
+    def __init__(self, logger):
+        self._logger = logger
+        self._tasks = {}
+
+    def add(self, name: str, func: Callable[[], None], deps=()):
+        unknown = [dep for dep in deps if dep not in self._tasks]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown {unknown}")
+        self._tasks[name] = (func, tuple(deps))
+
+    def run(self) -> dict[str, str]:
+        """Runs every task and returns each one's final status."""
+        status = {}
+        pending = dict(self._tasks)
+        running = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max(len(self._tasks), 1), thread_name_prefix="scaffold-task"
+        ) as pool:
+            while pending or running:
+                for name, (func, deps) in list(pending.items()):
+                    blocked = [d for d in deps if status.get(d) in (FAILED, CANCELLED)]
+                    if blocked:
+                        del pending[name]
+                        status[name] = CANCELLED
+                        self._logger.warning(
+                            f"⏭️ Cancelled {name} (needs failed step {blocked[0]})"
+                        )
+                    elif all(status.get(d) == OK for d in deps):
+                        del pending[name]
+                        running[pool.submit(func)] = name
+
+                if not running:
+                    continue  # Cancellations above may unblock more pending tasks
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        status[name] = OK
+                    except Exception as e:
+                        status[name] = FAILED
+                        self._logger.error(f"❌ Step {name} failed: {e}")
+
+        return status
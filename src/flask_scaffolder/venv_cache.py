@@ -0,0 +1,159 @@
+# src/flask_scaffolder/venv_cache.py
+import hashlib
+import os
+import platform
+import shutil
+import sys
+import tempfile
+
+from flask_scaffolder.cache import cache_dir
+from flask_scaffolder.core import _fast_copy, run_command
+
+_COMPLETE_MARKER = ".complete"
+_BUILD_PATH_FILE = ".build-path"
+
+# Venv files that embed the absolute environment path (shebangs, activate
+# scripts, pyvenv.cfg). These are rewritten on clone instead of hardlinked.
+_REWRITE_DIRS = {"bin"}
+_REWRITE_FILES = {"pyvenv.cfg"}
+
+
+def requirements_key(requirements_path: str) -> str:
+    """Cache key for a requirements file on the running interpreter and platform."""
+    digest = hashlib.sha256()
+    with open(requirements_path, "rb") as f:
+        digest.update(f.read())
+    for part in (sys.implementation.cache_tag, sys.platform, platform.machine()):
+        digest.update(part.encode())
+    return digest.hexdigest()[:16]
+
+
+def _wheelhouse_path(key: str) -> str:
+    return os.path.join(cache_dir("wheels"), key)
+
+
+def build_wheelhouse(pip_path: str, requirements: str, logger, profiler=None) -> str:
+    """Builds (once) the wheel cache for `requirements` and returns its path."""
+    wheels = _wheelhouse_path(requirements_key(requirements))
+    marker = os.path.join(wheels, _COMPLETE_MARKER)
+    if os.path.exists(marker):
+        return wheels
+
+    logger.info(f"📦 Building wheel cache: {wheels}")
+    run_command(
+        [pip_path, "wheel", "--wheel-dir", wheels, "-r", requirements],
+        "pip_wheel",
+        logger,
+        profiler,
+    )
+    open(marker, "w").close()
+    return wheels
+
+
+def install_requirements(
+    pip_path: str,
+    requirements: str,
+    logger,
+    offline: bool = False,
+    use_cache: bool = True,
+    profiler=None,
+):
+    """Installs `requirements`, going through the wheel cache unless disabled."""
+    if not use_cache:
+        run_command(
+            [pip_path, "install", "-r", requirements], "pip_install", logger, profiler
+        )
+        return
+
+    wheels = _wheelhouse_path(requirements_key(requirements))
+    if not os.path.exists(os.path.join(wheels, _COMPLETE_MARKER)):
+        if offline:
+            raise RuntimeError(
+                f"No cached wheels for {requirements}; run once without --offline"
+            )
+        build_wheelhouse(pip_path, requirements, logger, profiler)
+
+    run_command(
+        [pip_path, "install", "--no-index", "--find-links", wheels, "-r", requirements],
+        "pip_install",
+        logger,
+        profiler,
+    )
+
+
+def ensure_golden_venv(
+    requirements: str, logger, offline: bool = False, profiler=None
+) -> str:
+    """Returns the cached venv for `requirements`, building it on first use."""
+    venvs = cache_dir("venvs")
+    golden = os.path.join(venvs, requirements_key(requirements))
+    if os.path.exists(os.path.join(golden, _COMPLETE_MARKER)):
+        return golden
+
+    import venv
+
+    logger.info(f"📦 Building cached virtual environment: {golden}")
+    # Build under a private name and rename into place, so concurrent
+    # scaffolds never see (or clone) a half-installed environment.
+    staging = tempfile.mkdtemp(prefix=".build-", dir=venvs)
+    try:
+        venv.create(staging, with_pip=True, prompt=".venv")
+        install_requirements(
+            os.path.join(staging, "bin", "pip"),
+            requirements,
+            logger,
+            offline,
+            profiler=profiler,
+        )
+        with open(os.path.join(staging, _BUILD_PATH_FILE), "w") as f:
+            f.write(staging)
+        open(os.path.join(staging, _COMPLETE_MARKER), "w").close()
+        os.rename(staging, golden)
+    except OSError:
+        if not os.path.exists(os.path.join(golden, _COMPLETE_MARKER)):
+            raise
+        # Another scaffold won the race; use its environment
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return golden
+
+
+def clone_venv(golden: str, dest: str):
+    """Clones a cached venv into `dest` with hardlinks, rewriting embedded paths."""
+    with open(os.path.join(golden, _BUILD_PATH_FILE)) as f:
+        old_path = f.read().encode()
+    new_path = os.path.abspath(dest).encode()
+
+    for root, dirs, names in os.walk(golden):
+        rel_dir = os.path.relpath(root, golden)
+        out_dir = os.path.normpath(os.path.join(dest, rel_dir))
+        os.makedirs(out_dir, exist_ok=True)
+
+        for name in [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+            dirs.remove(name)  # e.g. lib64 -> lib; recreate, don't descend
+            names.append(name)
+
+        for name in names:
+            if rel_dir == "." and name in (_COMPLETE_MARKER, _BUILD_PATH_FILE):
+                continue
+            src = os.path.join(root, name)
+            dst = os.path.join(out_dir, name)
+
+            if os.path.islink(src):
+                target = os.fsencode(os.readlink(src)).replace(old_path, new_path)
+                os.symlink(os.fsdecode(target), dst)
+                continue
+
+            if rel_dir in _REWRITE_DIRS or (rel_dir == "." and name in _REWRITE_FILES):
+                with open(src, "rb") as f:
+                    data = f.read()
+                if old_path in data:
+                    with open(dst, "wb") as f:
+                        f.write(data.replace(old_path, new_path))
+                    shutil.copymode(src, dst)
+                    continue
+
+            try:
+                os.link(src, dst)
+            except OSError:
+                _fast_copy(src, dst)  # Cache lives on another filesystem
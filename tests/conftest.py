@@ -0,0 +1,20 @@
+# tests/conftest.py
+import logging
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def scaffolder_cache(tmp_path_factory):
+    """Keeps the Jinja bytecode, wheel and venv caches out of the user's home."""
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv(
+        "FLASK_SCAFFOLDER_CACHE_DIR", str(tmp_path_factory.mktemp("cache"))
+    )
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("flask_scaffolder.tests")
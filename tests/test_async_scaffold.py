@@ -0,0 +1,48 @@
+# tests/test_async_scaffold.py
+import subprocess
+import sys
+
+import pytest
+
+from flask_scaffolder import cli, core
+
+ARGS = ["--secret-key", "secret", "--database-uri", "sqlite:///db.sqlite3"]
+# The overlay's own tests, which include GET /health
+TESTS = "tests/test_async.py"
+
+
+@pytest.fixture
+def async_project(tmp_path, monkeypatch):
+    """`flask-scaffolder --async`, with venv, git and pre-commit stubbed out."""
+    monkeypatch.setattr(core, "_create_virtualenv", lambda *args, **kwargs: True)
+    monkeypatch.setattr(core, "_git_init", lambda *args, **kwargs: None)
+    monkeypatch.setattr(core, "_install_pre_commit", lambda *args, **kwargs: None)
+    target = tmp_path / "project"
+    argv = ["flask-scaffolder", "--output", str(target), *ARGS, "--async", "--no-cache"]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    cli.main()
+    return target
+
+
+def test_async_overlay_lands_on_top_of_the_app(async_project):
+    assert (async_project / "asgi.py").exists()
+    assert (async_project / "app" / "routes" / "health.py").exists()
+    assert (async_project / "tests" / "test_async.py").exists()
+    assert not (async_project / "async").exists()
+
+
+def test_async_project_serves_health(async_project):
+    for module in ("flask_restx", "flask_sqlalchemy", "aiosqlite", "a2wsgi"):
+        pytest.importorskip(module)
+
+    # The generated app imports as `app`, so it runs in its own interpreter
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", TESTS],
+        cwd=async_project,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode == 0, proc.stdout + proc.stderr
@@ -0,0 +1,95 @@
+# tests/test_batch.py
+import json
+import sys
+
+import pytest
+
+from flask_scaffolder import cli
+from flask_scaffolder.batch import load_batch_manifest
+
+
+def write(tmp_path, name: str, text: str) -> str:
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_manifest_contexts_layer_cli_and_manifest_defaults(tmp_path):
+    path = write(
+        tmp_path,
+        "batch.json",
+        json.dumps(
+            {
+                "defaults": {"DATABASE_URI": "sqlite://", "FLASK_CONFIG": "prod"},
+                "projects": [
+                    {"output": "a", "context": {"SECRET_KEY": "a"}},
+                    {
+                        "output": "b",
+                        "context": {"SECRET_KEY": "b", "FLASK_CONFIG": "dev"},
+                    },
+                ],
+            }
+        ),
+    )
+
+    projects = load_batch_manifest(path, {"FLASK_CONFIG": "test", "API_TITLE": "T"})
+
+    assert projects == [
+        (
+            "a",
+            {
+                "FLASK_CONFIG": "prod",
+                "API_TITLE": "T",
+                "DATABASE_URI": "sqlite://",
+                "SECRET_KEY": "a",
+            },
+        ),
+        (
+            "b",
+            {
+                "FLASK_CONFIG": "dev",
+                "API_TITLE": "T",
+                "DATABASE_URI": "sqlite://",
+                "SECRET_KEY": "b",
+            },
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("- output: a\n", "must be a mapping"),
+        ("just a string\n", "must be a mapping"),
+        ("", "must be a mapping"),
+        ("defaults: [1]\n", "'defaults' in .* must be a mapping"),
+        ("projects: {output: a}\n", "'projects' in .* must be a list"),
+        ("projects: [a]\n", "Project #0 .* must be a mapping"),
+        ("projects: [{output: a, context: [1]}]\n", "non-mapping 'context'"),
+        ("projects: [{context: {}}]\n", "has no 'output'"),
+        ("projects: [{output: a}]\n", "'a' is missing SECRET_KEY, DATABASE_URI"),
+        ("projects: [\n", "Invalid YAML"),
+    ],
+)
+def test_invalid_manifests_raise_value_error(tmp_path, text, message):
+    pytest.importorskip("yaml")  # The optional [batch] extra
+    path = write(tmp_path, "batch.yaml", text)
+
+    with pytest.raises(ValueError, match=message):
+        load_batch_manifest(path)
+
+
+def test_cli_reports_an_invalid_manifest_without_a_traceback(
+    tmp_path, monkeypatch, capsys
+):
+    pytest.importorskip("yaml")
+    path = write(tmp_path, "batch.yaml", "- output: a\n")
+    monkeypatch.setattr(sys, "argv", ["flask-scaffolder", "--batch", path])
+
+    with pytest.raises(SystemExit) as exited:
+        cli.main()
+
+    assert exited.value.code == 2
+    stderr = capsys.readouterr().err
+    assert "must be a mapping with a 'projects' list" in stderr
+    assert "Traceback" not in stderr
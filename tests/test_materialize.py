@@ -0,0 +1,156 @@
+# tests/test_materialize.py
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from flask_scaffolder import core
+from flask_scaffolder.bundle import ArtifactBundle, pack_artifacts
+from flask_scaffolder.manifest import MANIFEST_FILE
+
+CONTEXT = {
+    "SECRET_KEY": "secret",
+    "DATABASE_URI": "sqlite:///db.sqlite3",
+    "FLASK_APP": "run.py",
+    "ASYNC": True,
+}
+
+
+def materialize(target: Path, logger, bundle=None, **kwargs):
+    artifacts_dir = None if bundle else core.get_artifacts_dir()
+    entries = core.select_entries(
+        core.index_artifacts(artifacts_dir, logger, bundle), CONTEXT
+    )
+    core.materialize_artifacts(
+        artifacts_dir, entries, str(target), CONTEXT, logger, bundle=bundle, **kwargs
+    )
+    return entries
+
+
+def tree(root: Path) -> dict[str, tuple[bytes, int]]:
+    return {
+        path.relative_to(root).as_posix(): (path.read_bytes(), path.stat().st_mode)
+        for path in root.rglob("*")
+        if path.is_file() and path.name != MANIFEST_FILE
+    }
+
+
+def test_parallel_copy_reproduces_the_artifacts(tmp_path, logger):
+    entries = materialize(tmp_path, logger)
+
+    artifacts = Path(core.get_artifacts_dir())
+    files = tree(tmp_path)
+    assert set(files) == {entry.output_path for entry in entries}
+    for entry in entries:
+        if entry.is_template:
+            continue
+        source = artifacts / entry.rel_path
+        assert files[entry.output_path] == (
+            source.read_bytes(),
+            source.stat().st_mode,
+        ), entry.rel_path
+
+
+def test_parallel_and_bundled_copies_match_a_sequential_one(tmp_path, logger):
+    materialize(tmp_path / "sequential", logger, max_workers=1)
+    materialize(tmp_path / "parallel", logger, max_workers=8)
+    bundle_path = tmp_path / "artifacts.bundle"
+    pack_artifacts(core.get_artifacts_dir(), str(bundle_path))
+    materialize(tmp_path / "bundled", logger, bundle=ArtifactBundle(bundle_path))
+
+    baseline = tree(tmp_path / "sequential")
+    assert tree(tmp_path / "parallel") == baseline
+    assert tree(tmp_path / "bundled") == baseline
+
+
+class CountingResource:
+    """A bundle location that counts how often it is opened."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.opens = 0
+
+    def open(self, mode: str):
+        self.opens += 1
+        return self.path.open(mode)
+
+
+def test_bundle_is_opened_once_per_scaffold(tmp_path, logger):
+    bundle_path = tmp_path / "artifacts.bundle"
+    pack_artifacts(core.get_artifacts_dir(), str(bundle_path))
+    resource = CountingResource(bundle_path)
+    bundle = ArtifactBundle(resource)
+
+    requirements = core._artifact_requirements(None, bundle)
+    materialize(tmp_path / "first", logger, bundle=bundle)
+
+    assert resource.opens == 1
+    assert (
+        Path(requirements).read_bytes()
+        == (tmp_path / "first" / "requirements.txt").read_bytes()
+    )
+    materialize(tmp_path / "second", logger, bundle=bundle)
+    assert resource.opens == 2
+
+
+def test_bundle_keeps_executable_bits(tmp_path, logger):
+    artifacts = tmp_path / "artifacts"
+    (artifacts / "app").mkdir(parents=True)
+    script = artifacts / "run.py"
+    script.write_text("#!/usr/bin/env python\n")
+    script.chmod(0o755)
+    (artifacts / "app" / "views.py").write_text("views = []\n")
+    (artifacts / "app" / "views.py").chmod(0o640)
+    bundle_path = tmp_path / "artifacts.bundle"
+    pack_artifacts(str(artifacts), str(bundle_path))
+
+    materialize(tmp_path / "project", logger, bundle=ArtifactBundle(bundle_path))
+
+    project = tmp_path / "project"
+    assert (project / "run.py").stat().st_mode & 0o777 == 0o755
+    assert (project / "app" / "views.py").stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.parametrize(
+    ("supported", "attempts"),
+    [
+        ("reflink", ["reflink"]),
+        ("copy_file_range", ["reflink", "copy_file_range"]),
+        ("plain", ["reflink", "copy_file_range"]),
+    ],
+)
+def test_fast_copy_falls_back_until_a_method_works(
+    tmp_path, monkeypatch, supported, attempts
+):
+    data = os.urandom(3 * 1024 * 1024 + 17)  # Several copy chunks, ragged end
+    src, dst = tmp_path / "src.bin", tmp_path / "dst.bin"
+    src.write_bytes(data)
+    src.chmod(0o750)
+    tried = []
+    real_copy_file_range = getattr(os, "copy_file_range", None)
+
+    class FakeFcntl:
+        @staticmethod
+        def ioctl(dst_fd, request, src_fd):
+            tried.append("reflink")
+            if supported != "reflink":
+                raise OSError(errno.EOPNOTSUPP, "reflinks not supported")
+            os.write(dst_fd, os.pread(src_fd, os.fstat(src_fd).st_size, 0))
+
+    def copy_file_range(src_fd, dst_fd, count):
+        tried.append("copy_file_range")
+        if supported != "copy_file_range" or real_copy_file_range is None:
+            raise OSError(errno.EXDEV, "cross-device copy not supported")
+        return real_copy_file_range(src_fd, dst_fd, count)
+
+    monkeypatch.setattr(core, "fcntl", FakeFcntl)
+    monkeypatch.setattr(os, "copy_file_range", copy_file_range, raising=False)
+
+    assert core._fast_copy(str(src), str(dst), exclusive=True)
+
+    assert tried[: len(attempts)] == attempts
+    assert set(tried) == set(attempts)
+    assert dst.read_bytes() == data
+    assert dst.stat().st_mode & 0o777 == 0o750
+    assert not core._fast_copy(str(src), str(dst), exclusive=True)
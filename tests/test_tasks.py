@@ -0,0 +1,110 @@
+# tests/test_tasks.py
+import threading
+
+import pytest
+
+from flask_scaffolder.tasks import CANCELLED, FAILED, OK, TaskGraph
+
+
+class Recorder:
+    """Stub steps that log their start and end, optionally failing."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def task(self, name: str, fail: bool = False):
+        def run():
+            with self._lock:
+                self.events.append(f"start {name}")
+            if fail:
+                raise RuntimeError(f"{name} broke")
+            with self._lock:
+                self.events.append(f"end {name}")
+
+        return run
+
+    def started(self, name: str) -> bool:
+        return f"start {name}" in self.events
+
+
+def scaffold_graph(logger, recorder, fail=()):
+    """The shape scaffold_project builds."""
+    graph = TaskGraph(logger)
+    for name, deps in [
+        ("materialize", ()),
+        ("venv_create", ()),
+        ("pip_install", ("venv_create", "materialize")),
+        ("git_init", ()),
+        ("pre_commit_install", ("materialize", "pip_install", "git_init")),
+    ]:
+        graph.add(name, recorder.task(name, fail=name in fail), deps)
+    return graph
+
+
+def test_steps_start_only_after_their_dependencies(logger):
+    recorder = Recorder()
+
+    status = scaffold_graph(logger, recorder).run()
+
+    assert set(status.values()) == {OK}
+    events = recorder.events
+    for step, deps in [
+        ("pip_install", ("venv_create", "materialize")),
+        ("pre_commit_install", ("materialize", "pip_install", "git_init")),
+    ]:
+        for dep in deps:
+            assert events.index(f"end {dep}") < events.index(f"start {step}")
+
+
+def test_independent_steps_run_concurrently(logger):
+    # Run one after the other, neither step would get past the barrier
+    both_running = threading.Barrier(2, timeout=5)
+    graph = TaskGraph(logger)
+    graph.add("materialize", both_running.wait)
+    graph.add("venv_create", both_running.wait)
+
+    assert graph.run() == {"materialize": OK, "venv_create": OK}
+
+
+def test_failed_venv_create_cancels_its_dependents_only(logger, caplog):
+    recorder = Recorder()
+
+    status = scaffold_graph(logger, recorder, fail={"venv_create"}).run()
+
+    assert status == {
+        "materialize": OK,
+        "venv_create": FAILED,
+        "pip_install": CANCELLED,
+        "git_init": OK,
+        "pre_commit_install": CANCELLED,
+    }
+    assert not recorder.started("pip_install")
+    assert not recorder.started("pre_commit_install")
+    assert "Step venv_create failed: venv_create broke" in caplog.text
+    assert "Cancelled pip_install (needs failed step venv_create)" in caplog.text
+
+
+def test_cancellation_propagates_transitively(logger):
+    recorder = Recorder()
+    graph = TaskGraph(logger)
+    graph.add("a", recorder.task("a", fail=True))
+    graph.add("b", recorder.task("b"), ("a",))
+    graph.add("c", recorder.task("c"), ("b",))
+    graph.add("d", recorder.task("d"))
+
+    assert graph.run() == {"a": FAILED, "b": CANCELLED, "c": CANCELLED, "d": OK}
+    assert recorder.events == [
+        event for event in recorder.events if event.endswith(("a", "d"))
+    ]
+
+
+def test_unknown_dependency_is_rejected(logger):
+    graph = TaskGraph(logger)
+
+    with pytest.raises(ValueError, match="unknown"):
+        graph.add("pip_install", lambda: None, ("venv_create",))
+
+
+def test_empty_graph_runs(logger):
+    assert TaskGraph(logger).run() == {}
@@ -0,0 +1,145 @@
+# tests/test_upgrade.py
+import json
+import logging
+import os
+
+import pytest
+
+from flask_scaffolder.bundle import list_artifacts
+from flask_scaffolder.cache import file_digest
+from flask_scaffolder.core import ArtifactEntry, materialize_artifacts
+from flask_scaffolder.manifest import MANIFEST_FILE, is_unmodified, make_record
+
+
+@pytest.fixture
+def project(tmp_path, logger, caplog):
+    """Scaffolds app/views.py from a throwaway artifacts dir; call it again
+    after editing either side to re-run the upgrade."""
+    caplog.set_level(logging.INFO, logger=logger.name)
+    artifacts, target = tmp_path / "artifacts", tmp_path / "project"
+    (artifacts / "app").mkdir(parents=True)
+    (artifacts / "app" / "views.py").write_text("v1\n")
+
+    def scaffold() -> str:
+        caplog.clear()
+        entries = [
+            ArtifactEntry(path, *meta)
+            for path, meta in list_artifacts(str(artifacts)).items()
+        ]
+        materialize_artifacts(str(artifacts), entries, str(target), {}, logger)
+        return caplog.text
+
+    scaffold.artifact = artifacts / "app" / "views.py"
+    scaffold.file = target / "app" / "views.py"
+    scaffold.manifest = target / MANIFEST_FILE
+    return scaffold
+
+
+def recorded(project) -> dict:
+    return json.loads(project.manifest.read_text())["files"]
+
+
+def test_unchanged_file_is_left_alone(project):
+    project()
+    before = recorded(project)
+
+    log = project()
+
+    assert "Skipped (up to date)" in log
+    assert project.file.read_text() == "v1\n"
+    assert recorded(project) == before
+
+
+def test_locally_edited_file_survives_an_upstream_change(project):
+    project()
+    before = recorded(project)
+    project.file.write_text("mine\n")
+    project.artifact.write_text("v2\n")
+
+    log = project()
+
+    assert "Kept local changes" in log
+    assert project.file.read_text() == "mine\n"
+    assert recorded(project) == before
+
+
+def test_locally_edited_file_is_kept_when_upstream_is_unchanged(project):
+    project()
+    project.file.write_text("mine\n")
+
+    assert "Skipped (up to date)" in project()
+    assert project.file.read_text() == "mine\n"
+
+
+def test_upstream_change_updates_an_untouched_file(project):
+    project()
+    project.artifact.write_text("v2, longer\n")
+
+    log = project()
+
+    assert "Updated" in log
+    assert project.file.read_text() == "v2, longer\n"
+    assert recorded(project)["app/views.py"]["digest"] == file_digest(
+        str(project.artifact)
+    )
+
+
+def test_same_size_upstream_change_updates_an_untouched_file(project):
+    project()
+    project.artifact.write_text("v2\n")
+
+    assert "Updated" in project()
+    assert project.file.read_text() == "v2\n"
+
+
+@pytest.mark.parametrize("manifest", ["deleted", "entry removed"])
+def test_file_without_a_manifest_entry_is_never_overwritten(project, manifest):
+    project()
+    project.file.write_text("mine\n")
+    project.artifact.write_text("v2\n")
+    if manifest == "deleted":
+        project.manifest.unlink()
+    else:
+        data = json.loads(project.manifest.read_text())
+        del data["files"]["app/views.py"]
+        project.manifest.write_text(json.dumps(data))
+
+    log = project()
+
+    assert "Skipped (already exists)" in log
+    assert project.file.read_text() == "mine\n"
+    assert "app/views.py" not in recorded(project)
+
+
+def test_file_without_a_manifest_entry_is_adopted_if_it_matches(project):
+    project()
+    project.manifest.unlink()
+
+    project()
+
+    assert recorded(project)["app/views.py"]["digest"] == file_digest(str(project.file))
+
+
+def test_deleted_file_is_restored(project):
+    project()
+    project.file.unlink()
+
+    assert "Copied" in project()
+    assert project.file.read_text() == "v1\n"
+
+
+def test_is_unmodified_checks_size_then_mtime_then_content(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("abc\n")
+    record = make_record(str(path), file_digest(str(path)))
+
+    assert is_unmodified(str(path), os.stat(path), record)
+
+    os.utime(path, ns=(record["mtime_ns"] + 10**9,) * 2)  # Touched, same bytes
+    assert is_unmodified(str(path), os.stat(path), record)
+
+    path.write_text("xyz\n")  # Same size, new content
+    assert not is_unmodified(str(path), os.stat(path), record)
+
+    path.write_text("longer\n")
+    assert not is_unmodified(str(path), os.stat(path), record)